@@ -59,6 +59,7 @@ db = SQLAlchemy(
 migrate = Migrate()
 login_manager = LoginManager()
 socketio = SocketIO()
+cache = Cache()
 
 from .api import api as api_blueprint
 from .frontend import frontend as frontend_blueprint
@@ -76,6 +77,7 @@ def create_app():
     socketio.init_app(app,
         path = config.SOCKETIO_PATH, engineio_logger = config.SOCKETIO_ENGINEIO_LOGGER)
     login_manager.init_app(app)
+    cache.init_app(app)
     app.wsgi_app = ProxyFix(
         app.wsgi_app,
         x_for = config.FORWARDED_FOR,
@@ -23,7 +23,7 @@ from sqlalchemy import func, and_, or_
 from sqlalchemy.exc import OperationalError, UnsupportedCompilationError
 from .compat import insert
 
-from . import db, config, models, airvehicles, error, aio
+from . import db, config, models, airvehicles, inaccuracy, error, aio
 
 LOG = logging.getLogger("aireyes.aiotraces")
 LOG.setLevel( logging.DEBUG )
@@ -160,10 +160,10 @@ async def synchronise_flight_points(session, aircraft, flight_points, **kwargs):
     """
     try:
         LOG.debug(f"Synchronising {len(flight_points)} flight points for aircraft {aircraft.flight_name}...")
+        # Attempt to fix any inaccuracies in these flight points.
+        flight_points = inaccuracy.attempt_flight_points_correction(aircraft, flight_points)
         # Spin up an iteration of all flight points.
         for flight_point in flight_points:
-            # Attempt to fix any inaccuracies in this flight point.
-            flight_point = airvehicles.attempt_flight_point_correction(aircraft, flight_point)
             # Get the flight point's timestamp, via the UTC timezone.
             day = datetime.utcfromtimestamp(int(flight_point.timestamp)).date()
             # Construct an insert for the flight point.
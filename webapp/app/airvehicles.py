@@ -23,7 +23,7 @@ from sqlalchemy import func, and_, or_, asc, desc
 from sqlalchemy.exc import IntegrityError
 from marshmallow import Schema, fields, EXCLUDE, post_load, pre_load
 
-from . import db, config, models, error, calculations, utility, inaccuracy, viewmodel, decorators
+from . import db, cache, config, models, error, calculations, utility, inaccuracy, viewmodel, decorators
 
 LOG = logging.getLogger("aireyes.airvehicles")
 LOG.setLevel( logging.DEBUG )
@@ -243,6 +243,15 @@ class AirportSchema(Schema):
         return data
 
 
+# The key under which the rendered index, a summary of all monitored aircraft, is cached.
+INDEX_CACHE_KEY = "view/index"
+
+
+def invalidate_cached_index():
+    """Delete the cached index, such that the next request for it reflects the latest state of all monitored aircraft."""
+    cache.delete(INDEX_CACHE_KEY)
+
+
 @decorators.get_master()
 def get_monitored_aircraft(master, **kwargs):
     """
@@ -375,11 +384,11 @@ def synchronise_flight_points(aircraft, flight_points, **kwargs):
         # Populate this list only with points that did not already exist.
         new_flight_points = []
         LOG.debug(f"Synchronising {len(flight_points)} flight points for aircraft {aircraft.flight_name}...")
+        # Attempt to fix any inaccuracies in these flight points.
+        flight_points = inaccuracy.attempt_flight_points_correction(aircraft, flight_points)
         #with db.session.no_autoflush:
         # Spin up an iteration of all flight points.
         for flight_point in flight_points:
-            # Attempt to fix any inaccuracies in this flight point.
-            flight_point = inaccuracy.attempt_flight_point_correction(aircraft, flight_point)
             if db.session.query(models.FlightPoint).filter(models.FlightPoint.flight_point_hash == flight_point.flight_point_hash).first():
                 existed+=1
                 # Quick fix here, just to set those returned as 'synchronised points' as synchronised.
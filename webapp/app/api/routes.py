@@ -181,6 +181,10 @@ def aircraft():
                     flight = None
             # Commit to database.
             db.session.commit()
+            # Now that we've committed, the cached index no longer reflects this aircraft's activity. If flights were updated, neither do the cached flight lists.
+            airvehicles.invalidate_cached_index()
+            if config.SHOULD_SUBMIT_PARTIAL_FLIGHTS:
+                flights.invalidate_cached_flights(aircraft)
             # Now, if we should, submit a socket update for both this aircraft has a whole and for the flight we updated, if 'flight' isn't None.
             if config.SHOULD_SEND_SOCKETIO_UPDATES:
                 """
@@ -236,6 +240,8 @@ def report_aircraft_timeout(aircraft, **kwargs):
         aircraft_timeout_report = airvehicles.AircraftTimeoutReportSchema().load(request.json)
         # Attempt to determine why this happened.
         report_receipt = airvehicles.aircraft_timeout_reported(aircraft, aircraft_timeout_report)
+        # The cached index no longer reflects this aircraft's activity.
+        airvehicles.invalidate_cached_index()
         # Check determination. If this was a landing,; if it was, and we must send socketio updates, send an update to the aircraft.
         if report_receipt.determination == "landing" and config.SHOULD_SEND_SOCKETIO_UPDATES:
             """
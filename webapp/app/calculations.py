@@ -8,6 +8,7 @@ import re
 import json
 import time
 import logging
+import numpy
 import pyproj
 from datetime import datetime
 
@@ -40,6 +41,38 @@ def epsg_code_for(longitude, latitude, crs = None, **kwargs) -> int:
     return int(32700-round((45+latitude)/90,0)*100+round((183+longitude)/6,0))
 
 
+def epsg_codes_for(longitudes, latitudes, crs = None, **kwargs) -> numpy.ndarray:
+    """
+    A vectorised equivalent of epsg_code_for. Given arrays of longitudes and latitudes, locate the EPSG for each location. All locations are transformed
+    in a single call, and the EPSG for each is computed over the resulting arrays at once.
+
+    Arguments
+    ---------
+    :longitudes: An array of longitudes.
+    :latitudes: An array of latitudes.
+    :crs: Optional. The CRS through which the locations are projected. Required only if a transformer is not given.
+
+    Keyword arguments
+    -----------------
+    :transformer: A pyproj Transformer from the CRS to its geodetic CRS.
+
+    Returns
+    -------
+    An array of integers; the EPSG code for each location, in order.
+    """
+    transformer = kwargs.get("transformer", None)
+    # CRS only required if transformer is None.
+    if not transformer and not crs:
+        raise Exception("epsg_codes_for failed! Both crs and transformer were not given.")
+    elif not transformer:
+        # Get the CRS, through which these longs, lats are projected, and build a transformer from this CRS to the CRS' geodetic CRS.
+        crs = pyproj.crs.CRS.from_user_input(crs)
+        transformer = pyproj.Transformer.from_crs(crs, crs.geodetic_crs, always_xy = True)
+    # Now, transform all points to their geodetic equivalent.
+    longitudes, latitudes = transformer.transform(numpy.asarray(longitudes, dtype = numpy.float64), numpy.asarray(latitudes, dtype = numpy.float64))
+    return (32700-numpy.round((45+latitudes)/90)*100+numpy.round((183+longitudes)/6)).astype(numpy.int64)
+
+
 def total_flight_time_from(flight_points_manager, **kwargs) -> int:
     """
     Returns the number of minutes of flight time from the given flight points manager.
@@ -67,6 +100,23 @@ def total_flight_time_from(flight_points_manager, **kwargs) -> int:
         raise e
 
 
+def segment_distances_from(coordinates) -> numpy.ndarray:
+    """
+    Returns the planar distance between each consecutive pair of coordinates in the given array, in the units of the coordinates' CRS.
+    This is computed in a single vectorised pass, and is equivalent to the length of each segment in a LineString built from the same coordinates.
+
+    Arguments
+    ---------
+    :coordinates: A numpy array of shape (N, 2), containing projected XY coordinates.
+
+    Returns
+    -------
+    A numpy array of N-1 distances.
+    """
+    deltas = numpy.diff(coordinates, axis = 0)
+    return numpy.hypot(deltas[:, 0], deltas[:, 1])
+
+
 def total_distance_travelled_from(flight_points_manager, **kwargs) -> int:
     """
     Returns the number of meters travelled in total between all points in the given manager.
@@ -81,10 +131,10 @@ def total_distance_travelled_from(flight_points_manager, **kwargs) -> int:
     An integer; the total number of meters travelled.
     """
     try:
-        # From the flight points manager, get the flight path.
-        flight_path = flight_points_manager.flight_path
-        # Round and return the length of the flight path object.
-        return round(flight_path.length)
+        # From the flight points manager, get the flight path's coordinates.
+        flight_path_coordinates = flight_points_manager.flight_path_coordinates
+        # Sum the length of every segment along the flight path, round and return it.
+        return round(float(segment_distances_from(flight_path_coordinates).sum()))
     except ZeroDivisionError as zde:
         return 0
     except Exception as e:
@@ -94,7 +144,7 @@ def total_distance_travelled_from(flight_points_manager, **kwargs) -> int:
 def average_speed_from(flight_points_manager, **kwargs) -> int:
     """
     Returns the average speed, in knots, between all points in the given manager.
-    This is done by comprehending a list of all recorded speeds, filtering those that are None, then producing an average.
+    This is done by selecting all recorded speeds from the manager's ground speed column, excluding those that are missing, then producing an average.
 
     Arguments
     ---------
@@ -105,14 +155,13 @@ def average_speed_from(flight_points_manager, **kwargs) -> int:
     An integer; the total number of minutes in this flight.
     """
     try:
-        # Comprehend a list of all speeds from all points except those that are on the ground.
-        speeds_list = [ flight_point.ground_speed if not flight_point.is_on_ground else None for flight_point in flight_points_manager.flight_points ]
-        # Filter Nones.
-        speeds_list = list(filter(lambda speed: speed != None, speeds_list))
-        # Finally, create an average by summing all values and dividing result by number of speeds recorded.
-        speed = sum(speeds_list)/len(speeds_list)
-        # Return the rounded speed.
-        return round(speed)
+        # Select the speeds from all points except those that are on the ground, or do not have a speed.
+        ground_speeds = flight_points_manager.ground_speeds
+        speeds = ground_speeds[~flight_points_manager.on_ground & ~numpy.isnan(ground_speeds)]
+        if not speeds.size:
+            return 0
+        # Finally, create an average from all speeds recorded, round and return it.
+        return round(float(speeds.mean()))
     except ZeroDivisionError as zde:
         return 0
     except Exception as e:
@@ -122,7 +171,7 @@ def average_speed_from(flight_points_manager, **kwargs) -> int:
 def average_altitude_from(flight_points_manager, **kwargs) -> int:
     """
     Returns the average altitude, in feet, between all points in the given manager.
-    This is done by comprehending a list of all recorded altitudes, filtering those that are None, then producing an average.
+    This is done by selecting all recorded altitudes from the manager's altitude column, excluding those that are missing, then producing an average.
 
     Arguments
     ---------
@@ -133,15 +182,13 @@ def average_altitude_from(flight_points_manager, **kwargs) -> int:
     An integer; the total number of minutes in this flight.
     """
     try:
-        # Comprehend a list of all speeds from all points except those that are on the ground.
-        altitudes_list = [ flight_point.altitude if (not flight_point.is_on_ground or (flight_point.altitude and flight_point.altitude >= 0)) else None
-            for flight_point in flight_points_manager.flight_points ]
-        # Filter Nones.
-        altitudes_list = list(filter(lambda altitude: altitude != None, altitudes_list))
-        # Finally, create an average by summing all values and dividing result by number of altitudes recorded.
-        altitude = sum(altitudes_list)/len(altitudes_list)
-        # Return the rounded altitude.
-        return round(altitude)
+        # Select the altitudes from all points except those that do not have an altitude, or are on the ground without a positive altitude.
+        all_altitudes = flight_points_manager.altitudes
+        altitudes = all_altitudes[~numpy.isnan(all_altitudes) & (~flight_points_manager.on_ground | (all_altitudes > 0))]
+        if not altitudes.size:
+            return 0
+        # Finally, create an average from all altitudes recorded, round and return it.
+        return round(float(altitudes.mean()))
     except ZeroDivisionError as zde:
         return 0
     except Exception as e:
@@ -161,6 +208,10 @@ def estimate_total_fuel_used_by(aircraft, flight_points_manager, **kwargs) -> in
     :aircraft: The Aircraft to use for fuel consumption figures.
     :flight_points_manager: A flight points manager.
 
+    Keyword arguments
+    -----------------
+    :total_flight_time_minutes: If already calculated, the total flight time (minutes) for the manager; this will be used instead of recalculating it. Default is None.
+
     Raises
     ------
     MissingFuelFiguresError: The aircraft does not have any fuel consumption figures.
@@ -170,12 +221,15 @@ def estimate_total_fuel_used_by(aircraft, flight_points_manager, **kwargs) -> in
     An integer; the total number of minutes in this flight.
     """
     try:
+        total_flight_time_minutes = kwargs.get("total_flight_time_minutes", None)
+
         # Ensure aircraft has required data.
         if not aircraft.has_valid_fuel_data:
             LOG.error(f"Failed to estimate total fuel used by {aircraft}, this aircraft does not have fuel consumption figures.")
             raise error.MissingFuelFiguresError(aircraft)
-        # Get total flight time so far. Right now, we won't factor the aircraft speed, but it may pay to at some stage.
-        total_flight_time_minutes = total_flight_time_from(flight_points_manager)
+        # Get total flight time so far, unless we've been given it. Right now, we won't factor the aircraft speed, but it may pay to at some stage.
+        if total_flight_time_minutes is None:
+            total_flight_time_minutes = total_flight_time_from(flight_points_manager)
         # If 0 minutes, we will simply return 0 here.
         if total_flight_time_minutes == 0:
             return 0
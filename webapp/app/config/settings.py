@@ -54,6 +54,8 @@ class GeospatialConfig():
     ]
     # Add state codes here to disclude all others. Ex. 'VIC'
     USE_ONLY_STATES = []
+    # The maximum number of rows associating suburbs with their neighbours or EPSG codes to insert with a single statement.
+    SUBURB_ASSOCIATION_INSERT_BATCH_SIZE = 400
 
 
 class AircraftRealtimeConfig():
@@ -123,6 +125,10 @@ class BaseConfig(WorkerGeneralConfig, GeospatialConfig, AircraftRealtimeConfig,
 
     POSTGIS_ENABLED = True
     POSTGIS_MANAGEMENT = False
+    # When geolocating via PostGIS, how many flight points should be located by a single query?
+    POSTGIS_GEOLOCATION_BATCH_SIZE = 500
+    # When PostGIS is enabled, the maximum number of vertices in each part of a subdivided suburb geometry.
+    SUBURB_SUBDIVISION_MAX_VERTICES = 256
 
     SQLALCHEMY_SESSION_OPTS = {}
     SQLALCHEMY_ENGINE_OPTS = {}
@@ -163,6 +169,14 @@ class BaseConfig(WorkerGeneralConfig, GeospatialConfig, AircraftRealtimeConfig,
     PROJECT_NAME = "Aireyes"
     # How many flights should be displayed per page?
     PAGE_SIZE_FLIGHTS = 25
+    # Configuration for Flask-Caching. By default, a simple in-process cache is used.
+    CACHE_TYPE = "SimpleCache"
+    CACHE_DEFAULT_TIMEOUT = 60
+    # How long, in seconds, should the total number of flights be cached for? This is used for pagination.
+    FLIGHTS_COUNT_CACHE_TIMEOUT = 60
+    # How long, in seconds, should rendered frontend pages be cached for? Flight list pages are cached separately, per page.
+    FRONTEND_CACHE_TIMEOUT = 30
+    FLIGHTS_PAGE_CACHE_TIMEOUT = 15
 
     def __init__(self):
         self.make_dirs()
@@ -217,6 +231,8 @@ class TestConfig(BaseConfig):
     SUBURBS_DIR = os.path.join(IMPORTS_DIR, "test-suburbs")
     # Good middle ground.
     GLOBAL_REPORTING_TIMEZONE = "Etc/GMT"
+    # Disable caching for testing.
+    CACHE_TYPE = "NullCache"
 
     def make_dirs(self):
         super().make_dirs()
@@ -6,7 +6,7 @@ import logging
 from datetime import datetime
 
 from functools import wraps
-from flask import request, g, redirect, url_for, render_template
+from flask import request, g, redirect, url_for, render_template, make_response
 from flask_login import current_user, login_required
 from werkzeug.exceptions import Unauthorized
 
@@ -192,3 +192,20 @@ def get_airport(**kwargs):
             return f(**kwargs)
         return decorated_view
     return decorator
+
+
+def conditional_response():
+    """
+    Decorator that tags successful responses from the wrapped view with an ETag derived from the response body, and honours conditional requests against
+    it. If the client already holds the current version of the page, a 304 Not Modified will be returned instead of the body.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_view(*args, **kwargs):
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200:
+                response.add_etag()
+                response.make_conditional(request)
+            return response
+        return decorated_view
+    return decorator
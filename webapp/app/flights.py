@@ -7,22 +7,100 @@ import uuid
 import logging
 import time as time_
 import json
+import bisect
 from datetime import datetime, date, timedelta, time, timezone
 
+import numpy
 import shapely
 from shapely import geometry, ops
 
-from sqlalchemy import func, and_, or_, desc, asc
+from sqlalchemy import func, and_, or_, desc, asc, distinct
+from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
 from marshmallow import Schema, fields, EXCLUDE, post_load
 
 from .compat import insert
 
-from . import db, config, models, error, traces, calculations, inaccuracy, geospatial
+from . import db, cache, config, models, error, traces, calculations, inaccuracy, geospatial
 
 LOG = logging.getLogger("aireyes.flights")
 LOG.setLevel( logging.DEBUG )
 
+# Tags identifying the type of each item within a timeline; these are set as the KIND attribute on each timeline item's type, and allow dispatching without
+# isinstance checks. Start and end descriptors are intentionally the two lowest values.
+KIND_START_DESCRIPTOR = 0
+KIND_END_DESCRIPTOR = 1
+KIND_CHANGE_DESCRIPTOR = 2
+KIND_FLIGHT_POINT = models.FlightPoint.KIND
+
+# Altitude thresholds, interned from configuration at import time since these are read on every evaluation of a partial flight's takeoff and landing
+# state, as well as for every change descriptor. Should configuration be changed at runtime, call refresh_config() to pick up the new values.
+MAX_ALTITUDE_START = config.MAX_ALTITUDE_MID_AIR_DISAPPEAR_START_NEW_FLIGHT
+MAX_ALTITUDE_END = config.MAX_ALTITUDE_MID_AIR_DISAPPEAR_END_FLIGHT
+
+
+def refresh_config():
+    """Re-read configuration values interned by this module. This should be called after changing any of the relevant configuration at runtime."""
+    global MAX_ALTITUDE_START, MAX_ALTITUDE_END
+    MAX_ALTITUDE_START = config.MAX_ALTITUDE_MID_AIR_DISAPPEAR_START_NEW_FLIGHT
+    MAX_ALTITUDE_END = config.MAX_ALTITUDE_MID_AIR_DISAPPEAR_END_FLIGHT
+
+
+def evaluate_new_flight_criteria(point1_grounded, point2_grounded, time_differences, point1_altitudes, point2_altitudes):
+    """
+    Evaluate the basic new flight criteria for any number of changes between two consecutive flight points at once. This is used by DailyFlightsView, and must
+    always agree with FlightPointChangeDescriptor.constitutes_new_flight; which evaluates the same criteria, against the same thresholds, for a single change.
+
+    Arguments
+    ---------
+    :point1_grounded: An array of booleans; whether the first point in each change is on the ground.
+    :point2_grounded: An array of booleans; whether the second point in each change is on the ground.
+    :time_differences: An array of the number of seconds between the first and second point in each change.
+    :point1_altitudes: An array of the altitude of the first point in each change. None or NaN is treated as 0.
+    :point2_altitudes: An array of the altitude of the second point in each change. None or NaN is treated as 0.
+
+    Returns
+    -------
+    A tuple of two arrays of booleans;
+        Whether each change constitutes a new flight.
+        Whether each change requires inaccuracy solvency.
+    """
+    point1_grounded = numpy.asarray(point1_grounded, dtype = bool)
+    point2_grounded = numpy.asarray(point2_grounded, dtype = bool)
+    point1_airborne, point2_airborne = ~point1_grounded, ~point2_grounded
+    point1_altitudes = numpy.nan_to_num(numpy.asarray(point1_altitudes, dtype = numpy.float64), nan = 0)
+    point2_altitudes = numpy.nan_to_num(numpy.asarray(point2_altitudes, dtype = numpy.float64), nan = 0)
+    time_differences = numpy.asarray(time_differences, dtype = numpy.float64)
+    constitutes_new_flight = \
+        (point1_grounded & point2_grounded & (time_differences > config.TIME_DIFFERENCE_NEW_FLIGHT_GROUNDED)) | \
+        (point1_grounded & point2_airborne & (time_differences > config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_START) \
+            & (point2_altitudes < MAX_ALTITUDE_START)) | \
+        (point1_airborne & point2_grounded & (time_differences > config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_END) \
+            & (point1_altitudes < MAX_ALTITUDE_START))
+    # Request further investigation if neither point is grounded, and the time difference is TIME_DIFFERENCE_INACCURACY_CHECK_REQUIRED.
+    requires_solvency = point1_airborne & point2_airborne & (time_differences >= config.TIME_DIFFERENCE_INACCURACY_CHECK_REQUIRED)
+    return constitutes_new_flight, requires_solvency
+
+
+def sort_flight_points(flight_points) -> list:
+    """
+    Return the given flight points as a list, in ascending order by timestamp. Flight points are most often given already in order, so this is first
+    checked in a single pass, and the list is only sorted if required.
+
+    Arguments
+    ---------
+    :flight_points: An iterable of flight points.
+
+    Returns
+    -------
+    A list of flight points, ascending by timestamp.
+    """
+    flight_points = list(flight_points)
+    if all(flight_points[idx].timestamp <= flight_points[idx+1].timestamp for idx in range(len(flight_points)-1)):
+        return flight_points
+    flight_points.sort(key = lambda flight_point: flight_point.timestamp)
+    return flight_points
+
 
 def query_flights(**kwargs):
     """
@@ -42,7 +120,12 @@ def query_flights(**kwargs):
         """TODO 0x07: Where we join flight points to this query; this may not be necessary, and, in fact, it may even signficantly slow this down. Take a look at setting a proper first and last
         column within the Flight table, instead of this."""
         # We'll begin by building a subquery that queries from the flights table, for each flight and the timestamp at which the flight starts.
+        # Each flight is displayed alongside its aircraft and airports, so these are loaded for all flights in the results at once.
         flights_q = db.session.query(models.Flight)\
+            .options(
+                selectinload(models.Flight.aircraft),
+                selectinload(models.Flight.takeoff_airport),
+                selectinload(models.Flight.landing_airport))\
             .join(models.Flight.flight_points_)
         # Attach ordering.
         if newest_first:
@@ -81,7 +164,11 @@ def query_flights_from(aircraft, **kwargs):
         """TODO 0x07: Where we join flight points to this query; this may not be necessary, and, in fact, it may even signficantly slow this down. Take a look at setting a proper first and last
         column within the Flight table, instead of this."""
         # We'll begin by building a subquery that queries from the flights table, for each flight and the timestamp at which the flight starts.
+        # Each flight is displayed alongside its airports, so these are loaded for all flights in the results at once. All flights share the given aircraft.
         flights_q = db.session.query(models.Flight)\
+            .options(
+                selectinload(models.Flight.takeoff_airport),
+                selectinload(models.Flight.landing_airport))\
             .filter(models.Flight.aircraft_icao == aircraft.icao)\
             .join(models.Flight.flight_points_)
         # Attach ordering.
@@ -99,6 +186,76 @@ def query_flights_from(aircraft, **kwargs):
         raise e
 
 
+def count_flights(aircraft = None, **kwargs) -> int:
+    """
+    Count the number of flights that would be returned by query_flights, or query_flights_from if an aircraft is given. This is cached for a short period,
+    configured by FLIGHTS_COUNT_CACHE_TIMEOUT, such that pagination does not require a count on every page load.
+
+    Arguments
+    ---------
+    :aircraft: Optionally, the aircraft from which to count flights. By default, all flights are counted.
+
+    Returns
+    -------
+    An integer; the number of flights.
+    """
+    cache_key = _flights_total_cache_key(aircraft)
+    num_flights = cache.get(cache_key)
+    if num_flights is None:
+        # As with our flight queries, only flights with flight points are counted.
+        num_flights_q = db.session.query(func.count(distinct(models.Flight.flight_id)))\
+            .join(models.Flight.flight_points_)
+        if aircraft:
+            num_flights_q = num_flights_q\
+                .filter(models.Flight.aircraft_icao == aircraft.icao)
+        num_flights = num_flights_q.scalar()
+        cache.set(cache_key, num_flights, timeout = config.FLIGHTS_COUNT_CACHE_TIMEOUT)
+    return num_flights
+
+
+def _flights_total_cache_key(aircraft = None) -> str:
+    return "flights:total" if not aircraft else f"flights:total:{aircraft.icao}"
+
+
+def flights_page_cache_key(page, aircraft_icao = None) -> str:
+    """
+    Return the key under which a rendered page of flights is cached. This is a page of all flights, or of only the flights for the given aircraft ICAO.
+
+    Arguments
+    ---------
+    :page: The page number.
+    :aircraft_icao: Optionally, the ICAO of the aircraft from which the flights on this page are displayed. By default, the page displays all flights.
+
+    Returns
+    -------
+    The cache key.
+    """
+    if not aircraft_icao:
+        return f"view/flights/{page}"
+    return f"view/aircraft/{aircraft_icao}/flights/{page}"
+
+
+def invalidate_cached_flights(aircraft):
+    """
+    Delete the cached total number of flights, and all cached pages of flights, both for all flights and for the given aircraft's flights. This should be called
+    after flights are created or updated for the aircraft, and those changes are committed.
+
+    Arguments
+    ---------
+    :aircraft: The aircraft whose flights have changed.
+    """
+    cache_keys = []
+    for aircraft_ in [None, aircraft]:
+        total_cache_key = _flights_total_cache_key(aircraft_)
+        # Every page of flights is rendered alongside the total, which is cached for at least as long as the page, so the cached total bounds the pages that may be
+        # cached. One further page is included, in case it was cached while empty.
+        num_flights = cache.get(total_cache_key) or 0
+        num_pages = -(-num_flights // config.PAGE_SIZE_FLIGHTS)+1
+        cache_keys.append(total_cache_key)
+        cache_keys.extend([ flights_page_cache_key(page, aircraft_.icao if aircraft_ else None) for page in range(1, num_pages+1) ])
+    cache.delete_many(*cache_keys)
+
+
 class FlightPartialSubmissionReceipt():
     """A data model for passing back a receipt for the submission of a sequence of flight points."""
     def __init__(self, _aircraft_present_day, _flight, _was_created, **kwargs):
@@ -172,7 +329,8 @@ def flight_partial_submitted(aircraft, day, flight_points, **kwargs) -> FlightPa
         day_flight_points = aircraft_present_day.all_flight_points
         LOG.debug(f"Located {len(day_flight_points)} on {aircraft_present_day} to construct our submission environment from.")
         # Now, create a daily flights view for these points, this should also include our provided points above.
-        daily_flights_view = DailyFlightsView.from_args(aircraft, day, day_flight_points)
+        daily_flights_view = DailyFlightsView.from_args(aircraft, day, day_flight_points,
+            pre_sorted = True)
         LOG.debug(f"Within {aircraft_present_day}, we located {daily_flights_view.num_partial_flights} partial flights.")
         # Now, we will get a partial flight that this sequence of points is destined for.
         located_partial_flight = daily_flights_view.attempt_find_suitable_partial_for(flight_points)
@@ -289,7 +447,8 @@ def revise_flight_data_for(aircraft, day, **kwargs) -> FlightDataRevisionReceipt
             raise error.NoFlightPointsError(aircraft, days = [day])
         LOG.debug(f"Located {len(day_flight_points)} on {aircraft_present_day} to construct our revision environment from.")
         # Now, create a daily flights view for these points.
-        daily_flights_view = DailyFlightsView.from_args(aircraft, day, day_flight_points)
+        daily_flights_view = DailyFlightsView.from_args(aircraft, day, day_flight_points,
+            pre_sorted = True)
         LOG.debug(f"Within {aircraft_present_day}, we located {daily_flights_view.num_partial_flights} partial flights.")
         # Now assimilate flights for this daily flights view.
         resulting_flights_with_was_created, created, updated, error_ = assimilate_partial_flights_from_view(aircraft, aircraft_present_day, daily_flights_view)
@@ -343,6 +502,9 @@ class AircraftDayIterator():
         Initialise an Aircraft/Day iterator given an aircraft and a starting day. This will iterate the day in the requested direction, and on
         each next, return the newly adjusted day. If there are no aircraft present day records for the requested combo, iteration will cease.
 
+        Aircraft present days, and their flight points, are prefetched in bulk, a window of days at a time, rather than queried for each day. Flight
+        points for a day yielded by this iterator should therefore be retrieved with get_flight_points.
+
         Arguments
         ---------
         :_aircraft: The aircraft to locate AircraftPresentDays for.
@@ -352,13 +514,19 @@ class AircraftDayIterator():
         Keyword arguments
         -----------------
         :max_it: Maximum number of times to iterate before giving up.
+        :prefetch_window: The number of days to prefetch at once. Default is 7.
         """
         max_it = kwargs.get("max_it", 100)
+        prefetch_window = kwargs.get("prefetch_window", 7)
 
         self.aircraft = _aircraft
         self.start_day = _start_day
         self._direction = _direction
         self.max_it = max_it
+        self.prefetch_window = prefetch_window
+        # Prefetched aircraft present days, and lists of flight points, both keyed by their Date.
+        self._prefetched_aircraft_days = {}
+        self._prefetched_flight_points = {}
 
     def __iter__(self):
         self.current_it = 0
@@ -369,10 +537,14 @@ class AircraftDayIterator():
         # If current it hit, stop iteration.
         if self.current_it >= self.max_it:
             raise StopIteration
-        # Depending on towards past, either subtract or add a timedelta with a single day to our current day.
-        self.current_day = self.current_day-timedelta(days = 1) if self._direction==AircraftDayIterator.BACKWARD else self.current_day+timedelta(days = 1)
+        # If we have not yet prefetched the next day, prefetch a window of days beginning from it.
+        next_day = self._step(self.current_day)
+        if not next_day in self._prefetched_aircraft_days:
+            self.prefetch(self.prefetch_window)
+        # Move our current day to the next day.
+        self.current_day = next_day
         # Attempt to locate an aircraft present day for this combination.
-        aircraft_day = models.AircraftPresentDay.find(self.aircraft.icao, self.current_day)
+        aircraft_day = self._prefetched_aircraft_days.get(self.current_day, None)
         if not aircraft_day:
             # If none found, stop iteration.
             raise StopIteration
@@ -380,12 +552,71 @@ class AircraftDayIterator():
         # Otherwise, return the aircraft/day.
         return aircraft_day
 
+    def _step(self, day, num_days = 1):
+        """Return the given day, moved the given number of days in this iterator's direction."""
+        return day-timedelta(days = num_days) if self._direction==AircraftDayIterator.BACKWARD else day+timedelta(days = num_days)
+
+    def prefetch(self, window = 7):
+        """
+        Prefetch, in bulk, all aircraft present days for this iterator's aircraft in the given number of days following the current day (in this iterator's direction.)
+        Then, prefetch all flight points across the consecutive run of those days that the aircraft is present for, as iteration will cease on the first missing day.
+        Days for which the aircraft was not present are recorded as None.
+
+        Arguments
+        ---------
+        :window: The number of days to prefetch.
+
+        Returns
+        -------
+        A dictionary, keyed by Date, of lists of flight points on that day, in ascending order.
+        """
+        window_days = [self._step(self.current_day, num_days) for num_days in range(1, window+1)]
+        first_day, last_day = min(window_days), max(window_days)
+        aircraft_days = dict((aircraft_day.day_day, aircraft_day,) for aircraft_day in db.session.query(models.AircraftPresentDay)\
+            .filter(models.AircraftPresentDay.aircraft_icao == self.aircraft.icao)\
+            .filter(models.AircraftPresentDay.day_day >= first_day)\
+            .filter(models.AircraftPresentDay.day_day <= last_day)\
+            .all())
+        # Determine the consecutive run of days on which the aircraft is present, beginning from the day following the current day.
+        present_days = []
+        for day in window_days:
+            self._prefetched_aircraft_days[day] = aircraft_days.get(day, None)
+            if not self._prefetched_aircraft_days[day]:
+                break
+            present_days.append(day)
+        flight_points = dict((day, [],) for day in present_days)
+        if present_days:
+            # Now, query all flight points across these days at once.
+            flight_points_q = db.session.query(models.FlightPoint)\
+                .filter(models.FlightPoint.aircraft_icao == self.aircraft.icao)\
+                .filter(models.FlightPoint.day_day >= min(present_days))\
+                .filter(models.FlightPoint.day_day <= max(present_days))\
+                .order_by(asc(models.FlightPoint.timestamp))
+            for flight_point in flight_points_q.all():
+                flight_points[flight_point.day_day].append(flight_point)
+        self._prefetched_flight_points.update(flight_points)
+        return flight_points
+
+    def get_flight_points(self, aircraft_day):
+        """
+        Return all flight points, in ascending order, on the given aircraft present day. These will come from those prefetched if possible, otherwise they will
+        be queried from the aircraft present day itself.
+        """
+        flight_points = self._prefetched_flight_points.get(aircraft_day.day_day, None)
+        if flight_points is None:
+            return aircraft_day.all_flight_points
+        return flight_points
+
 
 class FlightPointStartDescriptor():
     """
     A descriptor type that wraps a single FlightPoint. This is intended to indicate a commencement of flight data, as opposed to indicating the commencement
     of a new flight.
     """
+    KIND = KIND_START_DESCRIPTOR
+    # Many descriptors are created for each timeline, so we'll avoid an instance dictionary for each.
+    __slots__ = ("flight_point",)
+
     @property
     def time_iso(self):
         return datetime.utcfromtimestamp(int(self.flight_point.timestamp)).time().isoformat()
@@ -413,6 +644,9 @@ class FlightPointChangeDescriptor():
     that can be used to determine whether a flight has commenced or finished. But is also useful for flagging inaccuracies in flight data that
     require further investigation.
     """
+    KIND = KIND_CHANGE_DESCRIPTOR
+    __slots__ = ("flight_point1", "flight_point2", "time_difference_seconds", "_constitutes_new_flight",)
+
     @property
     def point1_time_iso(self):
         return datetime.utcfromtimestamp(int(self.flight_point1.timestamp)).time().isoformat()
@@ -443,21 +677,31 @@ class FlightPointChangeDescriptor():
         This property will only handle very basic new flight cases; those in which it is highly plausible given some basic data points such as altitude and time
         difference, that the aircraft has performed a landing as its last action, and a takeoff as its most recent. If cases are extreme anomalies, an exception;
         FlightChangeInaccuracySolvencyRequired will be raised, to indicate further investigation is required.
+
+        The result is cached on this descriptor once determined, or if this descriptor has already been evaluated in bulk by its DailyFlightsView, that result is
+        returned directly. Requests for inaccuracy solvency are never cached, and will be raised on every access.
         """
-        if self.both_grounded and self.time_difference_seconds > config.TIME_DIFFERENCE_NEW_FLIGHT_GROUNDED:
+        if self._constitutes_new_flight is None:
+            self._constitutes_new_flight = self._evaluate_constitutes_new_flight()
+        return self._constitutes_new_flight
+
+    def _evaluate_constitutes_new_flight(self):
+        """Evaluate, without caching, the criteria for constitutes_new_flight. These must always agree with evaluate_new_flight_criteria."""
+        point1_grounded, point2_grounded = self.point1_grounded, self.point2_grounded
+        if point1_grounded and point2_grounded and self.time_difference_seconds > config.TIME_DIFFERENCE_NEW_FLIGHT_GROUNDED:
             # New flight detected, criteria: both points grounded.
             return True
-        elif self.point1_grounded and not self.point2_grounded and self.time_difference_seconds > config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_START \
-            and (self.flight_point2.altitude or 0) < config.MAX_ALTITUDE_MID_AIR_DISAPPEAR_START_NEW_FLIGHT:
+        elif point1_grounded and not point2_grounded and self.time_difference_seconds > config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_START \
+            and (self.flight_point2.altitude or 0) < MAX_ALTITUDE_START:
             # New flight detected, started midair. Criteria: point #1 on ground, point #2 airborne, time between point #1 and point #2 exceeds TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_START,
             # altitude of point #2 is less than MAX_ALTITUDE_MID_AIR_START_NEW_FLIGHT.
             return True
-        elif not self.point1_grounded and self.point2_grounded and self.time_difference_seconds > config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_END \
-            and (self.flight_point1.altitude or 0) < config.MAX_ALTITUDE_MID_AIR_DISAPPEAR_START_NEW_FLIGHT:
+        elif not point1_grounded and point2_grounded and self.time_difference_seconds > config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_END \
+            and (self.flight_point1.altitude or 0) < MAX_ALTITUDE_START:
             # New flight detected, ended midair. Criteria: point #1 airborne, point #2 on ground, time between point #1 and point #2 exceeds TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_END,
             # altitude of point #1 is less than MAX_ALTITUDE_MID_AIR_DISAPPEAR_START_NEW_FLIGHT.
             return True
-        elif not self.point1_grounded and not self.point2_grounded and self.time_difference_seconds >= config.TIME_DIFFERENCE_INACCURACY_CHECK_REQUIRED:
+        elif not point1_grounded and not point2_grounded and self.time_difference_seconds >= config.TIME_DIFFERENCE_INACCURACY_CHECK_REQUIRED:
             # Request further investigation if neither point is grounded, and the time difference is TIME_DIFFERENCE_INACCURACY_CHECK_REQUIRED.
             LOG.warning(f"Flight change descriptor {self} applies for anomalous behaviour. Requesting inaccuracy solvency...")
             raise error.FlightChangeInaccuracySolvencyRequired(self)
@@ -471,6 +715,8 @@ class FlightPointChangeDescriptor():
         self.flight_point2 = _flight_point2
         # Flight point change attributes.
         self.time_difference_seconds = _flight_point2.timestamp-_flight_point1.timestamp
+        # The result of constitutes_new_flight, once it has been determined. None otherwise.
+        self._constitutes_new_flight = None
 
 
 class FlightPointEndDescriptor():
@@ -478,6 +724,9 @@ class FlightPointEndDescriptor():
     A descriptor type that wraps a single FlightPoint. This is intended to indicate the end of flight data, as opposed to indicating the end
     of a flight.
     """
+    KIND = KIND_END_DESCRIPTOR
+    __slots__ = ("flight_point",)
+
     @property
     def time_iso(self):
         return datetime.utcfromtimestamp(int(self.flight_point.timestamp)).time().isoformat()
@@ -515,46 +764,88 @@ class FlightPointsManager():
         Returns a Shapely LineString geometry containing all points in this flight points manager. A common CRS must be set.
         There must also be at least two positional flight points in this manager. Failing this, the flight points path will be considered not a proper path.
         """
+        return geometry.LineString(self.flight_path_coordinates)
+
+    @property
+    def flight_path_coordinates(self):
+        """
+        Returns a numpy array of shape (N, 2) containing the XY coordinates of all positional flight points in this manager, in order. This carries the same
+        requirements as flight_path; a common CRS must be set, and there must be at least two positional flight points.
+        """
         if not self.crs:
             LOG.error(f"Could not get flight path from flight points manager {self}, no CRS is set! Raising an InvalidCRSError.")
             raise error.InvalidCRSError("no-crs-set", flight_points = self.flight_points)
-        if self.num_positional_flight_points < config.MINIMUM_POSITIONAL_FLIGHT_PATH_POINTS:
-            LOG.error(f"Could not get flight path from flight points manager {self}, this flight path has {self.num_positional_flight_points} whereas the minimum required for a valid path is {config.MINIMUM_POSITIONAL_FLIGHT_PATH_POINTS}.")
+        positional_coordinates = self.positional_coordinates
+        if len(positional_coordinates) < config.MINIMUM_POSITIONAL_FLIGHT_PATH_POINTS:
+            LOG.error(f"Could not get flight path from flight points manager {self}, this flight path has {len(positional_coordinates)} whereas the minimum required for a valid path is {config.MINIMUM_POSITIONAL_FLIGHT_PATH_POINTS}.")
             raise error.NoFlightPathError()
-        return geometry.LineString([flight_point.position for flight_point in self.positional_flight_points])
+        return positional_coordinates
+
+    @property
+    def positional_coordinates(self):
+        """
+        Returns a numpy array of shape (N, 2) containing the XY coordinates of all positional flight points in this manager. This is extracted just once for
+        each set of flight points, as reading a position requires parsing that flight point's geometry.
+        """
+        if self._positional_coordinates is None:
+            self._positional_coordinates = numpy.array(
+                [flight_point.position.coords[0] for flight_point in self.positional_flight_points], dtype = numpy.float64).reshape(-1, 2)
+        return self._positional_coordinates
+
+    @property
+    def timestamps(self):
+        """Returns a numpy array of the timestamp for every flight point in this manager."""
+        return self._get_flight_point_arrays()[0]
+
+    @property
+    def altitudes(self):
+        """Returns a numpy array of the altitude for every flight point in this manager. Those without an altitude are NaN."""
+        return self._get_flight_point_arrays()[1]
+
+    @property
+    def ground_speeds(self):
+        """Returns a numpy array of the ground speed for every flight point in this manager. Those without a ground speed are NaN."""
+        return self._get_flight_point_arrays()[2]
+
+    @property
+    def on_ground(self):
+        """Returns a boolean numpy array indicating, for every flight point in this manager, whether that point is on the ground."""
+        return self._get_flight_point_arrays()[3]
 
     @property
     def first_point(self):
         """Return first flight point or None if there are no points."""
-        if not self.num_flight_points:
+        if not self._flight_points:
             return None
         return self._flight_points[0]
 
     @property
     def positional_first_point(self):
         """Return the first flight point, with a valid position, or none if there are no points."""
-        if not self.num_positional_flight_points:
+        positional_flight_points = self.positional_flight_points
+        if not positional_flight_points:
             return None
-        return self.positional_flight_points[0]
+        return positional_flight_points[0]
 
     @property
     def last_point(self):
         """Return last flight point or None if there are no points."""
-        if not self.num_flight_points:
+        if not self._flight_points:
             return None
-        return self._flight_points[self.num_flight_points-1]
+        return self._flight_points[-1]
 
     @property
     def positional_last_point(self):
         """Return the last flight point, with a valid position or None if there are no points."""
-        if not self.num_positional_flight_points:
+        positional_flight_points = self.positional_flight_points
+        if not positional_flight_points:
             return None
-        return self.positional_flight_points[self.num_positional_flight_points-1]
+        return positional_flight_points[-1]
 
     @property
     def positional_flight_points(self):
         """Returns all flight points, but without those that do not have positional data."""
-        return list(filter(lambda flight_point: flight_point.is_position_valid, self._flight_points))
+        return [ flight_point for flight_point in self._flight_points if flight_point.is_position_valid ]
 
     @property
     def flight_points(self):
@@ -563,6 +854,7 @@ class FlightPointsManager():
     @flight_points.setter
     def flight_points(self, value):
         self._flight_points = value
+        self._clear_flight_point_arrays()
 
     @property
     def num_flight_points(self):
@@ -577,6 +869,7 @@ class FlightPointsManager():
 
     def __setitem__(self, index, value):
         self._flight_points[index] = value
+        self._clear_flight_point_arrays()
 
     def __delitem__(self, key):
         """Not allowed to delete flight points."""
@@ -587,8 +880,37 @@ class FlightPointsManager():
 
     def set_flight_points(self, flight_points):
         self._flight_points = flight_points
+        self._clear_flight_point_arrays()
         self._find_common_crs()
 
+    def _clear_flight_point_arrays(self):
+        """Discard all column arrays materialised from the current flight points; they will be rebuilt on next access."""
+        self._positional_coordinates = None
+        self._flight_point_arrays = None
+
+    def _get_flight_point_arrays(self):
+        """
+        Materialise, just once for each set of flight points, column arrays for the attributes most used in statistical calculations. This allows those
+        calculations to operate on contiguous arrays rather than reading each attribute from each flight point.
+
+        Returns
+        -------
+        A tuple of four numpy arrays; timestamps, altitudes, ground speeds and whether each point is on the ground.
+        """
+        if self._flight_point_arrays is None:
+            num_flight_points = len(self._flight_points)
+            timestamps = numpy.empty(num_flight_points, dtype = numpy.float64)
+            altitudes = numpy.empty(num_flight_points, dtype = numpy.float64)
+            ground_speeds = numpy.empty(num_flight_points, dtype = numpy.float64)
+            on_ground = numpy.empty(num_flight_points, dtype = bool)
+            for idx, flight_point in enumerate(self._flight_points):
+                timestamps[idx] = flight_point.timestamp
+                altitudes[idx] = numpy.nan if flight_point.altitude == None else flight_point.altitude
+                ground_speeds[idx] = numpy.nan if flight_point.ground_speed == None else flight_point.ground_speed
+                on_ground[idx] = bool(flight_point.is_on_ground)
+            self._flight_point_arrays = (timestamps, altitudes, ground_speeds, on_ground,)
+        return self._flight_point_arrays
+
     def derive_manager(self, **kwargs):
         """
         Instantiate and return a flight points manager constructed from this manager's inner flight points, but with certain filtering
@@ -703,15 +1025,15 @@ class FlightAssimilator(FlightPointsManager):
     """
     @property
     def first_partial_flight(self):
-        if not len(self.partial_flights):
+        if not self.partial_flights:
             return None
         return self.partial_flights[0]
 
     @property
     def last_partial_flight(self):
-        if not len(self.partial_flights):
+        if not self.partial_flights:
             return None
-        return self.partial_flights[len(self.partial_flights)-1]
+        return self.partial_flights[-1]
 
     @property
     def most_recent_point(self):
@@ -789,44 +1111,41 @@ class FlightAssimilator(FlightPointsManager):
             A flight model,
             A boolean indicating whether or not the Flight was created.
         """
-        try:
-            if self._dominant_flight:
-                # We have a single associated flight. We shall now simply ensure all flight points in this collection is associated with the same flight.
-                LOG.debug(f"Located dominant flight {self._dominant_flight} for flight assimilation {self}. Ensuring all points are attached to this flight...")
-                num_attached = 0
-                num_already_attached = 0
-                for flight_point in self.flight_points:
-                    if flight_point.flight != self._dominant_flight:
-                        num_attached+=1
-                        flight_point.flight = self._dominant_flight
-                    else:
-                        num_already_attached+=1
-                LOG.debug(f"Finished assimilating points for {self} to {self._dominant_flight}. We newly attached {num_attached} points, whilst there were {num_already_attached} points already attached.")
-                # Set statistics.
-                self._copy_statistics_to(self._dominant_flight)
-                # Return dominant flight.
-                db.session.flush()
-                return self._dominant_flight, False
-            """TODO: we can add some more checks in here, perhaps an intersection check of sorts?"""
-            # Otherwise, its time to create a new Flight.
-            LOG.debug(f"Could not find any dominant flights for {self}, we will create a new one.")
-            new_flight = models.Flight(
-                flight_hash = self._new_flight_hash(),
-                aircraft = self.aircraft
-            )
-            # Add to session & flush.
-            db.session.add(new_flight)
-            db.session.flush()
-            # Now, set flight points.
-            new_flight.set_flight_points(self.flight_points)
+        if self._dominant_flight:
+            # We have a single associated flight. We shall now simply ensure all flight points in this collection is associated with the same flight.
+            LOG.debug(f"Located dominant flight {self._dominant_flight} for flight assimilation {self}. Ensuring all points are attached to this flight...")
+            num_attached = 0
+            num_already_attached = 0
+            for flight_point in self.flight_points:
+                if flight_point.flight != self._dominant_flight:
+                    num_attached+=1
+                    flight_point.flight = self._dominant_flight
+                else:
+                    num_already_attached+=1
+            LOG.debug(f"Finished assimilating points for {self} to {self._dominant_flight}. We newly attached {num_attached} points, whilst there were {num_already_attached} points already attached.")
             # Set statistics.
-            self._copy_statistics_to(new_flight)
-            # Finally return this new flight.
+            self._copy_statistics_to(self._dominant_flight)
+            # Return dominant flight.
             db.session.flush()
-            LOG.debug(f"New flight {new_flight} has been successfully generated from {self}.")
-            return new_flight, True
-        except Exception as e:
-            raise e
+            return self._dominant_flight, False
+        """TODO: we can add some more checks in here, perhaps an intersection check of sorts?"""
+        # Otherwise, its time to create a new Flight.
+        LOG.debug(f"Could not find any dominant flights for {self}, we will create a new one.")
+        new_flight = models.Flight(
+            flight_hash = self._new_flight_hash(),
+            aircraft = self.aircraft
+        )
+        # Add to session & flush.
+        db.session.add(new_flight)
+        db.session.flush()
+        # Now, set flight points.
+        new_flight.set_flight_points(self.flight_points)
+        # Set statistics.
+        self._copy_statistics_to(new_flight)
+        # Finally return this new flight.
+        db.session.flush()
+        LOG.debug(f"New flight {new_flight} has been successfully generated from {self}.")
+        return new_flight, True
 
     def _new_flight_hash(self):
         """
@@ -840,32 +1159,29 @@ class FlightAssimilator(FlightPointsManager):
         Handling the moving of our calculated flight statistics from this assimilator instance to whatever Flight model we
         have decided will represent the assimilator.
         """
-        try:
-            LOG.debug(f"Copying statistics from {self} to flight {flight}...")
-            # Copy realtime statistics.
-            flight.is_on_ground = self._is_on_ground
-
-            # Copy calculated statistics.
-            if self._takeoff_airport:
-                flight.takeoff_airport = self._takeoff_airport
-            if self._landing_airport:
-                flight.landing_airport = self._landing_airport
-            flight.distance_travelled = self._distance_travelled
-            flight.fuel_used = self._fuel_used
-            flight.average_speed = self._average_speed
-            flight.average_altitude = self._average_altitude
-            flight.flight_time_total = self._flight_time_total
-            flight.flight_time_prohibited = self._flight_time_prohibited
-            flight.total_co2_emissions = self._total_co2_emissions
-
-            # Copy over has departure/arrival details. If the aircraft has taken off again, arrival details will yet again report False.
-            flight.has_departure_details = self._has_departure_details
-            flight.has_arrival_details = self._has_arrival_details
-
-            # Copy over whether this flight is (so far) just taxiing.
-            flight.taxi_only = self._taxi_only
-        except Exception as e:
-            raise e
+        LOG.debug(f"Copying statistics from {self} to flight {flight}...")
+        # Copy realtime statistics.
+        flight.is_on_ground = self._is_on_ground
+
+        # Copy calculated statistics.
+        if self._takeoff_airport:
+            flight.takeoff_airport = self._takeoff_airport
+        if self._landing_airport:
+            flight.landing_airport = self._landing_airport
+        flight.distance_travelled = self._distance_travelled
+        flight.fuel_used = self._fuel_used
+        flight.average_speed = self._average_speed
+        flight.average_altitude = self._average_altitude
+        flight.flight_time_total = self._flight_time_total
+        flight.flight_time_prohibited = self._flight_time_prohibited
+        flight.total_co2_emissions = self._total_co2_emissions
+
+        # Copy over has departure/arrival details. If the aircraft has taken off again, arrival details will yet again report False.
+        flight.has_departure_details = self._has_departure_details
+        flight.has_arrival_details = self._has_arrival_details
+
+        # Copy over whether this flight is (so far) just taxiing.
+        flight.taxi_only = self._taxi_only
 
     def _extract_flight_points(self):
         """
@@ -877,28 +1193,26 @@ class FlightAssimilator(FlightPointsManager):
         NoPartialFlightsError: No flight partials were given to this assimilator.
         NoFlightPointsError: No flight points were located in any of the partials given to this assimilator.
         """
-        try:
-            if not len(self.partial_flights):
-                LOG.error(f"Failed to make timeline for flight assimilator; no flight partials given.")
-                raise error.NoPartialFlightsError(self)
-            # We will first create a single huge list of all flight points involved in this flight, by collapsing all entries in partial flights.
-            all_flight_points = []
-            for partial_flight in self.partial_flights:
-                # Ensure this is a partial flight.
-                if not isinstance(partial_flight, PartialFlight):
-                    LOG.error(f"Object given as a PartialFlight to FlightAssimilator is instead of type {type(partial_flight)}")
-                    raise TypeError("not-partial-flight")
-                # Next, extend all flight points by this partial flight's flight points.
-                """TODO: perhaps there's a more efficient way to do this?"""
-                all_flight_points.extend(partial_flight.flight_points)
-            # If there are no flight points at all in all_flight_points, raise an error reporting this.
-            if len(all_flight_points) == 0:
-                LOG.error(f"No flight points found at all in {self}!")
-                raise error.NoFlightPointsError(self.aircraft, partial_flights = self.partial_flights)
-            # Now, sort flight points by timestamp, and set this class' flight points. This will also locate the common CRS.
-            self.set_flight_points(tuple(sorted(all_flight_points, key = lambda flight_point: flight_point.timestamp)))
-        except Exception as e:
-            raise e
+        if not len(self.partial_flights):
+            LOG.error(f"Failed to make timeline for flight assimilator; no flight partials given.")
+            raise error.NoPartialFlightsError(self)
+        # We will first create a single huge list of all flight points involved in this flight, by collapsing all entries in partial flights.
+        all_flight_points = []
+        for partial_flight in self.partial_flights:
+            # Ensure this is a partial flight.
+            if not isinstance(partial_flight, PartialFlight):
+                LOG.error(f"Object given as a PartialFlight to FlightAssimilator is instead of type {type(partial_flight)}")
+                raise TypeError("not-partial-flight")
+            # Next, extend all flight points by this partial flight's flight points.
+            """TODO: perhaps there's a more efficient way to do this?"""
+            all_flight_points.extend(partial_flight.flight_points)
+        # If there are no flight points at all in all_flight_points, raise an error reporting this.
+        if len(all_flight_points) == 0:
+            LOG.error(f"No flight points found at all in {self}!")
+            raise error.NoFlightPointsError(self.aircraft, partial_flights = self.partial_flights)
+        # Now, sort flight points by timestamp in place, and set this class' flight points as a single tuple. This will also locate the common CRS.
+        all_flight_points.sort(key = lambda flight_point: flight_point.timestamp)
+        self.set_flight_points(tuple(all_flight_points))
 
     def _make_timeline(self):
         """
@@ -906,43 +1220,26 @@ class FlightAssimilator(FlightPointsManager):
         a single Flight instance. The timeline is structured the same however, beginning with a start descriptor, ending with an end descriptor and peppered with
         change descriptors between every other point.
         """
-        try:
-            if not self.num_flight_points:
-                LOG.error(f"Failed to make timeline for flight assimilator; no flight points given.")
-                raise error.NoPartialFlightsError(self)
-            # Now, we will process all flight points into another list, which is to be our timeline tuple. This is where we'll inject our descriptors.
-            timeline_list = []
-            for flight_point_idx, flight_point in enumerate(self.flight_points):
-                # If any of these flight points report being off the ground, set _has_been_airborne to True.
-                if not flight_point.is_on_ground:
-                    self._has_been_airborne = True
-                # Attempt to locate the previous point, current point and next point.
-                previous_point, current_point, next_point = self.calculate_surrounding_points(flight_point_idx)
-                if not previous_point:
-                    # If our previous point is None, this is a start point. So instantiate a flight point start descriptor, for the first point.
-                    # Also if next point is not None, instantiate a flight point change descriptor between the current point and next point.
-                    start_descriptor = self._start_descriptor = FlightPointStartDescriptor(current_point)
-                    timeline_list.append(start_descriptor)
-                    timeline_list.append(current_point)
-                    if next_point:
-                        change_descriptor = FlightPointChangeDescriptor(current_point, next_point)
-                        timeline_list.append(change_descriptor)
-                elif current_point and next_point:
-                    # If our current point is not None, and our next point is not None, we will now create a FlightPointChangeDescriptor from current
-                    # to next point, then add the point, then the change descriptor.
-                    change_descriptor = FlightPointChangeDescriptor(current_point, next_point)
-                    timeline_list.append(current_point)
-                    timeline_list.append(change_descriptor)
-                elif current_point and not next_point:
-                    # If we have our current point, but our next point is None, this is our final point. We will create a FlightPointEndDescriptor for
-                    # the current point, then add the point, then the descriptor.
-                    end_descriptor = self._end_descriptor = FlightPointEndDescriptor(current_point)
-                    timeline_list.append(current_point)
-                    timeline_list.append(end_descriptor)
-            # Now, we've constructed our timeline, tuple-ise it and set to instance attribute.
-            self._timeline = tuple(timeline_list)
-        except Exception as e:
-            raise e
+        if not self.num_flight_points:
+            LOG.error(f"Failed to make timeline for flight assimilator; no flight points given.")
+            raise error.NoPartialFlightsError(self)
+        flight_points = self.flight_points
+        # If any of these flight points report being off the ground, set _has_been_airborne to True.
+        if not self.on_ground.all():
+            self._has_been_airborne = True
+        # Now, we will process all flight points into another list, which is to be our timeline tuple. This is where we'll inject our descriptors. The timeline begins
+        # with a start descriptor for the first point, followed by the first point, then each change descriptor is interleaved with the flight point it leads to.
+        first_point = flight_points[0]
+        start_descriptor = self._start_descriptor = FlightPointStartDescriptor(first_point)
+        timeline_list = [start_descriptor, first_point]
+        for current_point, next_point in zip(flight_points, flight_points[1:]):
+            timeline_list.extend((FlightPointChangeDescriptor(current_point, next_point), next_point))
+        # If there was more than one point, our final point is followed by a flight point end descriptor.
+        if len(flight_points) > 1:
+            end_descriptor = self._end_descriptor = FlightPointEndDescriptor(flight_points[-1])
+            timeline_list.append(end_descriptor)
+        # Now, we've constructed our timeline, tuple-ise it and set to instance attribute.
+        self._timeline = tuple(timeline_list)
 
     def _enumerate_associated_flights(self):
         """
@@ -953,89 +1250,88 @@ class FlightAssimilator(FlightPointsManager):
         ------
         MultiplePotentialFlightsFoundError: Multiple flights have been found among the flight points. This is indicative of a mismatch in deterministic logic.
         """
-        try:
-            associated_flights = []
-            for flight_point in self.flight_points:
-                if flight_point.flight and not flight_point.flight in associated_flights:
-                    associated_flights.append(flight_point.flight)
-            # If more than 1 associated flight, raise an error.
-            if len(associated_flights) > 1:
-                LOG.error(f"Failed to assimilate {self}, multiple associated flights ({len(associated_flights)}) have been discovered. The maximum is 1.")
-                raise error.MultiplePotentialFlightsFoundError(self)
-            elif not len(associated_flights):
-                # No potential associated flights found. Dominant flight is None.
-                self._dominant_flight = None
-            else:
-                # Dominant flight is the first entry.
-                self._dominant_flight = associated_flights[0]
-        except Exception as e:
-            raise e
+        associated_flights = []
+        for flight_point in self.flight_points:
+            if flight_point.flight and not flight_point.flight in associated_flights:
+                associated_flights.append(flight_point.flight)
+        # If more than 1 associated flight, raise an error.
+        if len(associated_flights) > 1:
+            LOG.error(f"Failed to assimilate {self}, multiple associated flights ({len(associated_flights)}) have been discovered. The maximum is 1.")
+            raise error.MultiplePotentialFlightsFoundError(self)
+        elif not len(associated_flights):
+            # No potential associated flights found. Dominant flight is None.
+            self._dominant_flight = None
+        else:
+            # Dominant flight is the first entry.
+            self._dominant_flight = associated_flights[0]
 
     def _calculate_flight_statistics(self):
         """
         Perform all required calculations for this flight.
         This data will, upon flight assimilation/creation, be set in the resulting Flight model.
         """
+        # Calculate total distance travelled.
         try:
-            # Calculate total distance travelled.
-            try:
-                self._distance_travelled = calculations.total_distance_travelled_from(self)
-            except error.InvalidCRSError as ice:
-                # No CRS detected among any flight point. Check the number of positional flight points, this could be the reason for failure.
-                if self.num_positional_flight_points > 0:
-                    # There are multiple positional flight points. It makes no sense as to why this error occurred, we can now raise another InvalidCRSError.
-                    LOG.error(f"Failed to calculate distance travelled for {self} as a result of a lack of CRS. We will re-raise this error.")
-                    raise ice
-                # Otherwise, no issues; the integrity of all flight points in this flight so far are insufficient.
-                LOG.warning(f"Skipped calculating distance travelled for {self}, as the integrity of these flight points are not sufficient; the aircraft's position is not being located.")
-                # Flag this for further work at a later date.
-                """ TODO """
-                traces.handle_flight_point_integrity()
-                self._distance_travelled = None
-            except error.NoFlightPathError as nfpe:
-                # All we can do is wait.
-                LOG.warning(f"Could not get flight path from {self}, this manager does not yet have at least two points.")
-                self._distance_travelled = None
-            # Next, get total flight time.
-            self._flight_time_total = calculations.total_flight_time_from(self)
-            # Next, get total flight time in prohibited hours. We'll do this by deriving a manager with only points within our prohibited hours, then getting total flight time for that.
-            timezone_gmt10 = timezone(timedelta(hours = 10))
-            # Now, derive the manager with just our prohibited points.
-            prohibited_points_manager = self.derive_manager(
-                within_hours_range = (
-                    time(hour = 20, minute = 0, second = 0, tzinfo = timezone_gmt10),
-                    time(hour = 7, minute = 0, second = 0, tzinfo = timezone_gmt10),
-                )
+            self._distance_travelled = calculations.total_distance_travelled_from(self)
+        except error.InvalidCRSError as ice:
+            # No CRS detected among any flight point. Check the number of positional flight points, this could be the reason for failure.
+            if self.num_positional_flight_points > 0:
+                # There are multiple positional flight points. It makes no sense as to why this error occurred, we can now raise another InvalidCRSError.
+                LOG.error(f"Failed to calculate distance travelled for {self} as a result of a lack of CRS. We will re-raise this error.")
+                raise ice
+            # Otherwise, no issues; the integrity of all flight points in this flight so far are insufficient.
+            LOG.warning(f"Skipped calculating distance travelled for {self}, as the integrity of these flight points are not sufficient; the aircraft's position is not being located.")
+            # Flag this for further work at a later date.
+            """ TODO """
+            traces.handle_flight_point_integrity()
+            self._distance_travelled = None
+        except error.NoFlightPathError as nfpe:
+            # All we can do is wait.
+            LOG.warning(f"Could not get flight path from {self}, this manager does not yet have at least two points.")
+            self._distance_travelled = None
+        # Next, get total flight time.
+        self._flight_time_total = calculations.total_flight_time_from(self)
+        # Next, get total flight time in prohibited hours. We'll do this by deriving a manager with only points within our prohibited hours, then getting total flight time for that.
+        timezone_gmt10 = timezone(timedelta(hours = 10))
+        # Now, derive the manager with just our prohibited points.
+        prohibited_points_manager = self.derive_manager(
+            within_hours_range = (
+                time(hour = 20, minute = 0, second = 0, tzinfo = timezone_gmt10),
+                time(hour = 7, minute = 0, second = 0, tzinfo = timezone_gmt10),
             )
-            # Locate airports.
-            try:
-                self._locate_airports()
-            except error.FlightPointsIntegrityError as fpie:
-                """ TODO: """
-                traces.handle_flight_point_integrity()
-            except Exception as e:
-                LOG.warning(e, exc_info = True)
-            # Use this to get our flight time prohibited.
-            self._flight_time_prohibited = calculations.total_flight_time_from(prohibited_points_manager)
-            # Calculate average speed.
-            self._average_speed = calculations.average_speed_from(self)
-            # Calculate average altitude.
-            self._average_altitude = calculations.average_altitude_from(self)
-            # Calculate total estimated fuel used.
-            try:
-                self._fuel_used = calculations.estimate_total_fuel_used_by(self.aircraft, self)
-            except error.MissingFuelFiguresError as mffe:
-                # This aircraft does not have fuel figures set. We will report this.
-                traces.handle_missing_fuel_figures(mffe)
-                self._fuel_used = None
-            # Does our first partial begin with a takeoff? If so, we have departure details.
-            self._has_departure_details = self.first_partial_flight.started_with_takeoff
-            # Does our last partial end with a landing? If so, we have departure details.
-            self._has_arrival_details = self.last_partial_flight.ended_with_landing
-            # Now, attempt to calculate co2 emissions data.
-            self._calculate_emissions_statistics()
+        )
+        # Locate airports.
+        try:
+            self._locate_airports()
+        except error.FlightPointsIntegrityError as fpie:
+            """ TODO: """
+            traces.handle_flight_point_integrity()
         except Exception as e:
-            raise e
+            LOG.warning(e, exc_info = True)
+        # Use this to get our flight time prohibited.
+        self._flight_time_prohibited = calculations.total_flight_time_from(prohibited_points_manager)
+        # Calculate average speed. Only airborne points contribute to the average speed, so if this flight has not yet been airborne (taxi only), skip the
+        # calculation entirely; this in turn causes CO2 emissions calculation to be skipped, as there's no speed to work with.
+        if self._has_been_airborne:
+            self._average_speed = calculations.average_speed_from(self)
+        else:
+            self._average_speed = 0
+        # Calculate average altitude.
+        self._average_altitude = calculations.average_altitude_from(self)
+        # Calculate total estimated fuel used.
+        try:
+            self._fuel_used = calculations.estimate_total_fuel_used_by(self.aircraft, self,
+                total_flight_time_minutes = self._flight_time_total)
+        except error.MissingFuelFiguresError as mffe:
+            # This aircraft does not have fuel figures set. We will report this.
+            traces.handle_missing_fuel_figures(mffe)
+            self._fuel_used = None
+        # Does our first partial begin with a takeoff? If so, we have departure details.
+        self._has_departure_details = self.first_partial_flight.started_with_takeoff
+        # Does our last partial end with a landing? If so, we have departure details.
+        self._has_arrival_details = self.last_partial_flight.ended_with_landing
+        # Now, attempt to calculate co2 emissions data.
+        self._calculate_emissions_statistics()
 
     def _locate_airports(self):
         """
@@ -1093,10 +1389,11 @@ class FlightAssimilator(FlightPointsManager):
                 except error.NoAirportFound as naf:
                     # No airport found, simply set takeoff airport to None for now.
                     self._takeoff_airport = None
-                except error.NoAirportsLoaded as nal:
-                    raise nal
                 except error.FlightDataRevisionRequired as fdrr:
                     traces.handle_flight_data_revision(fdrr)
+                except error.NoAirportsLoaded:
+                    # If there are no airports at all, allow this to be handled by our outermost handler.
+                    raise
                 except Exception as e:
                     LOG.error(e, exc_info = True)
                     self._takeoff_airport = None
@@ -1122,13 +1419,14 @@ class FlightAssimilator(FlightPointsManager):
                     """
                     traces.handle_flight_point_integrity()
                     #raise error.FlightPointIntegrityError(self.last_point, "locate-takeoff-airport", "Position is None!")
-                except error.NoAirportsLoaded as nal:
-                    raise nal
                 except error.NoAirportFound as naf:
                     # No airport found, simply set landing airport to None for now.
                     self._landing_airport = None
                 except error.FlightDataRevisionRequired as fdrr:
                     traces.handle_flight_data_revision(fdrr)
+                except error.NoAirportsLoaded:
+                    # If there are no airports at all, allow this to be handled by our outermost handler.
+                    raise
                 except Exception as e:
                     LOG.error(e, exc_info = True)
                     self._landing_airport = None
@@ -1138,52 +1436,44 @@ class FlightAssimilator(FlightPointsManager):
                 self._taxi_only = True
         except error.NoAirportsLoaded as nal:
             LOG.error(f"Failed to determine either takeoff or landing airport for {self}, there are no airports in the database!")
-        except Exception as e:
-            raise e
 
     def _determine_realtime_statistics(self):
         """
         Determine all realtime statistics; this is usually based on the very latest point, and how that point relates to other
         points in the flight so far, or how that point relates to time/environment etc.
         """
-        try:
-            # Get most recent point.
-            most_recent_point = self.most_recent_point
-            # Only continue with a valid point.
-            if most_recent_point:
-                LOG.debug(f"Updating realtime statistics for {self}")
-                # Is in ground is simply equal to whether the end descriptor reports us as on the ground.
-                self._is_on_ground = self._end_descriptor.is_on_ground
-            else:
-                LOG.warning(f"Did not update realtime statistics for {self}, most recent point is None!")
-        except Exception as e:
-            raise e
+        # Get most recent point.
+        most_recent_point = self.most_recent_point
+        # Only continue with a valid point.
+        if most_recent_point:
+            LOG.debug(f"Updating realtime statistics for {self}")
+            # Is in ground is simply equal to whether the end descriptor reports us as on the ground.
+            self._is_on_ground = self._end_descriptor.is_on_ground
+        else:
+            LOG.warning(f"Did not update realtime statistics for {self}, most recent point is None!")
 
     def _calculate_emissions_statistics(self):
         """
         Perform calculations on the data already given to determine some co2 data.
         """
-        try:
-            # We will calculate all co2 related information. For this, we require the following data points to be given and valid:
-            # distance travelled, average speed, fuel used and finally, valid fuel data on the given aircraft. If any of these are not satisfied, do not continue.
-            if not self._distance_travelled or not self._average_speed or not self._fuel_used or not self.aircraft.has_valid_fuel_data:
-                LOG.warning(f"Skipped calculating CO2 emissions for {self}, one or more required data points is not valid or set.")
-                return
-            # Otherwise, we need to convert the given values into the appropriate format.
-            # The first, distance travelled, we required the number of kilometers.
-            distance_travelled = self._distance_travelled / 1000
-            # The second, average speed, we require from knots to km/h.
-            average_speed = self._average_speed * 1.852
-            # Finally, we require the amount of fuel used in tonnes, not gallons.
-            fuel_used = self._fuel_used * 0.031491395793499
-            # We are ready to get our co2 in kg per hour (in total.)
-            co2_emission_total_per_hour = calculations.calculate_co2_emissions_per_hour(distance_travelled, average_speed, self.aircraft.fuel_passenger_load, fuel_used, self.aircraft.fuel_co2_per_gram)
-            # Now, get the number of hours this flight flew for.
-            num_hours_flown = self._flight_time_total / 60
-            # This is the total amount of co2 emitted by this vehicle.
-            self._total_co2_emissions = num_hours_flown * co2_emission_total_per_hour
-        except Exception as e:
-            raise e
+        # We will calculate all co2 related information. For this, we require the following data points to be given and valid:
+        # distance travelled, average speed, fuel used and finally, valid fuel data on the given aircraft. If any of these are not satisfied, do not continue.
+        if not self._distance_travelled or not self._average_speed or not self._fuel_used or not self.aircraft.has_valid_fuel_data:
+            LOG.warning(f"Skipped calculating CO2 emissions for {self}, one or more required data points is not valid or set.")
+            return
+        # Otherwise, we need to convert the given values into the appropriate format.
+        # The first, distance travelled, we required the number of kilometers.
+        distance_travelled = self._distance_travelled / 1000
+        # The second, average speed, we require from knots to km/h.
+        average_speed = self._average_speed * 1.852
+        # Finally, we require the amount of fuel used in tonnes, not gallons.
+        fuel_used = self._fuel_used * 0.031491395793499
+        # We are ready to get our co2 in kg per hour (in total.)
+        co2_emission_total_per_hour = calculations.calculate_co2_emissions_per_hour(distance_travelled, average_speed, self.aircraft.fuel_passenger_load, fuel_used, self.aircraft.fuel_co2_per_gram)
+        # Now, get the number of hours this flight flew for.
+        num_hours_flown = self._flight_time_total / 60
+        # This is the total amount of co2 emitted by this vehicle.
+        self._total_co2_emissions = num_hours_flown * co2_emission_total_per_hour
 
     @classmethod
     def from_args(cls, aircraft, partial_flights, **kwargs):
@@ -1267,7 +1557,7 @@ class PartialFlight(FlightPointsManager):
         """Returns a boolean indicating whether or not this partial flight has been determined as beginning in a take off."""
         if self._start_descriptor.is_on_ground:
             return True
-        elif (self._start_descriptor.altitude or 0) < config.MAX_ALTITUDE_MID_AIR_DISAPPEAR_START_NEW_FLIGHT:
+        elif (self._start_descriptor.altitude or 0) < MAX_ALTITUDE_START:
             return True
         elif self._started_with_takeoff_override:
             return True
@@ -1278,7 +1568,7 @@ class PartialFlight(FlightPointsManager):
         """Returns a boolean indicating whether or not this partial flight has been determined as ending in a landing."""
         if self._end_descriptor.is_on_ground:
             return True
-        elif (self._end_descriptor.altitude or 0) < config.MAX_ALTITUDE_MID_AIR_DISAPPEAR_END_FLIGHT:
+        elif (self._end_descriptor.altitude or 0) < MAX_ALTITUDE_END:
             return True
         elif self._ended_with_landing_override:
             return True
@@ -1321,19 +1611,19 @@ class PartialFlight(FlightPointsManager):
         self._start_descriptor = None
         self._end_descriptor = None
 
-        self._extract_flight_points()
         # We will extract the very first and very last items from this subsection; remember these can be either FlightPoints or descriptors.
         self._start_descriptor = _timeline_subsection[0]
-        self._end_descriptor = _timeline_subsection[len(_timeline_subsection)-1]
+        self._end_descriptor = _timeline_subsection[-1]
         # Ensure types of start and end are correct.
-        assert isinstance(self._start_descriptor, FlightPointStartDescriptor)
-        assert isinstance(self._end_descriptor, FlightPointEndDescriptor)
+        assert self._start_descriptor.KIND == KIND_START_DESCRIPTOR
+        assert self._end_descriptor.KIND == KIND_END_DESCRIPTOR
+        self._extract_flight_points()
 
     def _extract_flight_points(self):
-        # Filter our inner timeline to return just flight points.
-        flight_points_it = filter(lambda timeline_item: isinstance(timeline_item, models.FlightPoint), self._timeline_subsection)
+        # Filter the interior of our inner timeline to return just flight points; the first and last items are always our start and end descriptors.
+        flight_points_it = (timeline_item for timeline_item in self._timeline_subsection[1:-1] if timeline_item.KIND == KIND_FLIGHT_POINT)
         # Now, return this list sorted by the timestamps ascending.
-        self.set_flight_points(list(sorted(flight_points_it, key = lambda flight_point: flight_point.timestamp)))
+        self.set_flight_points(sort_flight_points(flight_points_it))
 
     def collect_partials_until_takeoff(self, **kwargs):
         """
@@ -1365,8 +1655,10 @@ class PartialFlight(FlightPointsManager):
         past_partials = []
         try:
             # Otherwise, iterate aircraft/days in a backwards fashion, creating a daily flights view from this aircraft day.
-            for aircraft_day in iter(AircraftDayIterator(self.aircraft, self.day, AircraftDayIterator.BACKWARD)):
-                daily_flights_view = DailyFlightsView.from_args(self.aircraft, aircraft_day.day_day, aircraft_day.all_flight_points)
+            aircraft_day_iterator = AircraftDayIterator(self.aircraft, self.day, AircraftDayIterator.BACKWARD)
+            for aircraft_day in aircraft_day_iterator:
+                daily_flights_view = DailyFlightsView.from_args(self.aircraft, aircraft_day.day_day, aircraft_day_iterator.get_flight_points(aircraft_day),
+                    pre_sorted = True)
                 # Is the last partial flight None? Not enough info yet.
                 previous_partial_flight = daily_flights_view.last_partial_flight
                 if not previous_partial_flight:
@@ -1441,8 +1733,10 @@ class PartialFlight(FlightPointsManager):
         future_partials = []
         try:
             # Otherwise, iterate aircraft/days in a forwards fashion, creating a daily flights view from this aircraft day.
-            for aircraft_day in iter(AircraftDayIterator(self.aircraft, self.day, AircraftDayIterator.FORWARD)):
-                daily_flights_view = DailyFlightsView.from_args(self.aircraft, aircraft_day.day_day, aircraft_day.all_flight_points)
+            aircraft_day_iterator = AircraftDayIterator(self.aircraft, self.day, AircraftDayIterator.FORWARD)
+            for aircraft_day in aircraft_day_iterator:
+                daily_flights_view = DailyFlightsView.from_args(self.aircraft, aircraft_day.day_day, aircraft_day_iterator.get_flight_points(aircraft_day),
+                    pre_sorted = True)
                 # Is the first partial flight None? Not enough info yet.
                 next_partial_flight = daily_flights_view.first_partial_flight
                 if not next_partial_flight:
@@ -1499,15 +1793,15 @@ class DailyFlightsView(FlightPointsManager):
     """
     @property
     def first_partial_flight(self):
-        if not len(self.partial_flights):
+        if not self.partial_flights:
             return None
         return self.partial_flights[0]
 
     @property
     def last_partial_flight(self):
-        if not len(self.partial_flights):
+        if not self.partial_flights:
             return None
-        return self.partial_flights[len(self.partial_flights)-1]
+        return self.partial_flights[-1]
 
     @property
     def timeline(self):
@@ -1519,7 +1813,7 @@ class DailyFlightsView(FlightPointsManager):
 
     @property
     def num_partial_flights(self):
-        return len(self.partial_flights)
+        return self._num_partial_flights
 
     @property
     def aircraft_id(self):
@@ -1538,16 +1832,31 @@ class DailyFlightsView(FlightPointsManager):
         :_aircraft: An instance of Aircraft.
         :_day: A Date instance.
         :_flight_points: A list of all flight points by this aircraft, on this day.
+
+        Keyword arguments
+        -----------------
+        :pre_sorted: True if the given flight points are known to already be in ascending order by timestamp, such as when queried in that order. Default is False.
         """
+        pre_sorted = kwargs.get("pre_sorted", False)
+
         self.aircraft = _aircraft
         self.day = _day
         # Sort all flight points in ascending order by their timestamps. This should have been done prior, but this is also a failsafe.
-        self.set_flight_points(sorted(_flight_points, key = lambda flight_point: flight_point.timestamp))
+        if pre_sorted:
+            self.set_flight_points(list(_flight_points))
+        else:
+            self.set_flight_points(sort_flight_points(_flight_points))
 
         # All flight points in this factory instance, but converted to a timeline state.
         self._timeline = ()
+        # The change descriptors within the timeline, in order, and the indices of those that may constitute a new flight; set when the timeline is made.
+        self._change_descriptors = ()
+        self._new_flight_candidates = ()
         # A tuple container for all constructed partial flights; these should inherently be in chronological order.
         self._partial_flights = ()
+        self._num_partial_flights = 0
+        # The start timestamp of each partial flight, in the same order, for locating partials by timestamp.
+        self._partial_flight_starts = []
 
     def make_partial_flights(self, **kwargs):
         """
@@ -1556,58 +1865,84 @@ class DailyFlightsView(FlightPointsManager):
         partial flight. FlightPointChangeDescriptors will only be added to the current partial flight if they do not constitute a new flight. FlightPointEndDescriptors will
         always be added to the current partial flight.
         """
+        # If there is no timeline at all, there are no partial flights to make.
+        if not self._timeline:
+            LOG.debug("Skipped making partial flights for %s on %s - there is no timeline.", self.aircraft_id, self.day_iso)
+            self._partial_flights = ()
+            self._num_partial_flights = 0
+            self._partial_flight_starts = []
+            return
         # List to hold all partial flight points in creation.
         partial_flights_list = []
         # Now a list to hold all contents of the current partial flight being constructed.
         current_partial_flight = []
-        # Begin our iteration.
-        for timeline_item in self._timeline:
-            if isinstance(timeline_item, FlightPointStartDescriptor) or isinstance(timeline_item, FlightPointEndDescriptor):
-                # We encounter either of these, append to partial flight and continue.
-                current_partial_flight.append(timeline_item)
+        timeline = self._timeline
+        # The timeline index at which the current partial flight's next contents begin.
+        segment_start_idx = 0
+        # Only the change descriptors that were evaluated as constituting a new flight, or that require inaccuracy solvency, can divide the timeline. First, determine
+        # which of these candidates actually constitute a new flight, collecting those that require inaccuracy solvency such that they can be investigated together.
+        constitutes_new_flight = {}
+        requires_solvency = []
+        for change_descriptor_idx in self._new_flight_candidates:
+            try:
+                constitutes_new_flight[change_descriptor_idx] = self._change_descriptors[change_descriptor_idx].constitutes_new_flight
+            except error.FlightChangeInaccuracySolvencyRequired as fcisr:
+                requires_solvency.append(change_descriptor_idx)
+        if len(requires_solvency):
+            """TODO: flight inaccuracy solvency requested. Execute this here, the return value of which will be a deeply investigated 'constitutes_new_flight'"""
+            # Call out for heavy investigation into these anomalies.
+            solutions = inaccuracy.smart_constitutes_new_flight_batch(self.aircraft, self.day,
+                [self._change_descriptors[change_descriptor_idx] for change_descriptor_idx in requires_solvency])
+            for change_descriptor_idx, (new_flight, solution) in zip(requires_solvency, solutions):
+                constitutes_new_flight[change_descriptor_idx] = new_flight
+        # Every other timeline item is simply added to the current partial flight, so we'll walk just the new flight boundaries and add all items in between as a slice.
+        for change_descriptor_idx in self._new_flight_candidates:
+            if not constitutes_new_flight[change_descriptor_idx]:
+                # This descriptor will be included within the current partial flight.
                 continue
-            elif isinstance(timeline_item, FlightPointChangeDescriptor):
-                try:
-                    constitutes_new_flight = timeline_item.constitutes_new_flight
-                except error.FlightChangeInaccuracySolvencyRequired as fcisr:
-                    """TODO: flight inaccuracy solvency requested. Execute this here, the return value of which will be a deeply investigated 'constitutes_new_flight'"""
-                    # Call out for heavy investigation into this anomaly.
-                    constitutes_new_flight, solution = inaccuracy.smart_constitutes_new_flight(self.aircraft, self.day, timeline_item)
-                if constitutes_new_flight:
-                    # This change descriptor constitutes a new flight. We can safely skip this descriptor, and instead, create a partial flight out of what we have so far.
-                    LOG.debug(f"Detected a new flight for {self.aircraft_id} on {self.day_iso}, last flight ended at {timeline_item.point1_time_iso}, this flight commencing specifically at {timeline_item.point2_time_iso}!")
-                    # If current partial flight has 0 items, do not make it.
-                    if not len(current_partial_flight):
-                        LOG.warning(f"Skipped making a partial flight from partial flight fragments, no fragments given!")
-                        current_partial_flight = []
-                    try:
-                        partial_flight = self.construct_partial_flight_from(current_partial_flight, timeline_item)
-                        partial_flights_list.append(partial_flight)
-                    except error.InsufficientPartialFlightError as ipfe:
-                        LOG.warning(f"A partial flight {current_partial_flight} does not reach the minimum partial flight criteria! Skipping ...")
-                        continue
-                    current_partial_flight = []
-                    # Continue to ignore the descriptor.
-                    continue
-            # Otherwise, simply append the timeline item to the partial flight.
-            current_partial_flight.append(timeline_item)
+            timeline_item = self._change_descriptors[change_descriptor_idx]
+            # The change descriptor at index i is located at 2+2i within the timeline; after the start descriptor and each preceding point/descriptor pair.
+            timeline_item_idx = 2+2*change_descriptor_idx
+            current_partial_flight.extend(timeline[segment_start_idx:timeline_item_idx])
+            # Whatever happens, the descriptor itself is skipped.
+            segment_start_idx = timeline_item_idx+1
+            # This change descriptor constitutes a new flight. We can safely skip this descriptor, and instead, create a partial flight out of what we have so far.
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("Detected a new flight for %s on %s, last flight ended at %s, this flight commencing specifically at %s!",
+                    self.aircraft_id, self.day_iso, timeline_item.point1_time_iso, timeline_item.point2_time_iso)
+            # If current partial flight has 0 items, do not make it.
+            if not len(current_partial_flight):
+                LOG.warning(f"Skipped making a partial flight from partial flight fragments, no fragments given!")
+                current_partial_flight = []
+            try:
+                partial_flight = self.construct_partial_flight_from(current_partial_flight, timeline_item)
+                partial_flights_list.append(partial_flight)
+            except error.InsufficientPartialFlightError as ipfe:
+                LOG.warning("A partial flight %s does not reach the minimum partial flight criteria! Skipping ...", current_partial_flight)
+                continue
+            current_partial_flight = []
+        # Add all remaining timeline items to the current partial flight.
+        current_partial_flight.extend(timeline[segment_start_idx:])
         # If there are items in our current partial flight list, execute new flight.
         if len(current_partial_flight):
             try:
                 partial_flight = self.construct_partial_flight_from(current_partial_flight)
                 partial_flights_list.append(partial_flight)
             except error.InsufficientPartialFlightError as ipfe:
-                LOG.warning(f"A partial flight {current_partial_flight} does not reach the minimum partial flight criteria! Skipping ...")
+                LOG.warning("A partial flight %s does not reach the minimum partial flight criteria! Skipping ...", current_partial_flight)
                 pass
             current_partial_flight = []
         else:
             LOG.warning(f"Skipped making a partial flight from partial flight fragments, no fragments given!")
         # We have extracted partial flights from this day.
-        LOG.debug(f"Succesfully extracted {len(partial_flights_list)} partial flights for {self.aircraft_id} on {self.day_iso}!")
-        for partial_flight in partial_flights_list:
-            LOG.debug(f"\t{partial_flight}")
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Succesfully extracted %d partial flights for %s on %s!", len(partial_flights_list), self.aircraft_id, self.day_iso)
+            for partial_flight in partial_flights_list:
+                LOG.debug("\t%s", partial_flight)
         # Tuple-ise the list.
         self._partial_flights = tuple(partial_flights_list)
+        self._num_partial_flights = len(self._partial_flights)
+        self._partial_flight_starts = [partial_flight.starts_at for partial_flight in self._partial_flights]
 
     def make_timeline(self, **kwargs):
         """
@@ -1624,44 +1959,61 @@ class DailyFlightsView(FlightPointsManager):
         into the NEXT day. As such, the element proceeding the last flight point in the timeline will be a FlightPointEndDescriptor that, will calculate data points
         necessary to LATER ON, be supplied to a FlightPointStartDescriptor in order to better guess whether this is a continuation or not.
         """
-        try:
-            # If we have 0 items, then just set timeline tuple to an empty one.
-            if not len(self.flight_points):
-                LOG.debug(f"Skipped (re)building timeline tuple for {self.aircraft_id} on {self.day_iso} - there are no flight points.")
-                self._timeline = ()
-                return
-            # We'll first create the timeline with a list, then we'll convert that to the resulting tuple.
-            timeline_list = []
-            LOG.debug(f"(Re)building timeline tuple for {self.aircraft_id} on {self.day_iso}, using {len(self.flight_points)} flight points.")
-            # Now, iterate all other flight points (except the final one,) and create a flight point change descriptor for each.
-            for flight_point_idx, flight_point in enumerate(self.flight_points):
-                # Attempt to locate the previous point, current point and next point.
-                previous_point, current_point, next_point = self.calculate_surrounding_points(flight_point_idx)
-                if not previous_point:
-                    # If our previous point is None, this is a start point. So instantiate a flight point start descriptor, for the first point.
-                    # Also if next point is not None, instantiate a flight point change descriptor between the current point and next point.
-                    start_descriptor = FlightPointStartDescriptor(current_point)
-                    timeline_list.append(start_descriptor)
-                    timeline_list.append(current_point)
-                    if next_point:
-                        change_descriptor = FlightPointChangeDescriptor(current_point, next_point)
-                        timeline_list.append(change_descriptor)
-                elif current_point and next_point:
-                    # If our current point is not None, and our next point is not None, we will now create a FlightPointChangeDescriptor from current
-                    # to next point, then add the point, then the change descriptor.
-                    change_descriptor = FlightPointChangeDescriptor(current_point, next_point)
-                    timeline_list.append(current_point)
-                    timeline_list.append(change_descriptor)
-                elif current_point and not next_point:
-                    # If we have our current point, but our next point is None, this is our final point. We will create a FlightPointEndDescriptor for
-                    # the current point, then add the point, then the descriptor.
-                    end_descriptor = FlightPointEndDescriptor(current_point)
-                    timeline_list.append(current_point)
-                    timeline_list.append(end_descriptor)
-            # Now, we've constructed our timeline, tuple-ise it and set to instance attribute.
-            self._timeline = tuple(timeline_list)
-        except Exception as e:
-            raise e
+        # If we have 0 items, then just set timeline tuple to an empty one.
+        if not len(self.flight_points):
+            LOG.debug("Skipped (re)building timeline tuple for %s on %s - there are no flight points.", self.aircraft_id, self.day_iso)
+            self._timeline = ()
+            self._change_descriptors = ()
+            self._new_flight_candidates = ()
+            return
+        flight_points = self.flight_points
+        LOG.debug("(Re)building timeline tuple for %s on %s, using %d flight points.", self.aircraft_id, self.day_iso, len(flight_points))
+        # Create a flight point change descriptor between each consecutive pair of flight points, such that the descriptor at index i describes the change
+        # from flight point i to flight point i+1.
+        change_descriptors = [FlightPointChangeDescriptor(current_point, next_point) for current_point, next_point in zip(flight_points, flight_points[1:])]
+        # We'll first create the timeline with a list, then we'll convert that to the resulting tuple. The timeline begins with a start descriptor for the
+        # first point, followed by the first point itself.
+        first_point = flight_points[0]
+        if not change_descriptors:
+            timeline_list = [FlightPointStartDescriptor(first_point), first_point]
+        else:
+            # Otherwise, the timeline is of a known size; a start descriptor, then each flight point with a change descriptor between each, and finally, an end
+            # descriptor for our final point. Allocate this just once, then fill the flight points and change descriptors in by their alternating positions.
+            timeline_list = [None] * (2*len(flight_points)+1)
+            timeline_list[0] = FlightPointStartDescriptor(first_point)
+            timeline_list[1::2] = flight_points
+            timeline_list[2:-1:2] = change_descriptors
+            timeline_list[-1] = FlightPointEndDescriptor(flight_points[-1])
+        # Determine, in bulk, which of our change descriptors constitute a new flight, and keep the indices of those that may divide the timeline.
+        self._change_descriptors = tuple(change_descriptors)
+        self._new_flight_candidates = self._evaluate_change_descriptors(change_descriptors)
+        # Now, we've constructed our timeline, tuple-ise it and set to instance attribute.
+        self._timeline = tuple(timeline_list)
+
+    def _evaluate_change_descriptors(self, change_descriptors):
+        """
+        Evaluate the basic new flight criteria, as per FlightPointChangeDescriptor.constitutes_new_flight, for every change descriptor between consecutive flight
+        points in this view at once, using the manager's column arrays. Each result is then set on its descriptor, such that constitutes_new_flight need not evaluate
+        it again. Descriptors that require inaccuracy solvency are left unevaluated, so that constitutes_new_flight will raise for them as usual.
+
+        Arguments
+        ---------
+        :change_descriptors: A list of FlightPointChangeDescriptor, where the descriptor at index i is between flight point i and i+1.
+
+        Returns
+        -------
+        A list of the indices of all change descriptors that either constitute a new flight, or require inaccuracy solvency, in ascending order.
+        """
+        if not change_descriptors:
+            return []
+        on_ground = self.on_ground
+        altitudes = self.altitudes
+        constitutes_new_flight, requires_solvency = evaluate_new_flight_criteria(
+            on_ground[:-1], on_ground[1:], numpy.diff(self.timestamps), altitudes[:-1], altitudes[1:])
+        for change_descriptor, new_flight, solvency_required in zip(change_descriptors, constitutes_new_flight.tolist(), requires_solvency.tolist()):
+            if not solvency_required:
+                change_descriptor._constitutes_new_flight = new_flight
+        return numpy.flatnonzero(constitutes_new_flight | requires_solvency).tolist()
 
     def construct_partial_flight_from(self, partial_flight_fragments, change_descriptor = None):
         """
@@ -1671,31 +2023,25 @@ class DailyFlightsView(FlightPointsManager):
 
         Arguments
         ---------
-        :partial_flight_fragments: A list of a combination of FlightPoint and descriptors.
+        :partial_flight_fragments: A list or tuple of a combination of FlightPoint and descriptors. This will not be modified.
         :change_descriptor: Optionally, the FlightPointChangeDescriptor between the last flight point and the first in this flight.
 
         Returns
         -------
         A PartialFlight model.
         """
-        try:
-            # If partial flight fragments has less than MINIMUM_FRAGMENTS_FOR_PARTIAL, raise an InsufficientPartialFlightError.
-            if len(partial_flight_fragments) < config.MINIMUM_FRAGMENTS_FOR_PARTIAL:
-                LOG.warning(f"Ignoring creation of partial flight from a list of fragments {len(partial_flight_fragments)} long. This is not sufficient.")
-                raise error.InsufficientPartialFlightError(partial_flight_fragments)
-            first_item_idx = 0
-            # We'll construct a new flight point start descriptor for the first timeline item, unless the first timeline item is already one.
-            if not isinstance(partial_flight_fragments[first_item_idx], FlightPointStartDescriptor):
-                start_descriptor = FlightPointStartDescriptor(partial_flight_fragments[first_item_idx])
-                partial_flight_fragments.insert(first_item_idx, start_descriptor)
-            last_item_idx = len(partial_flight_fragments)-1
-            # Also construct a flight point end descriptor for the last timeline item, unless the last timeline item is already one.
-            if not isinstance(partial_flight_fragments[last_item_idx], FlightPointEndDescriptor):
-                partial_flight_fragments.append(FlightPointEndDescriptor(partial_flight_fragments[last_item_idx]))
-            # Construct a partial flight tuple and return it.
-            return PartialFlight(self.aircraft, self.day, tuple(partial_flight_fragments), change_descriptor = change_descriptor)
-        except Exception as e:
-            raise e
+        # If partial flight fragments has less than MINIMUM_FRAGMENTS_FOR_PARTIAL, raise an InsufficientPartialFlightError.
+        if len(partial_flight_fragments) < config.MINIMUM_FRAGMENTS_FOR_PARTIAL:
+            LOG.warning("Ignoring creation of partial flight from a list of fragments %d long. This is not sufficient.", len(partial_flight_fragments))
+            raise error.InsufficientPartialFlightError(partial_flight_fragments)
+        first_item = partial_flight_fragments[0]
+        last_item = partial_flight_fragments[-1]
+        # We'll construct a new flight point start descriptor for the first timeline item, unless the first timeline item is already one.
+        start_descriptors = () if first_item.KIND == KIND_START_DESCRIPTOR else (FlightPointStartDescriptor(first_item),)
+        # Also construct a flight point end descriptor for the last timeline item, unless the last timeline item is already one.
+        end_descriptors = () if last_item.KIND == KIND_END_DESCRIPTOR else (FlightPointEndDescriptor(last_item),)
+        # Construct a partial flight tuple in a single allocation and return it.
+        return PartialFlight(self.aircraft, self.day, (*start_descriptors, *partial_flight_fragments, *end_descriptors), change_descriptor = change_descriptor)
 
     def attempt_find_suitable_partial_for(self, flight_points, **kwargs):
         """
@@ -1710,29 +2056,26 @@ class DailyFlightsView(FlightPointsManager):
         -------
         A PartialFlight or None, if the day needs to be processed completely.
         """
-        try:
-            # First order of business, attempt to locate a directly preceding partial flight.
-            directly_preceding_partial = self.locate_partial_with(flight_points)
-            # If not none, apply logic to verify this can be attached to the preceding partial.
-            if directly_preceding_partial:
-                # If we found a directly preceding partial, we should instantiate a flight change descriptor between its last point, and our
-                # flight point's first point. We will then use flight determination logic in that descriptor to determine new flight.
-                change_descriptor = FlightPointChangeDescriptor(directly_preceding_partial.last_point, flight_points[0])
-                # Now, if this DOES NOT constitute a new flight, we will return the preceding partial.
-                try:
-                    constitutes_new_flight = change_descriptor.constitutes_new_flight
-                except error.FlightChangeInaccuracySolvencyRequired as fcisr:
-                    """TODO: flight inaccuracy solvency requested. Execute this here, the return value of which will be a deeply investigated 'constitutes_new_flight'"""
-                    # Call out for heavy investigation into this anomaly.
-                    constitutes_new_flight, solution = inaccuracy.smart_constitutes_new_flight(self.aircraft, self.day, change_descriptor)
-                if not constitutes_new_flight:
-                    LOG.debug(f"Found suitable predecessor partial; {directly_preceding_partial} for sequence beginning at {flight_points[0].datetime_iso} - not a new flight!")
-                    return directly_preceding_partial
-            LOG.debug(f"Couldn't find suitable predecessor partial for sequence beginning with {flight_points[0].datetime_iso}, parsing as a new sequence!")
-            # There is no preceding partial for the given sequence. This may be a brand new submission for the day. If this is the case, fall back to executing like revise_flight_data_for.
-            return None
-        except Exception as e:
-            raise e
+        # First order of business, attempt to locate a directly preceding partial flight.
+        directly_preceding_partial = self.locate_partial_with(flight_points)
+        # If not none, apply logic to verify this can be attached to the preceding partial.
+        if directly_preceding_partial:
+            # If we found a directly preceding partial, we should instantiate a flight change descriptor between its last point, and our
+            # flight point's first point. We will then use flight determination logic in that descriptor to determine new flight.
+            change_descriptor = FlightPointChangeDescriptor(directly_preceding_partial.last_point, flight_points[0])
+            # Now, if this DOES NOT constitute a new flight, we will return the preceding partial.
+            try:
+                constitutes_new_flight = change_descriptor.constitutes_new_flight
+            except error.FlightChangeInaccuracySolvencyRequired as fcisr:
+                """TODO: flight inaccuracy solvency requested. Execute this here, the return value of which will be a deeply investigated 'constitutes_new_flight'"""
+                # Call out for heavy investigation into this anomaly.
+                constitutes_new_flight, solution = inaccuracy.smart_constitutes_new_flight(self.aircraft, self.day, change_descriptor)
+            if not constitutes_new_flight:
+                LOG.debug(f"Found suitable predecessor partial; {directly_preceding_partial} for sequence beginning at {flight_points[0].datetime_iso} - not a new flight!")
+                return directly_preceding_partial
+        LOG.debug(f"Couldn't find suitable predecessor partial for sequence beginning with {flight_points[0].datetime_iso}, parsing as a new sequence!")
+        # There is no preceding partial for the given sequence. This may be a brand new submission for the day. If this is the case, fall back to executing like revise_flight_data_for.
+        return None
 
     def locate_partial_with(self, flight_points, **kwargs):
         """
@@ -1750,32 +2093,30 @@ class DailyFlightsView(FlightPointsManager):
         -------
         A PartialFlight, or None.
         """
-        try:
-            LOG.debug(f"Locating partial flight of best fit for flight points array beginning at {flight_points[0].datetime_iso} and ending at {flight_points[len(flight_points)-1].datetime_iso}")
-            for partial_idx, partial_flight in enumerate(self.partial_flights):
-                # Get the first flight point.
-                first_point = flight_points[0]
-                # Get the last flight point.
-                last_point = flight_points[len(flight_points)-1]
-                # Attempt to get the next partial.
-                next_partial = None if partial_idx+1 >= self.num_partial_flights else self.partial_flights[partial_idx+1]
-
-                # Calculate some early statistics.
-                # If first point in the sequence comes AFTER the current partials start, starts_after_current_partial is True.
-                starts_after_current_partial = True if first_point.timestamp >= partial_flight.starts_at else False
-                # If no next partial OR we have a next partial and our question sequence ends BEFORE that partial's start, ends_before_next_partial is True.
-                ends_before_next_partial = True if not next_partial or next_partial and last_point.timestamp < next_partial.starts_at else False
-                # And so, if the question sequence start comes after the current partials start, and theres either no next partial, or the question sequence ends before
-                # the next partial starts, the most suitable flight is the current partial flight!
-                if starts_after_current_partial and ends_before_next_partial:
-                    LOG.debug(f"Located partial {partial_flight} directly preceding sequence beginning at {first_point.datetime_iso}")
-                    return partial_flight
-            # Otherwise, return none.
-            first_point = flight_points[0]
-            LOG.warning(f"Failed to locate partial directly preceding sequence beginning at {first_point.datetime_iso}")
-            return None
-        except Exception as e:
-            raise e
+        # Get the first and last flight points.
+        first_point = flight_points[0]
+        last_point = flight_points[-1]
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Locating partial flight of best fit for flight points array beginning at %s and ending at %s", first_point.datetime_iso, last_point.datetime_iso)
+        partial_flights = self.partial_flights
+        # Partials are in chronological order, so the only partial that our sequence can start after, whilst ending before the next partial starts, is the
+        # latest partial that starts at or before the first point in the sequence. Bisect the partials' start timestamps to find it.
+        partial_idx = bisect.bisect_right(self._partial_flight_starts, first_point.timestamp)-1
+        if partial_idx >= 0:
+            partial_flight = partial_flights[partial_idx]
+            # Attempt to get the next partial.
+            next_partial = None if partial_idx+1 >= len(partial_flights) else partial_flights[partial_idx+1]
+            # If no next partial OR we have a next partial and our question sequence ends BEFORE that partial's start, ends_before_next_partial is True.
+            ends_before_next_partial = True if not next_partial or next_partial and last_point.timestamp < next_partial.starts_at else False
+            # And so, if the question sequence start comes after the current partials start, and theres either no next partial, or the question sequence ends before
+            # the next partial starts, the most suitable flight is the current partial flight!
+            if ends_before_next_partial:
+                if LOG.isEnabledFor(logging.DEBUG):
+                    LOG.debug("Located partial %s directly preceding sequence beginning at %s", partial_flight, first_point.datetime_iso)
+                return partial_flight
+        # Otherwise, return none.
+        LOG.warning(f"Failed to locate partial directly preceding sequence beginning at {first_point.datetime_iso}")
+        return None
 
     @classmethod
     def from_args(cls, _aircraft, _day, _flight_points, **kwargs):
@@ -1792,4 +2133,5 @@ class DailyFlightsView(FlightPointsManager):
             aircraft_present_day.aircraft,
             aircraft_present_day.day_day,
             aircraft_present_day.all_flight_points,
+            pre_sorted = True,
             **kwargs)
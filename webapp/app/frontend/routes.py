@@ -4,14 +4,14 @@ import json
 import time
 import logging
 from datetime import datetime
+from urllib.parse import urlsplit
 
-from werkzeug.urls import url_parse
 from flask import request, render_template, redirect, flash, url_for, send_from_directory, abort, jsonify, current_app
 from flask_login import login_required, current_user, login_user, logout_user
 from marshmallow import Schema, fields
 from sqlalchemy import asc, desc
 
-from .. import db, config, login_manager, models, decorators, flights, airvehicles
+from .. import db, cache, config, login_manager, models, decorators, flights, airvehicles
 from . import frontend
 
 LOG = logging.getLogger("aireyes.frontend.routes")
@@ -19,14 +19,28 @@ LOG.setLevel( logging.DEBUG )
 
 
 def get_back_button():
-    current_page = request.full_path
+    """
+    Returns the path to the page the user navigated to this one from, if that page is on this site and isn't the current page. Otherwise, returns None.
+    """
     previous_page = request.referrer
-    print(f"{previous_page} => {current_page}")
-    scheme, netloc, path, query, fragment = url_parse(current_page)
-    print(f"{scheme} | {netloc} | {path} | {query} | {fragment}")
-    scheme, netloc, path, query, fragment = url_parse(previous_page)
-    print(f"{scheme} | {netloc} | {path} | {query} | {fragment}")
-    return "OK"
+    if not previous_page:
+        return None
+    scheme, netloc, path, query, fragment = urlsplit(previous_page)
+    if netloc != request.host or path == request.path:
+        return None
+    return f"{path}?{query}" if query else path
+
+
+def is_cacheable_response(response):
+    """Returns True if the given view response was successful, and so may be cached. Views in this blueprint return either a body, or a tuple of body and status code."""
+    if isinstance(response, tuple):
+        return response[1] == 200
+    return getattr(response, "status_code", 200) == 200
+
+
+def flights_page_cache_key():
+    """Returns the cache key for the requested page of flights; of all flights, or of those for the aircraft given in the URL."""
+    return flights.flights_page_cache_key(request.args.get("p", 1, type = int), request.view_args.get("aircraft_icao", None))
 
 
 @frontend.context_processor
@@ -38,6 +52,8 @@ def frontend_template_context():
 
 
 @frontend.route("/", methods = [ "GET" ])
+@decorators.conditional_response()
+@cache.cached(timeout = config.FRONTEND_CACHE_TIMEOUT, key_prefix = airvehicles.INDEX_CACHE_KEY, response_filter = is_cacheable_response)
 def index():
     """
     This is the index page, it will display the list of aircrafts being tracked, in summary.
@@ -73,6 +89,8 @@ def statistics():
 
 
 @frontend.route("/heatmap", methods = [ "GET" ])
+@decorators.conditional_response()
+@cache.cached(timeout = config.FRONTEND_CACHE_TIMEOUT, response_filter = is_cacheable_response)
 def heatmap():
     """
     Present the world map to the user. This will show hot zones for tracked users, based on their already-stored traffic. Essentially, where they've spent most
@@ -119,6 +137,7 @@ def aircraft_overview(aircraft, **kwargs):
 
 
 @frontend.route("/flights", methods = [ "GET" ])
+@cache.cached(timeout = config.FLIGHTS_PAGE_CACHE_TIMEOUT, key_prefix = flights_page_cache_key, response_filter = is_cacheable_response)
 def flights_overview(**kwargs):
     """
     View a list of all Flights logged in this database.
@@ -130,12 +149,13 @@ def flights_overview(**kwargs):
         # Query all flights newest to oldest.
         # Apply pagination to this query.
         flights_q = flights.query_flights(newest_first = True)
+        # We won't have the pagination count our flights on each request, instead, we'll use a cached total.
         flights_pagination = flights_q\
-            .paginate(page = page, max_per_page = config.PAGE_SIZE_FLIGHTS, error_out = False)
+            .paginate(page = page, max_per_page = config.PAGE_SIZE_FLIGHTS, error_out = False, count = False)
         # Get flights from the pagination.
         flights_ = flights_pagination.items
-        # Get the number of flights.
-        num_flights = flights_pagination.total
+        # Get the number of flights, and set it on the pagination.
+        num_flights = flights_pagination.total = flights.count_flights()
         LOG.debug(f"Located {num_flights} in total, serving page #{page}.")
         # Now, render a template for these flights.
         return render_template(
@@ -148,6 +168,7 @@ def flights_overview(**kwargs):
 
 
 @frontend.route("/aircraft/<aircraft_icao>/flights", methods = [ "GET" ])
+@cache.cached(timeout = config.FLIGHTS_PAGE_CACHE_TIMEOUT, key_prefix = flights_page_cache_key, response_filter = is_cacheable_response)
 @decorators.get_aircraft()
 def aircraft_flights(aircraft, **kwargs):
     """
@@ -161,12 +182,13 @@ def aircraft_flights(aircraft, **kwargs):
         # Query all flights for the given aircraft.
         # Apply pagination to this query.
         flights_q = flights.query_flights_from(aircraft, newest_first = True)
+        # We won't have the pagination count our flights on each request, instead, we'll use a cached total.
         flights_pagination = flights_q\
-            .paginate(page = page, max_per_page = config.PAGE_SIZE_FLIGHTS, error_out = False)
+            .paginate(page = page, max_per_page = config.PAGE_SIZE_FLIGHTS, error_out = False, count = False)
         # Get flights from the pagination.
         flights_ = flights_pagination.items
-        # Get the number of flights.
-        num_flights = flights_pagination.total
+        # Get the number of flights, and set it on the pagination.
+        num_flights = flights_pagination.total = flights.count_flights(aircraft)
         LOG.debug(f"Located {num_flights} for aircraft {aircraft}.")
         # Now, render a template for these flights.
         return render_template(
@@ -10,10 +10,12 @@ import decimal
 import hashlib
 import logging
 import json
-import geojson
-import geopandas
+import functools
+import itertools
+import threading
+import numpy
 import pyproj
-from shapely import strtree, geometry, wkb
+from shapely import strtree, geometry, wkb, prepared
 from fastkml import kml
 from datetime import datetime, date, timedelta
 
@@ -22,11 +24,12 @@ from typing import List
 from sqlalchemy.exc import OperationalError, UnsupportedCompilationError
 from .compat import insert
 
-from sqlalchemy import func, and_, or_, asc, desc
+from sqlalchemy import func, and_, or_, asc, desc, values, column, select, exists, Integer, Float
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer, aliased
 from marshmallow import Schema, fields, EXCLUDE, post_load
 
-from . import db, config, models, error, aiogeospatial, traces, calculations
+from . import db, config, models, error, aiogeospatial, traces, calculations, thirdparty
 
 # Conditional legacy from when PostGIS was the addon. Can be removed.
 if config.POSTGIS_ENABLED:
@@ -44,14 +47,70 @@ COORDINATE_REFERENCE_SYSTEMS = [
 DEFAULT_CRS = ("World", 3857,)
 
 
+@functools.lru_cache(maxsize = 64)
+def get_crs(crs) -> pyproj.crs.CRS:
+    """
+    Return a CRS object for the given user input, such as an EPSG code or a CRS object. Construction of CRS objects is expensive, so these are cached by input;
+    to release all cached CRS objects, call get_crs.cache_clear().
+
+    Arguments
+    ---------
+    :crs: Any hashable input accepted by CRS.from_user_input.
+
+    Returns
+    -------
+    An instance of CRS.
+    """
+    return pyproj.crs.CRS.from_user_input(crs)
+
+
+@functools.lru_cache(maxsize = 64)
+def get_transformer(source_crs, target_crs) -> pyproj.Transformer:
+    """
+    Return an always XY transformer from the source CRS to the target CRS. As with get_crs, these are cached by input, and can be released by calling
+    get_transformer.cache_clear().
+
+    Arguments
+    ---------
+    :source_crs: Any hashable input accepted by CRS.from_user_input, through which coordinates are currently projected.
+    :target_crs: Any hashable input accepted by CRS.from_user_input, through which coordinates should be projected.
+
+    Returns
+    -------
+    An instance of Transformer.
+    """
+    return pyproj.Transformer.from_crs(get_crs(source_crs), get_crs(target_crs), always_xy = True)
+
+
+@functools.lru_cache(maxsize = 64)
+def get_geodetic_transformer(crs) -> pyproj.Transformer:
+    """
+    Return an always XY transformer from the given CRS to its geodetic CRS. This is cached by input, and can be released by calling
+    get_geodetic_transformer.cache_clear().
+
+    Arguments
+    ---------
+    :crs: Any hashable input accepted by CRS.from_user_input.
+
+    Returns
+    -------
+    An instance of Transformer.
+    """
+    crs = get_crs(crs)
+    return pyproj.Transformer.from_crs(crs, crs.geodetic_crs, always_xy = True)
+
+
+@functools.lru_cache(maxsize = 1)
+def _get_crs_areas_of_use():
+    """Return a tuple, containing the name, EPSG and a Polygon built from the area of use bounds for each system in COORDINATE_REFERENCE_SYSTEMS. This is built once, on first use."""
+    return tuple((name, epsg, geometry.box(*get_crs(epsg).area_of_use.bounds),) for name, epsg in COORDINATE_REFERENCE_SYSTEMS)
+
+
 def locate_appropriate_crs_for_rectangle(polygon):
     # A list for all appropriate CRSs.
     appropriate_crs = []
-    # Iterate each system info, and get their CRS from pyproj.
-    for name, epsg in COORDINATE_REFERENCE_SYSTEMS:
-        crs = pyproj.crs.CRS.from_user_input(epsg)
-        # Now, build a Polygon geometry from the crs' bounds.
-        area_of_use_poly = geometry.box(*crs.area_of_use.bounds)
+    # Iterate each system info, along with the Polygon geometry from its CRS' bounds.
+    for name, epsg, area_of_use_poly in _get_crs_areas_of_use():
         # Is there an intersection here? If so, add the name/epsg to the list.
         if polygon.intersects(area_of_use_poly):
             appropriate_crs.append((name, epsg,))
@@ -62,55 +121,83 @@ def locate_appropriate_crs_for_rectangle(polygon):
     return appropriate_crs
 
 
+def _epsg_codes_for_coords(coords, crs) -> List[int]:
+    """
+    Return each unique EPSG for the given coordinates, in the order they were first found. All coordinates are transformed, via a single cached transformer from
+    the given CRS to its geodetic CRS, in one call.
+
+    Arguments
+    ---------
+    :coords: An array of shape (N, 2) or more; each row is a longitude and latitude, projected through the given CRS.
+    :crs: The CRS through which the coordinates are projected.
+
+    Returns
+    -------
+    A list of EPSG codes.
+    """
+    epsg_codes = calculations.epsg_codes_for(coords[:, 0], coords[:, 1], transformer = get_geodetic_transformer(crs))
+    return list(dict.fromkeys(epsg_codes.tolist()))
+
+
 def get_epsg_codes_for_polygon(polygon, crs) -> List[int]:
-    # Get the CRS, through which this long, lat is projected.
-    crs = pyproj.crs.CRS.from_user_input(crs)
-    # Build a transformer from this CRS to the CRS' geodetic CRS.
-    transformer = pyproj.Transformer.from_crs(crs, crs.geodetic_crs, always_xy = True)
-    all_epsg_codes = []
-    # Iterate polygon's exterior coords, and get the EPSG for each.
-    for longitude, latitude in polygon.exterior.coords:
-        # Add each EPSG to the overall list.
-        code = calculations.epsg_code_for(longitude, latitude, crs, transformer = transformer)
-        if not code in all_epsg_codes:
-            all_epsg_codes.append(code)
-    return all_epsg_codes
+    # Get the EPSG for every coordinate in the polygon's exterior at once.
+    return _epsg_codes_for_coords(numpy.asarray(polygon.exterior.coords), crs)
 
 
 def get_epsg_codes_for(multi_polygon, crs) -> List[int]:
-    # Get the CRS, through which this long, lat is projected.
-    crs = pyproj.crs.CRS.from_user_input(crs)
-    # Build a transformer from this CRS to the CRS' geodetic CRS.
-    transformer = pyproj.Transformer.from_crs(crs, crs.geodetic_crs, always_xy = True)
-    all_epsg_codes = []
-    # Iterate each polygon in the multi polygon.
-    for polygon in multi_polygon:
-        # Iterate polygon's exterior coords, and get the EPSG for each.
-        for longitude, latitude in polygon.exterior.coords:
-            # Add each EPSG to the overall list.
-            code = calculations.epsg_code_for(longitude, latitude, crs, transformer = transformer)
-            if not code in all_epsg_codes:
-                all_epsg_codes.append(code)
-    return all_epsg_codes
+    # Get the EPSG for every coordinate in the exterior of each polygon in the multi polygon at once.
+    return _epsg_codes_for_coords(numpy.concatenate([ numpy.asarray(polygon.exterior.coords)[:, :2] for polygon in multi_polygon.geoms ]), crs)
+
+
+def get_epsg_codes_for_suburbs(suburbs) -> List[List[int]]:
+    """
+    Return the EPSG codes for the geometry of each given suburb. Rather than a call per suburb, the exterior coordinates of all suburbs sharing a CRS are
+    concatenated and located in one call, then split back up by suburb.
+
+    Arguments
+    ---------
+    :suburbs: A list of Suburbs.
+
+    Returns
+    -------
+    A list, with one item for each suburb in order; a list of that suburb's EPSG codes.
+    """
+    suburbs_epsg_codes = [ None ] * len(suburbs)
+    # Group the index of each suburb by its CRS.
+    suburb_indices_by_crs = {}
+    for idx, suburb in enumerate(suburbs):
+        suburb_indices_by_crs.setdefault(suburb.crs, []).append(idx)
+    for crs, suburb_indices in suburb_indices_by_crs.items():
+        # Get the exterior coordinates of each polygon in each suburb's multi polygon.
+        suburbs_coords = [ numpy.concatenate([ numpy.asarray(polygon.exterior.coords)[:, :2] for polygon in suburbs[idx].multi_polygon.geoms ]) for idx in suburb_indices ]
+        all_coords = numpy.concatenate(suburbs_coords)
+        # Get the EPSG for every coordinate at once, then split these back up by suburb.
+        all_epsg_codes = calculations.epsg_codes_for(all_coords[:, 0], all_coords[:, 1], transformer = get_geodetic_transformer(crs))
+        split_epsg_codes = numpy.split(all_epsg_codes, numpy.cumsum([ len(suburb_coords) for suburb_coords in suburbs_coords ])[:-1])
+        for idx, epsg_codes in zip(suburb_indices, split_epsg_codes):
+            suburbs_epsg_codes[idx] = list(dict.fromkeys(epsg_codes.tolist()))
+    return suburbs_epsg_codes
 
 
 def upsert_epsg_codes(epsg_codes):
     try:
-        # Iterate each EPSG code, upserting.
-        for epsg in epsg_codes:
-            insert_epsg_stmt = (
-                insert(models.UTMEPSG.__table__)
-                .values(epsg = epsg)
-            ).on_conflict_do_nothing(index_elements = ["epsg"])
-            # Execute.
-            db.session.execute(insert_epsg_stmt)
+        epsg_values = [ dict(epsg = epsg) for epsg in epsg_codes ]
+        if not len(epsg_values):
+            return
+        # Upsert all EPSG codes in a single statement.
+        insert_epsg_stmt = (
+            insert(models.UTMEPSG.__table__)
+            .values(epsg_values)
+        ).on_conflict_do_nothing(index_elements = ["epsg"])
+        # Execute.
+        db.session.execute(insert_epsg_stmt)
     except Exception as e:
         raise e
 
 
 class GeospatialSuburbViewIntersection():
     """
-    A container for a list of Suburb instances, that will automatically create an STRtree and facilitate queries for intersection by provided rectangular polygons.
+    A container for a list of Suburb instances, that will automatically create an array of bounding boxes and facilitate queries for intersection by provided rectangular polygons.
     All suburbs will be stored as minimum rotated rectangles, calculated on the basis of their stored bounds data, making this class significantly quicker in the hopes
     that it can be called without consideration for overhead.
     """
@@ -159,23 +246,14 @@ class GeospatialSuburbViewIntersection():
                     self._highest_num_flight_points = suburb_most_flight_points[2]
                 LOG.debug(f"Suburbs NOT provided to GeospatialSuburbViewIntersection, we will instead use all {len(_all_suburbs)} suburbs loaded.")
             else:
-                # We have been provided with a suburbs list. We'll set our highest num flight points.
-                # Sort the suburbs, num flight points descending.
-                suburbs_descending = sorted(_all_suburbs, key = lambda suburb: suburb.num_flight_points, reverse = True)
-                # Use the first point, which will be the suburb with the highest number of flight points.
-                self._highest_num_flight_points = suburbs_descending[0].num_flight_points
+                # We have been provided with a suburbs list. We'll set our highest num flight points, from the suburb with the highest number of flight points.
+                self._highest_num_flight_points = max(suburb.num_flight_points for suburb in _all_suburbs)
                 LOG.debug(f"Constructing GeospatialSuburbViewIntersection for {len(_all_suburbs)} suburbs.")
             # Make a tuple out of our suburbs list, to ensure its order and size is immutable.
             self._all_suburbs = tuple(_all_suburbs)
-            # Now that we have a tuple of all suburbs to use, we'll develop a polygon on the basis of the bounding box for each.
-            LOG.debug(f"Starting by building a minimum rotated polygon from each provided suburb...")
-            self._all_suburbs_polygons = [ geometry.box(*suburb_.bbox) for suburb_ in self._all_suburbs ]
-            # Now, create a lookup for a polygon's ID given its index. This index is relative to the _all_suburbs list.
-            LOG.debug(f"Constructing suburb polygon identity dict for {len(self._all_suburbs)}...")
-            self._index_by_id = dict((id(polygon), idx) for idx, polygon in enumerate(self._all_suburbs_polygons))
-            # Now setup the STRtree.
-            LOG.debug(f"Setting up an STRtree for all suburb polygons...")
-            self._suburb_strtree = strtree.STRtree(self._all_suburbs_polygons)
+            # Now that we have a tuple of all suburbs to use, we'll build an array of the bounding box for each, in the same order; columns are minx, miny, maxx, maxy.
+            LOG.debug(f"Building a bounding box array from all {len(self._all_suburbs)} provided suburbs...")
+            self._bbox_array = numpy.asarray([ suburb_.bbox for suburb_ in self._all_suburbs ], dtype = numpy.float64).reshape(-1, 4)
 
     def locate_suburbs_within_view(self, view_polygon, crs, **kwargs):
         if config.POSTGIS_ENABLED and not self._force_without_postgis:
@@ -184,18 +262,82 @@ class GeospatialSuburbViewIntersection():
                 .filter(func.ST_Intersects(models.Suburb.multi_polygon_geom, shape.from_shape(view_polygon, srid = crs)))\
                 .all()
         else:
-            # Simply perform a query for the STRtree to locate all intersecting suburbs, given the rectangular polygon.
-            insersecting_polygons = [ (self._index_by_id[id(polygon)], polygon) for polygon in self._suburb_strtree.query(view_polygon) ]
-            # Convert these polygons back to their neighbour equivalents.
-            intersecting_suburbs = [ self._all_suburbs[insersecting_polygon[0]] for insersecting_polygon in insersecting_polygons ]
+            # Locate all suburbs whose bounding box intersects the bounds of the given polygon, by comparing against all bounding boxes at once.
+            view_minx, view_miny, view_maxx, view_maxy = view_polygon.bounds
+            bbox_array = self._bbox_array
+            intersecting_mask = (bbox_array[:, 0] <= view_maxx) & (bbox_array[:, 2] >= view_minx) & (bbox_array[:, 1] <= view_maxy) & (bbox_array[:, 3] >= view_miny)
+            # Convert these indices back to their suburb equivalents.
+            intersecting_suburbs = [ self._all_suburbs[idx] for idx in numpy.flatnonzero(intersecting_mask) ]
         # Simply return intersecting suburbs.
         return intersecting_suburbs
 
 
+class SuburbViewSnapshot():
+    """
+    A lightweight, session independent snapshot of all suburbs, holding only each suburb's hash and bounding box. This facilitates the same queries for intersection by
+    provided rectangular polygons as GeospatialSuburbViewIntersection, but since no Suburb instances or geometries are kept, it can safely be shared by the whole process;
+    located suburbs are instead queried by their hash, in the current session.
+    """
+    def __init__(self):
+        # Query just the hash and bounds for every suburb, rather than entire Suburb instances.
+        suburb_bounds = db.session.query(
+            models.Suburb.suburb_hash,
+            models.Suburb.minx, models.Suburb.miny, models.Suburb.maxx, models.Suburb.maxy
+        )\
+        .all()
+        self._suburb_hashes = tuple(row[0] for row in suburb_bounds)
+        # Columns are minx, miny, maxx, maxy, in the same order as the suburb hashes.
+        self._bbox_array = numpy.asarray([ row[1:] for row in suburb_bounds ], dtype = numpy.float64).reshape(-1, 4)
+        LOG.debug(f"Built suburb view snapshot for {len(self._suburb_hashes)} suburbs.")
+
+    def locate_suburbs_within_view(self, view_polygon, crs, **kwargs):
+        # Locate all suburbs whose bounding box intersects the bounds of the given polygon, by comparing against all bounding boxes at once.
+        view_minx, view_miny, view_maxx, view_maxy = view_polygon.bounds
+        bbox_array = self._bbox_array
+        intersecting_mask = (bbox_array[:, 0] <= view_maxx) & (bbox_array[:, 2] >= view_minx) & (bbox_array[:, 1] <= view_maxy) & (bbox_array[:, 3] >= view_miny)
+        intersecting_hashes = [ self._suburb_hashes[idx] for idx in numpy.flatnonzero(intersecting_mask) ]
+        if not len(intersecting_hashes):
+            return []
+        # Now, query all intersecting suburbs in the current session.
+        return db.session.query(models.Suburb)\
+            .filter(models.Suburb.suburb_hash.in_(intersecting_hashes))\
+            .all()
+
+
+# A process-wide suburb view snapshot, along with the key it was built against, and a lock guarding its construction.
+_SUBURB_VIEW_CACHE = None
+_SUBURB_VIEW_CACHE_KEY = None
+_SUBURB_VIEW_CACHE_LOCK = threading.Lock()
+
+
+def _get_or_build_suburb_view():
+    """
+    Return a suburb view able to locate all suburbs within a view. When PostGIS is available, this is simply a new GeospatialSuburbViewIntersection. Otherwise, a single
+    SuburbViewSnapshot is shared by the whole process, and is only rebuilt when the suburbs table changes. Since suburbs can't yet be updated, only inserted, the number
+    of suburbs along with the highest suburb hash will suffice as the key.
+
+    Returns
+    -------
+    An instance of GeospatialSuburbViewIntersection or SuburbViewSnapshot.
+    """
+    global _SUBURB_VIEW_CACHE, _SUBURB_VIEW_CACHE_KEY
+    if config.POSTGIS_ENABLED:
+        # No setup is performed when PostGIS is available, so just return a new instance.
+        return GeospatialSuburbViewIntersection()
+    suburb_view_key = tuple(db.session.query(func.count(models.Suburb.suburb_hash), func.max(models.Suburb.suburb_hash)).one())
+    with _SUBURB_VIEW_CACHE_LOCK:
+        if _SUBURB_VIEW_CACHE is None or _SUBURB_VIEW_CACHE_KEY != suburb_view_key:
+            LOG.debug(f"Building shared suburb view snapshot for {suburb_view_key[0]} suburbs...")
+            _SUBURB_VIEW_CACHE = SuburbViewSnapshot()
+            _SUBURB_VIEW_CACHE_KEY = suburb_view_key
+        return _SUBURB_VIEW_CACHE
+
+
 class SuburbsToGeoJson():
     """A type for converting Suburb instances to GeoJSON, given a source and target CRS."""
     def __init__(self, source_crs, target_crs, **kwargs):
         self._show_only_aircraft = kwargs.get("show_only_aircraft", "all")
+        same_crs = kwargs.get("same_crs", None)
 
         # If this is a list, get the icaos from each aircraft; that becomes our filter.
         if isinstance(self._show_only_aircraft, list):
@@ -215,12 +357,13 @@ class SuburbsToGeoJson():
             raise error.InvalidCRSError("suburbs-to-geojson-no-target-crs")
         # Ensure both are CRS objects.
         if not isinstance(source_crs, pyproj.crs.CRS):
-            source_crs = pyproj.crs.CRS.from_user_input(source_crs)
+            source_crs = get_crs(source_crs)
         if not isinstance(target_crs, pyproj.crs.CRS):
-            target_crs = pyproj.crs.CRS.from_user_input(target_crs)
-        # Set class vars.
+            target_crs = get_crs(target_crs)
+        # Set class vars. If the caller has not already compared the source and target CRSs, do so now.
         self._source_crs = source_crs
         self._target_crs = target_crs
+        self._same_crs = same_crs if same_crs is not None else source_crs == target_crs
 
     def get_geojson(self, suburbs, **kwargs):
         dump = kwargs.get("dump", True)
@@ -236,36 +379,86 @@ class SuburbsToGeoJson():
         """
         # Transform all suburbs to the appropriate output CRS.
         transformed_geometries = self._transform_suburbs(suburbs)
+        # Get the exterior coordinates for every polygon in each transformed geometry.
+        exterior_coordinates = self._get_exterior_coordinates(transformed_geometries)
+        # Count the flight points in every suburb at once.
+        num_flight_points_by_suburb = self._get_num_flight_points(suburbs)
         # Construct a feature from each suburb within view.
         all_features = []
-        for suburb, multi_polygon in zip(suburbs, transformed_geometries):
+        for suburb, polygon_exteriors in zip(suburbs, exterior_coordinates):
             # Build properties for this suburb.
-            properties = self._build_properties_for(suburb)
-            # Create the feature object.
-            feature = geojson.Feature(
-                id = suburb.suburb_hash,
-                properties = properties,
-                geometry = geojson.MultiPolygon([[list(polygon.exterior.coords)] for polygon in multi_polygon.geoms])
-            )
+            properties = self._build_properties_for(suburb, num_flight_points_by_suburb.get(suburb.suburb_hash, 0))
+            # Create the feature, as a plain dictionary in GeoJSON layout; this avoids validating and copying the coordinates of every feature once more.
+            feature = {
+                "type": "Feature",
+                "id": suburb.suburb_hash,
+                "geometry": {
+                    "type": "MultiPolygon",
+                    "coordinates": [[exterior] for exterior in polygon_exteriors]
+                },
+                "properties": properties
+            }
             # Add to features.
             all_features.append(feature)
         # Build a feature collection from all these features.
-        feature_collection = geojson.FeatureCollection(all_features)
+        feature_collection = {
+            "type": "FeatureCollection",
+            "features": all_features
+        }
         if dump:
             # Dump and return the result, do not pretty print, to save bandwidth.
-            return geojson.dumps(feature_collection, sort_keys = False)
+            return json.dumps(feature_collection, separators = (",", ":"))
         return feature_collection
 
     def _transform_suburbs(self, suburbs):
-        # Build a GeoSeries from all geodetic multi polygons from these suburbs, setting CRS to the source CRS.
-        suburbs_geoseries = geopandas.GeoSeries([suburb.multi_polygon for suburb in suburbs], crs = self._source_crs)
-        # Now, transform to the target CRS.
-        suburbs_geoseries = suburbs_geoseries.to_crs(self._target_crs)
-        # Finally, return a list of all geometries.
-        return list(suburbs_geoseries.geometry)
-
-    def _build_properties_for(self, suburb):
-        num_flight_points = self._get_num_flight_points(suburb)
+        # Get all multi polygons from these suburbs, projected through the source CRS.
+        multi_polygons = [suburb.multi_polygon for suburb in suburbs]
+        if not len(multi_polygons) or self._same_crs:
+            return multi_polygons
+        # Collect the coordinates for every ring in every polygon, in order, into a single list of arrays. For each polygon, also remember how many interior rings it has.
+        ring_coords = []
+        polygon_num_interiors = []
+        for multi_polygon in multi_polygons:
+            for polygon in multi_polygon.geoms:
+                ring_coords.append(numpy.asarray(polygon.exterior.coords)[:, :2])
+                ring_coords.extend(numpy.asarray(interior.coords)[:, :2] for interior in polygon.interiors)
+                polygon_num_interiors.append(len(polygon.interiors))
+        # Concatenate all coordinates and transform them from the source to the target CRS in a single call.
+        all_coords = numpy.concatenate(ring_coords)
+        transformer = get_transformer(self._source_crs, self._target_crs)
+        xs, ys = transformer.transform(all_coords[:, 0], all_coords[:, 1])
+        transformed_coords = numpy.column_stack((xs, ys,))
+        # Split the transformed coordinates back into their rings, then rebuild each multi polygon from those rings.
+        ring_offsets = numpy.cumsum([len(coords) for coords in ring_coords[:-1]])
+        transformed_rings = iter(numpy.split(transformed_coords, ring_offsets))
+        num_interiors = iter(polygon_num_interiors)
+        transformed_geometries = []
+        for multi_polygon in multi_polygons:
+            polygons = []
+            for _ in multi_polygon.geoms:
+                exterior = next(transformed_rings)
+                interiors = [next(transformed_rings) for _ in range(next(num_interiors))]
+                polygons.append(geometry.Polygon(exterior, interiors))
+            transformed_geometries.append(geometry.MultiPolygon(polygons))
+        return transformed_geometries
+
+    def _get_exterior_coordinates(self, multi_polygons):
+        # Collect the exterior coordinates for every polygon in every multi polygon, in order, into a single list of arrays.
+        exterior_coords = [numpy.asarray(polygon.exterior.coords)[:, :2] for multi_polygon in multi_polygons for polygon in multi_polygon.geoms]
+        if not len(exterior_coords):
+            return [[] for multi_polygon in multi_polygons]
+        # Convert all coordinates to nested lists at once, rounded to the same 6 decimal places geojson geometries are, then slice that list back into each exterior.
+        all_coords = numpy.concatenate(exterior_coords).round(6).tolist()
+        exteriors = []
+        offset = 0
+        for coords in exterior_coords:
+            exteriors.append(all_coords[offset:offset+len(coords)])
+            offset += len(coords)
+        # Finally, group the exteriors by the multi polygon they belong to.
+        exteriors = iter(exteriors)
+        return [[next(exteriors) for _ in multi_polygon.geoms] for multi_polygon in multi_polygons]
+
+    def _build_properties_for(self, suburb, num_flight_points):
         # Construct a properties dictionary.
         properties = {
             "name": suburb.name,
@@ -273,15 +466,19 @@ class SuburbsToGeoJson():
         }
         return properties
 
-    def _get_num_flight_points(self, suburb):
-        # If show only aircraft is 'all', just return the number of flight points.
-        if self._show_only_aircraft == "all":
-            return suburb.num_flight_points
-        # Otherwise, perform a new query that joins and counts the number of flight points, but only where the aircraft responsible appears in the show only aircraft list.
-        return db.session.query(func.count(models.FlightPoint.flight_point_hash))\
-            .filter(models.FlightPoint.suburb_hash == suburb.suburb_hash)\
-            .filter(models.FlightPoint.aircraft_icao.in_(self._show_only_aircraft))\
-            .scalar()
+    def _get_num_flight_points(self, suburbs):
+        # Return a dictionary mapping each suburb's hash to its number of flight points, in a single grouped query.
+        if not len(suburbs):
+            return {}
+        num_flight_points_q = db.session.query(models.FlightPoint.suburb_hash, func.count(models.FlightPoint.flight_point_hash))\
+            .filter(models.FlightPoint.suburb_hash.in_([ suburb.suburb_hash for suburb in suburbs ]))
+        # If show only aircraft is not 'all', only count flight points where the aircraft responsible appears in the show only aircraft list.
+        if self._show_only_aircraft != "all":
+            num_flight_points_q = num_flight_points_q\
+                .filter(models.FlightPoint.aircraft_icao.in_(self._show_only_aircraft))
+        return dict(num_flight_points_q\
+            .group_by(models.FlightPoint.suburb_hash)\
+            .all())
 
 
 def geojson_suburbs_within_view(crs, bounding_box_extent, zoom, **kwargs):
@@ -308,24 +505,25 @@ def geojson_suburbs_within_view(crs, bounding_box_extent, zoom, **kwargs):
         should_dump = kwargs.get("should_dump", True)
 
         # Get the source CRS; the user's view input is projected through this.
-        source_crs = pyproj.crs.CRS.from_user_input(crs)
+        source_crs = get_crs(crs)
         # Get the target CRS; this is what we will project the user inputs through to perform calculations.
-        target_crs = pyproj.crs.CRS.from_user_input(config.COORDINATE_REF_SYS)
-        # If source and target do not match, we will need to transform.
-        if source_crs != target_crs:
+        target_crs = get_crs(config.COORDINATE_REF_SYS)
+        # Compare the two just once; if source and target do not match, we will need to transform.
+        same_crs = source_crs == target_crs
+        if not same_crs:
             # Transform the values in bbox to match our current CRS.
-            transformer = pyproj.Transformer.from_crs(source_crs, target_crs, always_xy = True)
+            transformer = get_transformer(crs, config.COORDINATE_REF_SYS)
             bounding_box_extent = transformer.transform_bounds(*bounding_box_extent)
         # First, produce a Polygon from the bounding box extent.
         view_polygon = geometry.box(*bounding_box_extent)
-        # Instantiate our suburb view intersection.
-        suburb_container = GeospatialSuburbViewIntersection()
+        # Get our shared suburb view.
+        suburb_container = _get_or_build_suburb_view()
         # Locate all suburbs within this view.
         located_suburbs = suburb_container.locate_suburbs_within_view(view_polygon, config.COORDINATE_REF_SYS)
         # Now instantiate a suburbs to geojson instance. Remember, we want to SWAP the CRSs here, as we wish to transform the located suburbs back to an appropriate
         # CRS for the user's input.
         suburbs_to_geojson = SuburbsToGeoJson(target_crs, source_crs,
-            show_only_aircraft = show_only_aircraft)
+            show_only_aircraft = show_only_aircraft, same_crs = same_crs)
         # Return the GeoJSON for this view.
         return suburbs_to_geojson.get_geojson(located_suburbs, dump = should_dump)
     except Exception as e:
@@ -333,6 +531,8 @@ def geojson_suburbs_within_view(crs, bounding_box_extent, zoom, **kwargs):
 
 
 class GeospatialFlightPointLocationResult():
+    __slots__ = ("_crs", "_num_flight_points", "_flight_points_tuple", "_result_dict", "_num_geolocated", "_num_overwritten_geolocated", "_num_skipped", "_num_error", "_started", "_ended",)
+
     @property
     def seconds_taken(self):
         """Returns the total seconds taken to geolocate this result. If either is None, None is returned."""
@@ -350,19 +550,19 @@ class GeospatialFlightPointLocationResult():
 
     @property
     def num_geolocated(self):
-        return len(list(filter(lambda outcome: outcome["was_successful"] == True, self._result_dict.values())))
+        return self._num_geolocated
 
     @property
     def num_overwritten_geolocated(self):
-        return len(list(filter(lambda outcome: outcome["was_skipped"] == True, self._result_dict.values())))
+        return self._num_overwritten_geolocated
 
     @property
     def num_skipped(self):
-        return len(list(filter(lambda outcome: outcome["was_skipped"] == True, self._result_dict.values())))
+        return self._num_skipped
 
     @property
     def num_error(self):
-        return len(list(filter(lambda outcome: not outcome["was_successful"] and not outcome["was_skipped"], self._result_dict.values())))
+        return self._num_error
 
     @property
     def outcome_dictionary(self):
@@ -373,7 +573,12 @@ class GeospatialFlightPointLocationResult():
         self._num_flight_points = len(_flight_points_tuple)
         self._flight_points_tuple = _flight_points_tuple
         # Build the dictionary itself, key will be the flight point, and value will (for now) be an empty dictionary.
-        self._result_dict = dict((flight_point, {}) for flight_point in self._flight_points_tuple)
+        self._result_dict = { flight_point: {} for flight_point in self._flight_points_tuple }
+        # Tallies for each outcome, maintained as results are set.
+        self._num_geolocated = 0
+        self._num_overwritten_geolocated = 0
+        self._num_skipped = 0
+        self._num_error = 0
         # Time started and ended.
         self._started = None
         self._ended = None
@@ -381,8 +586,41 @@ class GeospatialFlightPointLocationResult():
     def set_result_for(self, flight_point, result_dict):
         if not flight_point in self._result_dict:
             raise Exception("no-flight-point-in-result")
+        # Remove the tallies for any previous result for this flight point, then add those for the new one.
+        self._tally_result(self._result_dict[flight_point], -1)
+        self._tally_result(result_dict, 1)
         self._result_dict[flight_point] = result_dict
 
+    def set_results(self, results):
+        """
+        Set the result for many flight points at once, in order. Each result is given as a tuple of the flight point, whether it was successful, whether it was skipped,
+        whether it was overwritten, the methodology and the coordinates.
+
+        Arguments
+        ---------
+        :results: A list of result tuples.
+        """
+        for flight_point, was_successful, was_skipped, overwritten, methodology, coordinates in results:
+            self.set_result_for(flight_point, {
+                "was_successful": was_successful,
+                "was_skipped": was_skipped,
+                "overwritten": overwritten,
+                "methodology": methodology,
+                "coordinates": coordinates
+            })
+
+    def _tally_result(self, result_dict, amount):
+        if not result_dict:
+            return
+        if result_dict["was_successful"]:
+            self._num_geolocated += amount
+            if result_dict.get("overwritten", False):
+                self._num_overwritten_geolocated += amount
+        elif result_dict["was_skipped"]:
+            self._num_skipped += amount
+        else:
+            self._num_error += amount
+
     def set_started(self):
         self._started = time.time()
         self._ended = None
@@ -405,9 +643,17 @@ class GeospatialFlightPointLocator():
     def _current_flight_point(self):
         return self._flight_points[self._glob_index]
 
+    @property
+    def _current_point_xy(self):
+        return self._points_xy[self._glob_index]
+
     @property
     def _current_point_geometry(self):
-        return self._points_geometry[self._glob_index]
+        # Build a Point for the current flight point from our coordinates array, only once per index.
+        if self._current_point_geometry_index != self._glob_index:
+            self._current_point_geometry_cached = geometry.Point(self._points_xy[self._glob_index])
+            self._current_point_geometry_index = self._glob_index
+        return self._current_point_geometry_cached
 
     def __init__(self, _flight_points = None, **kwargs):
         """
@@ -441,10 +687,15 @@ class GeospatialFlightPointLocator():
         # If we were given flight points, prepare them.
         if _flight_points:
             self.prepare_flight_points(_flight_points)
-        # Make a map for Suburb instances to suburb polygons, so we don't have to reconstruct polygons that have already been created.
+        # Make a map for Suburb instances to prepared suburb polygons, so we don't have to reconstruct polygons that have already been created.
         self._suburb_polygon_map = {}
         # Make a map for State to state containers.
         self._states = {}
+        # Make a map for an EPSG to all its suburbs, and another for an EPSG and state code to all potential suburbs, and their bounding boxes.
+        self._suburbs_by_epsg = {}
+        self._potential_suburbs_by_epsg = {}
+        # The UTM EPSG for each flight point, determined when geolocation begins.
+        self._points_epsg = []
         # Extract evidence from keyword arguments.
         self._last_suburb = last_suburb or None
         self._last_state = last_suburb.state if last_suburb else None
@@ -488,11 +739,17 @@ class GeospatialFlightPointLocator():
             if not self._crs:
                 LOG.error(f"Failed to find common CRS, even still!")
                 raise error.InvalidCRSError("GeospatialFlightPointLocator-flight-point-no-crs")
-        # Based on this flight points tuple, we'll now generate a Point geometry for each, and save that to a tuple as well.
-        #self._points_geometry = tuple([ geometry.Point(flight_point.longitude, flight_point.latitude) for flight_point in self._flight_points ])
-        self._points_geometry = tuple([ flight_point.position for flight_point in self._flight_points ])
-        # Initialise a new result object for this set of flight points.
+        # Based on this flight points tuple, we'll now read the XY coordinates of each position into a single array of shape (N, 2), in the same order. A Point geometry
+        # is only built from this for the flight point currently being geolocated. Flight points without a position are given NaN coordinates, which are contained by nothing.
+        positions = [ flight_point.position for flight_point in self._flight_points ]
+        self._points_xy = numpy.fromiter(
+            (coordinate for position in positions for coordinate in (position.coords[0][:2] if position else (numpy.nan, numpy.nan,))),
+            dtype = numpy.float64, count = 2*self._num_flight_points).reshape(-1, 2)
+        self._current_point_geometry_index = None
+        self._current_point_geometry_cached = None
+        # Initialise a new result object for this set of flight points, along with a list for results reported, but not yet set on it.
         self._result = GeospatialFlightPointLocationResult(self._flight_points, self._crs)
+        self._pending_results = []
         # Set geolocation complete to False and flight points prepared to True.
         self._geolocation_complete = False
         self._flight_points_prepared = True
@@ -524,62 +781,66 @@ class GeospatialFlightPointLocator():
             return self._geolocate_via_postgis()
         # Set the result started.
         self._result.set_started()
+        # Determine the UTM EPSG for every flight point at once, in case any point must be searched for by its EPSG.
+        self._points_epsg = self._get_points_epsg()
         # Otherwise, we'll default back to our classic algorithm.
         for flight_point_idx, flight_point in enumerate(self._flight_points):
             try:
                 # Constantly update flight point index.
                 self._glob_index = flight_point_idx
                 # If the current flight point already HAS a suburb, and overwriting is false, we can skip. But prior to skipping, we'll save this point's suburb as last suburb.
-                if self._current_flight_point.suburb and not self._overwrite_existing:
-                    LOG.debug(f"Skipping geolocation of {self._current_flight_point}, suburb is already set and we have not been instructed to overwrite.")
-                    self._last_suburb = self._current_flight_point.suburb
+                if flight_point.suburb and not self._overwrite_existing:
+                    LOG.debug("Skipping geolocation of %s, suburb is already set and we have not been instructed to overwrite.", flight_point)
+                    self._last_suburb = flight_point.suburb
                     self._last_state = self._last_suburb.state
                     continue
                 # Now, setup some data per each flight point.
                 suburb_point_in = None
                 # If we have a last suburb, check whether this point is in that suburb, or whether this point is in a neighbour of that suburb. Receive back the suburb in which the point is in; set suburb_point_in.
                 if self._last_suburb:
-                    LOG.debug(f"Attempting to locate suburb for {self._current_flight_point} from last suburb {self._last_suburb}")
+                    LOG.debug("Attempting to locate suburb for %s from last suburb %s", flight_point, self._last_suburb)
                     suburb_point_in = self._exact_suburb_containing(self._last_suburb)
                     if suburb_point_in:
-                        LOG.debug(f"Successfully located suburb for {self._current_flight_point} by using last suburb {self._last_suburb}")
+                        LOG.debug("Successfully located suburb for %s by using last suburb %s", flight_point, self._last_suburb)
                     else:
-                        LOG.debug(f"Failed to find suburb for {self._current_flight_point} by using last suburb {self._last_suburb}")
+                        LOG.debug("Failed to find suburb for %s by using last suburb %s", flight_point, self._last_suburb)
                 # If suburb point in is None, but we have a last state, locate all potential suburbs given an EPSG, filtered by the last state. Receive back the suburb in which the point is in; set suburb_point_in.
                 if not suburb_point_in and self._last_state:
-                    LOG.debug(f"Attempting to locate suburb for {self._current_flight_point} from last state {self._last_state}")
+                    LOG.debug("Attempting to locate suburb for %s from last state %s", flight_point, self._last_state)
                     suburb_point_in = self._exact_suburb_by_epsg(state_code = self._last_state.state_code)
                     if suburb_point_in:
-                        LOG.debug(f"Successfully located suburb for {self._current_flight_point} by using last state {self._last_state}")
+                        LOG.debug("Successfully located suburb for %s by using last state %s", flight_point, self._last_state)
                     else:
-                        LOG.debug(f"Failed to find suburb for {self._current_flight_point} by using last state {self._last_state}")
+                        LOG.debug("Failed to find suburb for %s by using last state %s", flight_point, self._last_state)
                 # If suburb point in is None, perform a state-wide (all states) search for the closest state, then closest suburb, then the suburb the point is actually in. Receive back the suburb in which the point is in; set suburb_point_in.
                 if not suburb_point_in:
-                    LOG.debug(f"Attempting to locate suburb for {self._current_flight_point} from nowhere (no state bias...)")
+                    LOG.debug("Attempting to locate suburb for %s from nowhere (no state bias...)", flight_point)
                     suburb_point_in = self._exact_suburb_by_epsg()
                     if suburb_point_in:
-                        LOG.debug(f"Successfully located suburb for {self._current_flight_point} from nowhere!!")
+                        LOG.debug("Successfully located suburb for %s from nowhere!!", flight_point)
                     else:
-                        LOG.debug(f"Failed to find suburb for {self._current_flight_point} from nowhere. Are you sure geospatial data for suburbs is imported?")
+                        LOG.debug("Failed to find suburb for %s from nowhere. Are you sure geospatial data for suburbs is imported?", flight_point)
                 # Now, upon success, we will attach suburb_point_in to the current flight point, then continue.
                 # Otherwise, if we weren't able to locate the point, we should either kill this process, or continue; depending on config.
                 if suburb_point_in:
-                    LOG.debug(f"Attaching suburb for {self._current_flight_point} to suburb {suburb_point_in}")
-                    self._current_flight_point.suburb = suburb_point_in
+                    LOG.debug("Attaching suburb for %s to suburb %s", flight_point, suburb_point_in)
+                    flight_point.suburb = suburb_point_in
                     continue
                 else:
                     # Raise search exhausted.
                     raise error.SuburbSearchExhausted("search-exhausted")
             except error.SuburbSearchExhausted as sse:
-                LOG.error(f"Unable to find suburb for {self._current_flight_point}. Coordinates; {self._current_flight_point.geodetic_point}")
+                LOG.error(f"Unable to find suburb for {flight_point}. Coordinates; {flight_point.geodetic_point}")
                 # Save a summary of this failure to the result.
-                self._report_failed_flight_point_result(coordinates = self._current_flight_point.geodetic_point)
+                self._report_failed_flight_point_result(coordinates = flight_point.geodetic_point)
                 # For now, we'll just continue.
                 continue
+        # Set all results reported during geolocation.
+        self._set_pending_results()
         # Now, we'll print some debug information, or assemble a receipt object.
         self._result.set_ended()
         self._geolocation_complete = True
-        LOG.debug(f"Completed flight point geolocation for {self._num_flight_points}!")
+        LOG.debug("Completed flight point geolocation for %s!", self._num_flight_points)
         # We'll return our current result.
         return self._result
 
@@ -590,12 +851,15 @@ class GeospatialFlightPointLocator():
         """
         try:
             state_code = kwargs.get("state_code", None)
-            # First, determine EPSG for the current point geometry.
-            epsg = calculations.epsg_code_for(*self._current_point_geometry.coords[0], self._crs)
-            # Now, collect all potential suburbs based on this EPSG, providing the state's code for further filtering.
-            potential_suburbs = self._find_potential_suburbs_by_epsg(epsg, state_code = state_code)
-            # Now, iterate each potential suburb, checking whether any of them contains the current point.
-            for potential_suburb in potential_suburbs:
+            # First, get the EPSG for the current point geometry.
+            epsg = self._points_epsg[self._glob_index]
+            # Now, collect all potential suburbs based on this EPSG, providing the state's code for further filtering, along with an array of their bounding boxes.
+            potential_suburbs, potential_bbox_array = self._find_potential_suburbs_by_epsg(epsg, state_code = state_code)
+            # Narrow these down to only those suburbs whose bounding box contains the current point. Bounds are stored as integers, so allow a single unit either side.
+            point_x, point_y = self._current_point_xy
+            bbox_mask = (potential_bbox_array[:, 0]-1 <= point_x) & (potential_bbox_array[:, 2]+1 >= point_x) & (potential_bbox_array[:, 1]-1 <= point_y) & (potential_bbox_array[:, 3]+1 >= point_y)
+            # Now, iterate each remaining potential suburb, checking whether any of them contains the current point.
+            for potential_suburb in (potential_suburbs[idx] for idx in numpy.flatnonzero(bbox_mask)):
                 if self._does_suburb_contain_point(potential_suburb):
                     # Get the exact resulting suburb now, and set the result for this flight point to 'state'
                     self._report_successful_flight_point_result(found_from = "state-epsg")
@@ -620,7 +884,7 @@ class GeospatialFlightPointLocator():
         resulting_suburb = None
         if self._does_suburb_contain_point(suburb):
             # This suburb does contain the current point.
-            LOG.debug(f"Determined that {self._current_flight_point} is contained by {suburb}, which is the primary suburb passed to _exact_suburb_containing!")
+            LOG.debug("Determined that %s is contained by %s, which is the primary suburb passed to _exact_suburb_containing!", self._current_flight_point, suburb)
             if suburb == self._last_suburb:
                 self._report_successful_flight_point_result(found_from = "exact-last-suburb")
             else:
@@ -630,7 +894,7 @@ class GeospatialFlightPointLocator():
             # The target suburb may be a neighbour for the given suburb. Attempt to locate this now with a loop.
             for neighbour_suburb in suburb.neighbours:
                 if self._does_suburb_contain_point(neighbour_suburb):
-                    LOG.debug(f"Determined that {self._current_flight_point} is contained by {neighbour_suburb}, which is a neighbour of primary suburb {suburb}")
+                    LOG.debug("Determined that %s is contained by %s, which is a neighbour of primary suburb %s", self._current_flight_point, neighbour_suburb, suburb)
                     self._report_successful_flight_point_result(found_from = "neighbour-last-suburb")
                     resulting_suburb = neighbour_suburb
                     break
@@ -640,53 +904,89 @@ class GeospatialFlightPointLocator():
         return resulting_suburb
 
     def _does_suburb_contain_point(self, suburb):
-        # Attempt to get the suburb polygon from our existing polygon map. If it does not exist, then construct it.
-        suburb_polygon = self._suburb_polygon_map.get(suburb, None)
-        if not suburb_polygon:
-            suburb_polygon = suburb.multi_polygon
-            # Store this suburb polygon.
-            self._suburb_polygon_map[suburb] = suburb_polygon
-        # Now, simply call contains with our current point geometry.
-        return suburb_polygon.contains(self._current_point_geometry)
+        # Attempt to get the prepared suburb polygon from our existing polygon map. If it does not exist, then construct and prepare it. Preparing the polygon indexes
+        # its edges, which makes each subsequent containment test against it far cheaper; and the same suburbs are tested over and over for consecutive points.
+        prepared_suburb_polygon = self._suburb_polygon_map.get(suburb, None)
+        if prepared_suburb_polygon is None:
+            prepared_suburb_polygon = prepared.prep(suburb.multi_polygon)
+            # Store this prepared suburb polygon.
+            self._suburb_polygon_map[suburb] = prepared_suburb_polygon
+        # Now, simply test whether the polygon properly contains our current point geometry. Points essentially never sit exactly on a suburb's boundary, and doing so
+        # skips the boundary checks a plain contains test would perform.
+        return prepared_suburb_polygon.contains_properly(self._current_point_geometry)
+
+    def _get_points_epsg(self):
+        """
+        Return a list of the UTM EPSG for every flight point, in the same order, computed from our coordinates array in a single call. Flight points without a position
+        are given None.
+        """
+        has_position = ~numpy.isnan(self._points_xy[:, 0])
+        points_epsg = [None] * self._num_flight_points
+        if has_position.any():
+            points_xy = self._points_xy[has_position]
+            epsg_codes = calculations.epsg_codes_for(points_xy[:, 0], points_xy[:, 1], transformer = get_geodetic_transformer(self._crs))
+            for idx, epsg in zip(numpy.flatnonzero(has_position).tolist(), epsg_codes.tolist()):
+                points_epsg[idx] = epsg
+        return points_epsg
 
     def _find_potential_suburbs_by_epsg(self, epsg, **kwargs):
+        """
+        Return a tuple of all suburbs associated with the given EPSG, optionally filtered by state, alongside an array of their bounding boxes of shape (N, 4), in the same
+        order. The first time any EPSG is required, suburbs for every EPSG among all flight points are loaded in a single query; these are kept for the lifetime of this locator.
+
+        Keyword arguments
+        -----------------
+        :state_code: The code for the state to filter potential suburbs by. Default is None.
+        """
         state_code = kwargs.get("state_code", None)
-        potential_suburb_q = db.session.query(models.Suburb)\
+        potential_suburbs_key = (epsg, state_code,)
+        if not potential_suburbs_key in self._potential_suburbs_by_epsg:
+            # If suburbs for this EPSG have not yet been loaded, load them now, along with those for every other EPSG among all flight points not yet loaded.
+            if not epsg in self._suburbs_by_epsg:
+                self._load_suburbs_by_epsg({ epsg, *(point_epsg for point_epsg in self._points_epsg if point_epsg is not None) })
+            potential_suburbs = self._suburbs_by_epsg[epsg]
+            if state_code:
+                potential_suburbs = tuple(suburb for suburb in potential_suburbs if suburb.state_code == state_code)
+            potential_bbox_array = numpy.asarray([ suburb.bbox for suburb in potential_suburbs ], dtype = numpy.float64).reshape(-1, 4)
+            self._potential_suburbs_by_epsg[potential_suburbs_key] = (potential_suburbs, potential_bbox_array,)
+        return self._potential_suburbs_by_epsg[potential_suburbs_key]
+
+    def _load_suburbs_by_epsg(self, epsgs):
+        """
+        Load all suburbs associated with each of the given EPSGs that have not yet been loaded, in a single query, and group them by EPSG.
+
+        Arguments
+        ---------
+        :epsgs: A set of EPSG codes.
+        """
+        epsgs = [ epsg for epsg in epsgs if not epsg in self._suburbs_by_epsg ]
+        suburbs_by_epsg = { epsg: [] for epsg in epsgs }
+        suburb_epsgs = db.session.query(models.Suburb, models.SuburbUTMEPSG.utmepsg_epsg)\
             .join(models.SuburbUTMEPSG, models.SuburbUTMEPSG.suburb_hash == models.Suburb.suburb_hash)\
-            .filter(models.SuburbUTMEPSG.utmepsg_epsg == epsg)
-        if state_code:
-            potential_suburb_q = potential_suburb_q\
-                .filter(models.Suburb.state_code == state_code)
-        return potential_suburb_q.all()
+            .filter(models.SuburbUTMEPSG.utmepsg_epsg.in_(epsgs))\
+            .all()
+        for suburb, epsg in suburb_epsgs:
+            suburbs_by_epsg[epsg].append(suburb)
+        self._suburbs_by_epsg.update((epsg, tuple(suburbs),) for epsg, suburbs in suburbs_by_epsg.items())
 
     def _geolocate_via_postgis(self):
-        def find_state_for(flight_point):
-            return db.session.query(models.State)\
-                .filter(func.ST_Contains(models.State.multi_polygon_geom, shape.from_shape(flight_point.position, srid = self._crs)))\
-                .first()
-
-        def find_suburb_for(state, flight_point):
-            return db.session.query(models.Suburb)\
-                .filter(models.Suburb.state_code == state.state_code)\
-                .filter(func.ST_Contains(models.Suburb.multi_polygon_geom, shape.from_shape(flight_point.position, srid = self._crs)))\
-                .first()
-
         # Set the result started.
         self._result.set_started()
-        # Variable to hold state last located, as a hint.
-        last_located_state = None
+        # Variable to hold the suburb last located, as a hint.
         last_located_suburb = None
+        # A dictionary for the suburb containing each flight point, by index, that has been looked up in the database thus far. None if no suburb contains that point.
+        located_suburbs = {}
         for flight_point_idx, flight_point in enumerate(self._flight_points):
             try:
                 # Constantly update flight point index.
                 self._glob_index = flight_point_idx
                 # If the current flight point already HAS a suburb, and overwriting is false, we can skip. But prior to skipping, we'll save this point's suburb as last suburb.
-                if self._current_flight_point.suburb and not self._overwrite_existing:
-                    LOG.debug(f"Skipping geolocation of {self._current_flight_point}, suburb is already set and we have not been instructed to overwrite.")
+                if flight_point.suburb and not self._overwrite_existing:
+                    LOG.debug("Skipping geolocation of %s, suburb is already set and we have not been instructed to overwrite.", flight_point)
                     continue
                 # If current flight point does not have a position, fail this point and continue.
                 if not flight_point.position:
-                    LOG.debug(f"Skipping geolocation of {self._current_flight_point}, no flight point position set.")
+                    LOG.debug("Skipping geolocation of %s, no flight point position set.", flight_point)
                     raise error.SuburbSearchExhausted("flight-point-without-position")
                 # Now, setup some data per each flight point.
                 suburb_point_in = None
@@ -695,69 +995,96 @@ class GeospatialFlightPointLocator():
                     suburb_point_in = last_located_suburb
                 else:
                     last_located_suburb = None
-                    # If we have no last state, find one now.
-                    if not last_located_state:
-                        last_located_state = find_state_for(flight_point)
-                        # If no state could be located, it perhaps has not been imported, or the aircraft is over the sea.
-                        if not last_located_state:
-                            raise error.SuburbSearchExhausted("not-in-any-state")
-                    # If we have a last located state, attempt to locate the flight point in any suburb in that state.
-                    suburb_point_in = find_suburb_for(last_located_state, flight_point)
+                    # If this point has not yet been looked up, look up the suburbs for a batch of points starting at this one.
+                    if not flight_point_idx in located_suburbs:
+                        located_suburbs.update(self._find_suburbs_containing_points_from(flight_point_idx))
+                    suburb_point_in = located_suburbs.get(flight_point_idx, None)
                     if not suburb_point_in:
-                        # If we were not able to find the suburb in that state, attempt to look for a new state.
-                        last_located_state = find_state_for(flight_point)
-                        if not last_located_state:
-                            # No longer a state, the aircraft has perhaps since flown over sea or into a state not imported.
-                            raise error.SuburbSearchExhausted("not-in-any-state-anymore")
-                        # Finally, attempt to find flight point in latest located state.
-                        suburb_point_in = find_suburb_for(last_located_state, flight_point)
-                        if not suburb_point_in:
-                            # Aircraft is in this state, but no suburb could be established. Is the suburb itself imported?
-                            raise error.SuburbSearchExhausted("in-state-no-suburb")
+                        # No suburb contains this point. The aircraft has perhaps flown over sea or into a state not imported.
+                        raise error.SuburbSearchExhausted("not-in-any-suburb")
                 # Now, upon success, we will attach suburb_point_in to the current flight point, then continue.
                 # Otherwise, if we weren't able to locate the point, we should either kill this process, or continue; depending on config.
                 if suburb_point_in:
                     last_located_suburb = suburb_point_in
-                    LOG.debug(f"Attaching suburb for {self._current_flight_point} to suburb {suburb_point_in}")
-                    self._current_flight_point.suburb = suburb_point_in
+                    LOG.debug("Attaching suburb for %s to suburb %s", flight_point, suburb_point_in)
+                    flight_point.suburb = suburb_point_in
                     self._report_successful_flight_point_result(found_from = "postgis")
                     continue
                 # Raise search exhausted.
                 raise error.SuburbSearchExhausted("search-exhausted")
             except error.SuburbSearchExhausted as sse:
-                LOG.error(f"Unable to find suburb for {self._current_flight_point}. Coordinates; {self._current_flight_point.geodetic_point} Reason {sse.error_code}")
+                LOG.error(f"Unable to find suburb for {flight_point}. Coordinates; {flight_point.geodetic_point} Reason {sse.error_code}")
                 # Save a summary of this failure to the result.
-                self._report_failed_flight_point_result(coordinates = self._current_flight_point.geodetic_point)
+                self._report_failed_flight_point_result(coordinates = flight_point.geodetic_point)
                 # For now, we'll just continue.
                 continue
+        # Set all results reported during geolocation.
+        self._set_pending_results()
         # Now, we'll print some debug information, or assemble a receipt object.
         self._result.set_ended()
         self._geolocation_complete = True
-        LOG.debug(f"Completed flight point geolocation for {self._num_flight_points}!")
+        LOG.debug("Completed flight point geolocation for %s!", self._num_flight_points)
         # We'll return our current result.
         return self._result
 
+    def _find_suburbs_containing_points_from(self, start_idx):
+        """
+        Locate the suburb containing each flight point with a position, in a batch of up to POSTGIS_GEOLOCATION_BATCH_SIZE points starting at the given index. All points in the
+        batch are sent as a single VALUES table, and joined against all suburbs containing them in one query.
+
+        Arguments
+        ---------
+        :start_idx: The index of the first flight point in the batch.
+
+        Returns
+        -------
+        A dictionary, mapping the index of every flight point in the batch to the Suburb containing it, or None if no suburb does.
+        """
+        # Get the index for every point in the batch; that is, every point with a position, which are those whose coordinates are not NaN.
+        batch_points_xy = self._points_xy[start_idx:start_idx+config.POSTGIS_GEOLOCATION_BATCH_SIZE]
+        batch_indices = (numpy.flatnonzero(~numpy.isnan(batch_points_xy[:, 0]))+start_idx).tolist()
+        # Build a VALUES table of each index alongside its coordinates.
+        points_table = values(
+            column("idx", Integer), column("x", Float), column("y", Float),
+            name = "points"
+        )\
+        .data([ (idx, *self._points_xy[idx].tolist(),) for idx in batch_indices ])
+        point_geom = func.ST_SetSRID(func.ST_MakePoint(points_table.c.x, points_table.c.y), self._crs)
+        # Now, join each point to the hash of all suburbs containing it. Only the hashes are selected, since a single suburb will usually contain many points in the batch.
+        containing_suburb_hashes = db.session.query(points_table.c.idx, models.Suburb.suburb_hash)\
+            .select_from(points_table)\
+            .join(models.Suburb, func.ST_Contains(models.Suburb.multi_polygon_geom, point_geom))\
+            .all()
+        located_suburb_hashes = dict.fromkeys(batch_indices)
+        for idx, suburb_hash in containing_suburb_hashes:
+            # Should more than one suburb contain this point, use the first.
+            if located_suburb_hashes[idx] is None:
+                located_suburb_hashes[idx] = suburb_hash
+        # Load each distinct suburb found just once, then map each point's index to its Suburb.
+        distinct_suburb_hashes = { suburb_hash for suburb_hash in located_suburb_hashes.values() if suburb_hash is not None }
+        suburbs_by_hash = {}
+        if len(distinct_suburb_hashes):
+            suburbs_by_hash = dict((suburb.suburb_hash, suburb,) for suburb in db.session.query(models.Suburb)
+                .filter(models.Suburb.suburb_hash.in_(distinct_suburb_hashes))
+                .all())
+        return dict((idx, suburbs_by_hash.get(suburb_hash, None),) for idx, suburb_hash in located_suburb_hashes.items())
+
     def _find_common_crs(self):
-        # Variable for holding an EPSG code for the common CRS among all flight points. If any are different, this class will raise an exception for now.
+        # Locate the common CRS among all flight points. If any are different, or any flight point does not have a CRS, this class will raise an exception for now.
         self._crs = None
-        common_crs = None
-        # Iterate all flight points.
-        for flight_point in self._flight_points:
-            if not flight_point.crs:
-                LOG.error(f"TODO")
-                raise NotImplementedError("implement errors on FlightPointsManager()!")
-                raise Exception("flight-point-no-crs")
-            # Otherwise, if flight point has a CRS and common CRS is None, set common CRS and continue.
-            if not common_crs:
-                common_crs = flight_point.crs
-                continue
-            # Finally, if we've gotten to this point, ensure flight point's CRS matches the common CRS. If not, raise an exception.
-            if common_crs != flight_point.crs:
-                LOG.error(f"TODO")
-                raise NotImplementedError("implement errors on FlightPointsManager()!")
-                raise Exception("flight-point-crs-mismatch")
+        # Collect the set of every CRS among all flight points in a single pass.
+        all_crs = { flight_point.crs for flight_point in self._flight_points }
+        if not all(all_crs):
+            LOG.error(f"TODO")
+            raise NotImplementedError("implement errors on FlightPointsManager()!")
+            raise Exception("flight-point-no-crs")
+        # Ensure there is exactly one CRS. If not, raise an exception.
+        if len(all_crs) > 1:
+            LOG.error(f"TODO")
+            raise NotImplementedError("implement errors on FlightPointsManager()!")
+            raise Exception("flight-point-crs-mismatch")
         # Finally, set the instance level common CRS to this CRS.
-        self._crs = common_crs
+        self._crs = next(iter(all_crs), None)
 
     def _report_successful_flight_point_result(self, overwritten = False, **kwargs):
         """
@@ -803,14 +1130,13 @@ class GeospatialFlightPointLocator():
         was_skipped = kwargs.get("was_skipped", False)
         coordinates = kwargs.get("coordinates", None)
 
-        # Set the result. This will overwrite any previous results.
-        self._result.set_result_for(self._current_flight_point, dict(
-            was_successful = was_successful,
-            was_skipped = was_skipped,
-            overwritten = overwritten,
-            methodology = found_from,
-            coordinates = coordinates
-        ))
+        # Queue the result; all queued results are set on the result object at once when geolocation completes, and will overwrite any previous results.
+        self._pending_results.append((self._current_flight_point, was_successful, was_skipped, overwritten, found_from, coordinates,))
+
+    def _set_pending_results(self):
+        """Set all queued results on the result object, in the order they were reported, then clear the queue."""
+        self._result.set_results(self._pending_results)
+        self._pending_results = []
 
 
 class FlightPointGeolocationReceipt():
@@ -966,6 +1292,27 @@ def geolocate_suburbs_for(flight_points, **kwargs):
         raise e
 
 
+def subdivide_suburbs():
+    """
+    Ensure a subdivided geometry exists for every suburb, when PostGIS is enabled. Each suburb's geometry that has not yet been subdivided will be split with ST_Subdivide
+    into parts of no more than SUBURB_SUBDIVISION_MAX_VERTICES vertices, and each part stored as a SuburbSubdivision. Suburbs can't be updated, so existing parts are kept.
+    """
+    if not config.POSTGIS_ENABLED:
+        return
+    # Select every part of each suburb that does not yet have any subdivisions.
+    subdivided_suburbs_stmt = select(
+        models.Suburb.suburb_hash,
+        func.ST_Subdivide(models.Suburb.multi_polygon_geom, config.SUBURB_SUBDIVISION_MAX_VERTICES)
+    )\
+    .where(~exists().where(models.SuburbSubdivision.suburb_hash == models.Suburb.suburb_hash))
+    # Insert all these parts in a single statement.
+    insert_subdivisions_stmt = (
+        insert(models.SuburbSubdivision.__table__)
+        .from_select(["suburb_hash", "geom_part"], subdivided_suburbs_stmt)
+    )
+    db.session.execute(insert_subdivisions_stmt)
+
+
 class GeospatialSuburbContainer():
     """
     A container for a list of Suburb instances, that will automatically create an STRtree and facilitate queries for intersection by other suburbs on a borders basis,
@@ -999,32 +1346,46 @@ class GeospatialSuburbContainer():
         """
         self._precise_suburb_boundaries = kwargs.get("precise_suburb_boundaries", False)
         self._force_without_postgis = kwargs.get("force_without_postgis", False)
-
+        # Make a tuple out of our suburbs list, to ensure its order and size is immutable.
+        self._all_suburbs = tuple(_all_suburbs)
+        # Map each suburb's hash to its index in the tuple above.
+        self._index_by_suburb_hash = dict((suburb_.suburb_hash, idx,) for idx, suburb_ in enumerate(self._all_suburbs))
+        # True once this container has ensured all suburbs are subdivided. This is only relevant when PostGIS is enabled.
+        self._suburbs_subdivided = False
         # This preparation only need be undertaken if we do not have PostGIS enabled in the current configuration.
         if not config.POSTGIS_ENABLED or self._force_without_postgis:
-            # Make a tuple out of our suburbs list, to ensure its order and size is immutable.
-            self._all_suburbs = tuple(_all_suburbs)
             # First, convert all suburbs to Polygons. If we must use precise boundaries, this will take longer but we'll construct polygons from the actual coordinates for each suburb.
             if self._precise_suburb_boundaries:
                 LOG.debug(f"Constructing GeospatialSuburbContainer for {len(self._all_suburbs)} suburbs using PRECISE boundaries, this may take a while. Starting by building a polygon from each provided suburb...")
                 self._all_suburbs_polygons = [ suburb_.multi_polygon for suburb_ in self._all_suburbs ]
+                # The STRtree only compares bounding boxes, so precise boundaries also require an exact intersection test against each candidate. Prepare each polygon
+                # for this, since every polygon will be tested many times.
+                self._all_suburbs_prepared = [ prepared.prep(suburb_polygon) for suburb_polygon in self._all_suburbs_polygons ]
+                # Each pair of polygons will be tested from both sides, so cache the result of each test by its pair of indices; smallest first.
+                self._polygon_pair_intersects = {}
             else:
                 # Otherwise, we'll construct these polygons from a minimum rotated rectangle determined by the suburb's bounding box.
                 LOG.debug(f"Constructing GeospatialSuburbContainer for {len(self._all_suburbs)} suburbs using minimum rotated rect boundaries. Starting by building a polygon from each provided suburb...")
                 self._all_suburbs_polygons = [ geometry.box(*suburb_.bbox) for suburb_ in self._all_suburbs ]
-            # Now, create a lookup for a polygon's ID given its index. This index is relative to the _all_suburbs list.
-            LOG.debug(f"Constructing suburb polygon identity dict for {len(self._all_suburbs)}...")
-            self._index_by_id = dict((id(polygon), idx) for idx, polygon in enumerate(self._all_suburbs_polygons))
-            # Now setup the STRtree.
+            # Now setup the STRtree. Since no items are given, querying items from the tree will return each polygon's index, which is relative to the _all_suburbs list.
             LOG.debug(f"Setting up an STRtree for all suburb polygons...")
             self._suburb_strtree = strtree.STRtree(self._all_suburbs_polygons)
 
     def locate_neighbours_for(self, suburb):
         if config.POSTGIS_ENABLED and not self._force_without_postgis:
             # PostGIS enabled. We'll therefore be querying all interecting suburbs. Precise suburb bounaries are not utilised when PostGIS is enabled.
+            # Rather than intersecting entire suburb geometries, intersect each part of the target suburb's subdivided geometry with the parts of all other suburbs. These parts
+            # are created by subdivide_suburbs when suburbs are imported, but ensure they exist for any suburb created otherwise.
+            self._ensure_suburbs_subdivided()
+            target_part = aliased(models.SuburbSubdivision)
+            neighbour_part = aliased(models.SuburbSubdivision)
+            neighbour_suburb_hashes_q = db.session.query(neighbour_part.suburb_hash)\
+                .join(target_part, func.ST_Intersects(target_part.geom_part, neighbour_part.geom_part))\
+                .filter(target_part.suburb_hash == suburb.suburb_hash)\
+                .filter(neighbour_part.suburb_hash != suburb.suburb_hash)\
+                .distinct()
             neighbour_suburbs = db.session.query(models.Suburb)\
-                .filter(models.Suburb.suburb_hash != suburb.suburb_hash)\
-                .filter(func.ST_Intersects(models.Suburb.multi_polygon_geom, suburb.multi_polygon_geom))\
+                .filter(models.Suburb.suburb_hash.in_(neighbour_suburb_hashes_q))\
                 .all()
             return neighbour_suburbs
         else:
@@ -1036,14 +1397,110 @@ class GeospatialSuburbContainer():
                 target_suburb_polygon = geometry.box(*suburb.bbox)
             # Buffer the target suburb polygon by 300 meters.
             # Query for all intersecting polygons given our target suburb polygon.
-            neighbour_polygons = [ (self._index_by_id[id(polygon)], polygon) for polygon in self._suburb_strtree.query(target_suburb_polygon) ]
-            # Query the corresponding Suburb instances for each ID returned.
-            neighbour_suburbs = [ self._all_suburbs[neighbour_polygon[0]] for neighbour_polygon in neighbour_polygons ]
-            # Now, filter out the target suburb.
-            neighbour_suburbs = list(filter(lambda suburb_: suburb_ != suburb, neighbour_suburbs))
+            neighbour_indices = self._suburb_strtree.query_items(target_suburb_polygon)
+            target_suburb_idx = self._index_by_suburb_hash.get(suburb.suburb_hash, None)
+            # If boundaries are precise, keep only those candidates that actually intersect the target suburb.
+            if self._precise_suburb_boundaries:
+                if target_suburb_idx is not None:
+                    neighbour_indices = [ idx for idx in neighbour_indices if idx == target_suburb_idx or self._do_polygons_intersect(target_suburb_idx, idx) ]
+                else:
+                    neighbour_indices = [ idx for idx in neighbour_indices if self._all_suburbs_prepared[idx].intersects(target_suburb_polygon) ]
+            # Get the corresponding Suburb instances for each index returned, filtering out the target suburb by its index.
+            neighbour_suburbs = [ self._all_suburbs[idx] for idx in neighbour_indices if idx != target_suburb_idx ]
         # Finally, return the neighbours list.
         return neighbour_suburbs
 
+    def locate_all_neighbours(self):
+        """
+        Locate the neighbours of every suburb in this container at once. With PostGIS, this is a single query intersecting the subdivided geometries of all contained
+        suburbs. Otherwise, the STRtree is queried with each contained polygon in turn.
+
+        Returns
+        -------
+        A list of tuples; (suburb hash, neighbour suburb hash), one for each neighbour relationship found.
+        """
+        if config.POSTGIS_ENABLED and not self._force_without_postgis:
+            self._ensure_suburbs_subdivided()
+            neighbour_pairs = db.session.execute(self._select_all_neighbour_pairs())\
+                .all()
+            return [ tuple(neighbour_pair) for neighbour_pair in neighbour_pairs ]
+        else:
+            # Query the tree with each polygon, this produces the indices of all its neighbours; excluding the polygon itself. If boundaries are precise, each candidate
+            # must also actually intersect the polygon.
+            return [ (self._all_suburbs[idx].suburb_hash, self._all_suburbs[neighbour_idx].suburb_hash)
+                for idx, suburb_polygon in enumerate(self._all_suburbs_polygons)
+                for neighbour_idx in self._suburb_strtree.query_items(suburb_polygon)
+                if neighbour_idx != idx and (not self._precise_suburb_boundaries or self._do_polygons_intersect(idx, neighbour_idx)) ]
+
+    def upsert_all_neighbours(self):
+        """
+        Locate the neighbours of every suburb in this container, and ensure a neighbour relationship exists for each. With PostGIS, neighbour pairs are inserted
+        directly from the query that locates them, so they never leave the database. Otherwise, the pairs located by locate_all_neighbours are upserted.
+        """
+        if config.POSTGIS_ENABLED and not self._force_without_postgis:
+            self._ensure_suburbs_subdivided()
+            insert_suburb_neighbours_stmt = (
+                insert(models.suburb_neighbour)
+                .from_select(["left_suburb_hash", "right_suburb_hash"], self._select_all_neighbour_pairs())
+            ).on_conflict_do_nothing(index_elements = ["left_suburb_hash", "right_suburb_hash"])
+            db.session.execute(insert_suburb_neighbours_stmt)
+        else:
+            upsert_suburb_neighbours(self.locate_all_neighbours())
+
+    def _ensure_suburbs_subdivided(self):
+        """
+        Ensure subdivided parts exist for all suburbs, since neighbours are located solely by intersecting these parts. Suburbs imported by read_suburbs_from are
+        already subdivided, so this will usually insert nothing; it is only run the first time this container queries PostGIS.
+        """
+        if not self._suburbs_subdivided:
+            subdivide_suburbs()
+            self._suburbs_subdivided = True
+
+    def _select_all_neighbour_pairs(self):
+        """
+        Return a select for the suburb hash of every suburb in this container, alongside the suburb hash of each of its neighbours. This requires PostGIS, as it
+        intersects the subdivided geometries of all contained suburbs.
+        """
+        target_part = aliased(models.SuburbSubdivision)
+        neighbour_part = aliased(models.SuburbSubdivision)
+        return select(target_part.suburb_hash, neighbour_part.suburb_hash)\
+            .join(neighbour_part, func.ST_Intersects(target_part.geom_part, neighbour_part.geom_part))\
+            .where(target_part.suburb_hash.in_([ suburb_.suburb_hash for suburb_ in self._all_suburbs ]))\
+            .where(target_part.suburb_hash != neighbour_part.suburb_hash)\
+            .distinct()
+
+    def _do_polygons_intersect(self, idx, other_idx):
+        """
+        Return True if the contained polygons at the two given indices intersect. The result is cached for the pair, regardless of the order of the indices
+        given, so each pair is tested just once.
+        """
+        polygon_pair = (idx, other_idx,) if idx < other_idx else (other_idx, idx,)
+        intersects = self._polygon_pair_intersects.get(polygon_pair, None)
+        if intersects is None:
+            intersects = self._all_suburbs_prepared[polygon_pair[0]].intersects(self._all_suburbs_polygons[polygon_pair[1]])
+            self._polygon_pair_intersects[polygon_pair] = intersects
+        return intersects
+
+
+def upsert_suburb_neighbours(neighbour_pairs):
+    """
+    Ensure a neighbour relationship exists for each given pair of suburb hashes. Relationships are inserted in batches of up to SUBURB_ASSOCIATION_INSERT_BATCH_SIZE,
+    with each batch being a single statement.
+
+    Arguments
+    ---------
+    :neighbour_pairs: A list of tuples; (left suburb hash, right suburb hash).
+    """
+    for neighbour_pairs_chunk in thirdparty.chunks(neighbour_pairs, config.SUBURB_ASSOCIATION_INSERT_BATCH_SIZE):
+        insert_suburb_neighbour_stmt = (
+            insert(models.suburb_neighbour)
+            .values([
+                dict(left_suburb_hash = left_suburb_hash, right_suburb_hash = right_suburb_hash)
+                for left_suburb_hash, right_suburb_hash in neighbour_pairs_chunk
+            ])
+        ).on_conflict_do_nothing(index_elements = ["left_suburb_hash", "right_suburb_hash"])
+        db.session.execute(insert_suburb_neighbour_stmt)
+
 
 def determine_neighbours_for(suburb, **kwargs):
     """
@@ -1064,50 +1521,48 @@ def determine_neighbours_for(suburb, **kwargs):
     -------
     A list of Suburbs that neighbour this suburb.
     """
-    try:
-        suburb_container = kwargs.get("suburb_container", None)
-        precise_suburb_boundaries = kwargs.get("precise_suburb_boundaries", False)
-
-        LOG.debug(f"Refreshing neighbour relationships for Suburb {suburb}...")
-        # If suburb container is None, create one now.
-        if not suburb_container:
-            # Get all suburbs in smae state as suburb.
-            all_suburbs = db.session.query(models.Suburb)\
-                .filter(models.Suburb.state_code == suburb.state_code)\
-                .all()
-            suburb_container = GeospatialSuburbContainer(all_suburbs, precise_suburb_boundaries = precise_suburb_boundaries)
-        neighbour_suburbs = suburb_container.locate_neighbours_for(suburb)
-        LOG.debug(f"{suburb} has {len(neighbour_suburbs)} neighbour suburbs... Ensuring relationships created.")
-        # Upsert those relationships here.
-        for neighbour_suburb in neighbour_suburbs:
-            # For each neighbour suburb, upsert an insert statement for the suburb neighbour table.
-            insert_suburb_neighbour_stmt = (
-                insert(models.suburb_neighbour)
-                .values(
-                    left_suburb_hash = suburb.suburb_hash,
-                    right_suburb_hash = neighbour_suburb.suburb_hash
-                )
-            ).on_conflict_do_nothing(index_elements = ["left_suburb_hash", "right_suburb_hash"])
-            # Execute this insert.
-            db.session.execute(insert_suburb_neighbour_stmt)
-        return neighbour_suburbs
-    except Exception as e:
-        raise e
+    suburb_container = kwargs.get("suburb_container", None)
+    precise_suburb_boundaries = kwargs.get("precise_suburb_boundaries", False)
+
+    LOG.debug("Refreshing neighbour relationships for Suburb %s...", suburb)
+    # If suburb container is None, create one now.
+    if not suburb_container:
+        # Get all suburbs in smae state as suburb. Unless precise boundaries are required, only each suburb's bounding box is used, so don't load their geometries.
+        all_suburbs_q = db.session.query(models.Suburb)\
+            .filter(models.Suburb.state_code == suburb.state_code)
+        if not precise_suburb_boundaries:
+            all_suburbs_q = all_suburbs_q\
+                .options(defer(models.Suburb.multi_polygon_geom))
+        all_suburbs = all_suburbs_q.all()
+        suburb_container = GeospatialSuburbContainer(all_suburbs, precise_suburb_boundaries = precise_suburb_boundaries)
+    neighbour_suburbs = suburb_container.locate_neighbours_for(suburb)
+    LOG.debug("%s has %d neighbour suburbs... Ensuring relationships created.", suburb, len(neighbour_suburbs))
+    # Upsert those relationships here.
+    upsert_suburb_neighbours([ (suburb.suburb_hash, neighbour_suburb.suburb_hash) for neighbour_suburb in neighbour_suburbs ])
+    return neighbour_suburbs
 
 
 def determine_epsg_codes_for_suburb(suburb):
-    # Get the suburb's geometry and CRS.
-    suburb_crs = suburb.crs
-    suburb_geometry = suburb.multi_polygon
-    # Get all EPSG codes for this geometry.
-    epsg_codes = get_epsg_codes_for(suburb_geometry, suburb_crs)
-    # Ensure we've upserted all EPSG codes.
-    upsert_epsg_codes(epsg_codes)
-    # Now, we can simply set EPSG codes for this Suburb.
-    for epsg in epsg_codes:
-        # Create any where an EPSG is not already existing for this suburb.
-        if not epsg in suburb.epsgs:
-            suburb.utm_epsg_suburbs.append(models.SuburbUTMEPSG(utmepsg_epsg = epsg))
+    determine_epsg_codes_for_suburbs([suburb])
+
+
+def determine_epsg_codes_for_suburbs(suburbs):
+    # Get all EPSG codes for the geometries of all suburbs at once.
+    suburbs_epsg_codes = get_epsg_codes_for_suburbs(suburbs)
+    # Ensure we've upserted all EPSG codes found.
+    upsert_epsg_codes(list(dict.fromkeys(epsg for epsg_codes in suburbs_epsg_codes for epsg in epsg_codes)))
+    # Now, upsert an association between each Suburb and each of its EPSG codes, in batches of a single statement each.
+    suburb_epsg_values = [ dict(utmepsg_epsg = epsg, suburb_hash = suburb.suburb_hash)
+        for suburb, epsg_codes in zip(suburbs, suburbs_epsg_codes) for epsg in epsg_codes ]
+    for suburb_epsg_values_chunk in thirdparty.chunks(suburb_epsg_values, config.SUBURB_ASSOCIATION_INSERT_BATCH_SIZE):
+        insert_suburb_epsg_stmt = (
+            insert(models.SuburbUTMEPSG.__table__)
+            .values(suburb_epsg_values_chunk)
+        ).on_conflict_do_nothing(index_elements = ["utmepsg_epsg", "suburb_hash"])
+        db.session.execute(insert_suburb_epsg_stmt)
+    # These associations were inserted beneath the ORM, so expire each suburb's EPSG collection; it will be reloaded when next accessed.
+    for suburb in suburbs:
+        db.session.expire(suburb, ["utm_epsg_suburbs"])
 
 
 class ReadSuburbsResult():
@@ -1135,47 +1590,39 @@ def read_suburbs_from(relative_dir, **kwargs) -> ReadSuburbsResult:
     -------
     An instance of ReadSuburbsResult.
     """
-    try:
-        process_neighbourships = kwargs.get("process_neighbourships", False)
-
-        # If doesn't exist, raise an error.
-        suburbs_absolute_path = os.path.join(os.getcwd(), relative_dir)
-        if not os.path.isdir(suburbs_absolute_path):
-            LOG.error(f"Failed to locate requested suburbs STATE directory at {suburbs_absolute_path}")
-            raise Exception("no-state-suburbs-dir")
-        LOG.debug(f"Beginning read of suburbs from {suburbs_absolute_path}. ***WARNING*** this may take ages, do NOT run this during uptime!!!!!")
-        # List all files in this directory. Each will be a KML file containing an entire state.
-        state_kml_files = os.listdir(suburbs_absolute_path)
-        LOG.debug(f"Located {len(state_kml_files)} state KML files to import.")
-        asyncio.run(aiogeospatial.import_all_states(suburbs_absolute_path, state_kml_files))
-        # If requested, process neighbourships for all imported states/suburbs.
-        if process_neighbourships:
-            LOG.debug(f"Processing all suburb neighbourships...")
-            # Locate all state codes.
-            state_codes = db.session.query(models.Suburb.state_code)\
-                .group_by(models.Suburb.state_code)\
-                .all()
-            LOG.debug(f"Located {len(state_codes)} state to reprocess...")
-            # Now, iterate the results of a query for all suburbs within each state code...
-            for state_code in state_codes:
-                """Query returns a tuple. Maybe fix this?"""
-                state_code = state_code[0]
-                # Collect all suburbs within this state name.
-                suburbs = db.session.query(models.Suburb)\
-                    .filter(models.Suburb.state_code == state_code)\
-                    .all()
-                LOG.debug(f"Reprocessing all {len(suburbs)} suburbs for state; {state_code}")
-                # Create a container.
-                suburb_container = GeospatialSuburbContainer(suburbs)
-                # Now iterate all suburbs, determining neighbours for each given our suburb container, and
-                for suburb in suburbs:
-                    # Determine EPSGs for each suburb.
-                    determine_epsg_codes_for_suburb(suburb)
-                    # Now, determine neighbours for each suburb.
-                    neighbours_ = determine_neighbours_for(suburb, suburb_container = suburb_container)
-                    """TODO: figure out what result should contain and add it."""
-                    LOG.debug(f"Located {len(neighbours_)} neighbours for {suburb}")
-            # Return a result.
-            return ReadSuburbsResult()
-    except Exception as e:
-        raise e
+    process_neighbourships = kwargs.get("process_neighbourships", False)
+
+    # If doesn't exist, raise an error.
+    suburbs_absolute_path = os.path.join(os.getcwd(), relative_dir)
+    if not os.path.isdir(suburbs_absolute_path):
+        LOG.error(f"Failed to locate requested suburbs STATE directory at {suburbs_absolute_path}")
+        raise Exception("no-state-suburbs-dir")
+    LOG.debug(f"Beginning read of suburbs from {suburbs_absolute_path}. ***WARNING*** this may take ages, do NOT run this during uptime!!!!!")
+    # List all files in this directory. Each will be a KML file containing an entire state.
+    state_kml_files = os.listdir(suburbs_absolute_path)
+    LOG.debug(f"Located {len(state_kml_files)} state KML files to import.")
+    asyncio.run(aiogeospatial.import_all_states(suburbs_absolute_path, state_kml_files))
+    # If PostGIS is enabled, neighbours are located by intersecting subdivided suburb geometries; subdivide all those suburbs just imported.
+    subdivide_suburbs()
+    # If requested, process neighbourships for all imported states/suburbs.
+    if process_neighbourships:
+        LOG.debug(f"Processing all suburb neighbourships...")
+        # Locate all suburbs in a single query, ordered by their state code.
+        all_suburbs = db.session.query(models.Suburb)\
+            .order_by(models.Suburb.state_code)\
+            .all()
+        LOG.debug(f"Located {len(all_suburbs)} suburbs to reprocess...")
+        # Now, iterate these suburbs in groups by their state code...
+        for state_code, state_suburbs in itertools.groupby(all_suburbs, key = lambda suburb_: suburb_.state_code):
+            suburbs = list(state_suburbs)
+            LOG.debug(f"Reprocessing all {len(suburbs)} suburbs for state; {state_code}")
+            # Create a container.
+            suburb_container = GeospatialSuburbContainer(suburbs)
+            # Determine EPSGs for all suburbs in this state at once.
+            determine_epsg_codes_for_suburbs(suburbs)
+            # Determine neighbours for all suburbs in this state at once, upserting those relationships.
+            suburb_container.upsert_all_neighbours()
+            """TODO: figure out what result should contain and add it."""
+            LOG.debug(f"Ensured neighbour relationships for {len(suburbs)} suburbs in state; {state_code}")
+        # Return a result.
+        return ReadSuburbsResult()
@@ -52,20 +52,38 @@ def smart_constitutes_new_flight(aircraft, day, change_descriptor, **kwargs):
         A boolean; whether this constitutes a new flight or not.
         An instance of FlightInaccuracySolution.
     """
-    try:
-        # We will first determine whether we'll bother with this. If solvency disabled, simply return False alongside a solution reporting why.
-        if not config.INACCURACY_SOLVENCY_ENABLED:
-            LOG.warning(f"Flight data inaccuracy solvency is DISABLED, so no investigative action was taken for {change_descriptor} by {aircraft} on {day}.")
-            return False, FlightInaccuracySolution(False, "inaccuracy-solvency-disabled")
-        # Otherwise, begin applying our special case conditionals here.
-        if not change_descriptor.point1_grounded and not change_descriptor.point2_grounded \
-            and change_descriptor.time_difference_seconds > config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_START_AND_END:
-            # New flight detected; sort of a debug catch-all. Criteria; If neither point ends on the ground, but time difference is SIGNIFICANT, just return True since we shouldn't be tracking
-            # an aircraft with that kind of range anyway.
-            return True, FlightInaccuracySolution(True, "catch-all")
-        return False, FlightInaccuracySolution(False, "not-new-flight")
-    except Exception as e:
-        raise e
+    # We will first determine whether we'll bother with this. If solvency disabled, simply return False alongside a solution reporting why.
+    if not config.INACCURACY_SOLVENCY_ENABLED:
+        LOG.warning(f"Flight data inaccuracy solvency is DISABLED, so no investigative action was taken for {change_descriptor} by {aircraft} on {day}.")
+        return False, FlightInaccuracySolution(False, "inaccuracy-solvency-disabled")
+    # Otherwise, begin applying our special case conditionals here.
+    if not change_descriptor.point1_grounded and not change_descriptor.point2_grounded \
+        and change_descriptor.time_difference_seconds > config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_START_AND_END:
+        # New flight detected; sort of a debug catch-all. Criteria; If neither point ends on the ground, but time difference is SIGNIFICANT, just return True since we shouldn't be tracking
+        # an aircraft with that kind of range anyway.
+        return True, FlightInaccuracySolution(True, "catch-all")
+    return False, FlightInaccuracySolution(False, "not-new-flight")
+
+
+def smart_constitutes_new_flight_batch(aircraft, day, change_descriptors, **kwargs):
+    """
+    Apply smart_constitutes_new_flight to each of the given change descriptors, all belonging to the same aircraft and day, in order. If inaccuracy solvency is
+    disabled, this is reported just once for the whole batch.
+
+    Arguments
+    ---------
+    :aircraft:
+    :day:
+    :change_descriptors: A list of change descriptors, each requiring inaccuracy solvency.
+
+    Returns
+    -------
+    A list of tuples, one for each change descriptor and in the same order, each as returned by smart_constitutes_new_flight.
+    """
+    if not config.INACCURACY_SOLVENCY_ENABLED:
+        LOG.warning(f"Flight data inaccuracy solvency is DISABLED, so no investigative action was taken for {len(change_descriptors)} change descriptors by {aircraft} on {day}.")
+        return [(False, FlightInaccuracySolution(False, "inaccuracy-solvency-disabled")) for change_descriptor in change_descriptors]
+    return [smart_constitutes_new_flight(aircraft, day, change_descriptor, **kwargs) for change_descriptor in change_descriptors]
 
 
 def attempt_flight_point_correction(aircraft, flight_point, **kwargs):
@@ -82,11 +100,35 @@ def attempt_flight_point_correction(aircraft, flight_point, **kwargs):
     -------
     The FlightPoint.
     """
-    try:
-        # If the aircraft has a top speed, ensure the ground speed in the flight point does not exceed it.
-        if aircraft.top_speed != None and flight_point.ground_speed != None and flight_point.ground_speed > aircraft.top_speed:
-            LOG.warning(f"Flight point {flight_point} has a ground speed greater than its aircraft's ({aircraft}) top speed, setting it to None! ({flight_point.ground_speed} > {aircraft.top_speed})")
+    # If the aircraft has a top speed, ensure the ground speed in the flight point does not exceed it.
+    if aircraft.top_speed != None and flight_point.ground_speed != None and flight_point.ground_speed > aircraft.top_speed:
+        LOG.warning(f"Flight point {flight_point} has a ground speed greater than its aircraft's ({aircraft}) top speed, setting it to None! ({flight_point.ground_speed} > {aircraft.top_speed})")
+        flight_point.ground_speed = None
+    return flight_point
+
+
+def attempt_flight_points_correction(aircraft, flight_points, **kwargs):
+    """
+    Given an instance of Aircraft, and a list of FlightPoints, run correction logic on each incoming flight point. This is equivalent to calling
+    attempt_flight_point_correction for each flight point, but reads the aircraft's attributes just once.
+
+    Arguments
+    ---------
+    :aircraft: An instance of Aircraft.
+    :flight_points: A list of FlightPoints.
+
+    Returns
+    -------
+    The list of FlightPoints.
+    """
+    top_speed = aircraft.top_speed
+    # If the aircraft has no top speed, there is nothing to correct.
+    if top_speed == None:
+        return flight_points
+    for flight_point in flight_points:
+        # Ensure the ground speed in each flight point does not exceed the aircraft's top speed.
+        ground_speed = flight_point.ground_speed
+        if ground_speed != None and ground_speed > top_speed:
+            LOG.warning("Flight point %s has a ground speed greater than its aircraft's (%s) top speed, setting it to None! (%s > %s)", flight_point, aircraft, ground_speed, top_speed)
             flight_point.ground_speed = None
-        return flight_point
-    except Exception as e:
-        raise e
+    return flight_points
@@ -10,6 +10,7 @@ import decimal
 import hashlib
 import logging
 import json
+import numpy
 import geojson
 import geopandas
 import pyproj
@@ -48,47 +49,32 @@ class FlightPointInterpolator():
         if len(self._flight_points) == 0:
             LOG.error(f"Failed to prepare flight points for interpolation; there are no flight points provided.")
             raise error.NoFlightPointsError(_aircraft, "No flight points given.")
-        # A dictionary for tracking duplicates.
-        duplicates_report = dict(
-            aircraft_icao = self._aircraft.icao,
-            duplicates = dict()
-        )
         LOG.debug(f"Preparing flight points for interpolation. First step is to remove all duplicate positions, and replace them with None.")
-        previous_position = None
-        num_duplicates = 0
-        for flight_point in self._flight_points:
-            # If flight point does not have a position, continue.
-            if not flight_point.is_position_valid:
-                continue
-            elif not previous_position:
-                # If flight point has a position, but the previous saved position is None, use that as previous and continue.
-                previous_position = flight_point.position
-                continue
-            # Otherwise, we have a previous position and current flight point is not None. We'll test if the current flight point's position is IDENTICAL to the previous position.
-            if flight_point.position == previous_position:
-                # These positions are the same. This probably means current flight point position is a duplicate.
-                # Increment duplicates.
-                num_duplicates+=1
-                # Log this, and set it to None.
-                LOG.warning(f"Set position for flight point has {flight_point.flight_point_hash} belonging to aircraft {self._aircraft} to None! It is a duplicate! ({previous_position} duplicated {duplicates} times.)")
-                flight_point.clear_position()
-            else:
-                # Log this in report.
-                duplicates_report["duplicates"][previous_position] = num_duplicates
-                # Otherwise, positions are different, change previous to match current.
-                previous_position = flight_point.position
-                # Also set number of duplicates counted to 0.
-                num_duplicates = 0
+        num_flight_points = len(self._flight_points)
+        # Read each flight point's position just once, since every read deserialises its geometry. Then produce an array of XY coordinates, where those without a
+        # valid position are given NaN.
+        positions = [ flight_point.position if flight_point.is_position_valid else None for flight_point in self._flight_points ]
+        has_position = numpy.fromiter((position is not None for position in positions), dtype = bool, count = num_flight_points)
+        positions_xy = numpy.full((num_flight_points, 2,), numpy.nan)
+        if has_position.any():
+            positions_xy[has_position] = [ (position.x, position.y,) for position in positions if position is not None ]
+        # For each flight point, find the index of the closest flight point before it that has a position, or -1 if there is none.
+        last_position_idx = numpy.maximum.accumulate(numpy.where(has_position, numpy.arange(num_flight_points), -1))
+        previous_position_idx = numpy.concatenate(([-1], last_position_idx[:-1],))
+        # A flight point's position is a duplicate if it is IDENTICAL to that previous position. This probably means the aircraft did not report a new position.
+        is_duplicate = has_position & (previous_position_idx >= 0) & (positions_xy == positions_xy[previous_position_idx]).all(axis = 1)
+        for idx in numpy.flatnonzero(is_duplicate):
+            flight_point = self._flight_points[idx]
+            # Log this, and set it to None.
+            LOG.warning("Set position for flight point %s belonging to aircraft %s to None! It is a duplicate of %s!", flight_point.flight_point_hash, self._aircraft, positions[idx])
+            flight_point.clear_position()
 
 
 def find_duplicate_positions(aircraft, day, **kwargs):
     """
 
     """
-    try:
-        pass
-    except Exception as e:
-        raise e
+    pass
 
 
 def correct_duplicate_positions(aircraft, day, **kwargs):
@@ -106,10 +92,7 @@ def correct_duplicate_positions(aircraft, day, **kwargs):
     -------
     All FlightPoints modified.
     """
-    try:
-        pass
-    except Exception as e:
-        raise e
+    pass
 
 
 def interpolate_aircraft_day():
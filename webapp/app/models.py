@@ -179,10 +179,26 @@ class MultiPolygonGeometryMixin(EPSGWrapperMixin):
     def multi_polygon_geom(self):
         """Represents a column for a geometry of type MultiPolygon"""
         if config.POSTGIS_ENABLED:
-            return db.Column(Geometry("MULTIPOLYGON", srid = config.COORDINATE_REF_SYS, management = config.POSTGIS_MANAGEMENT))
+            # The default GiST spatial index is not created for this column, an SP-GiST index is declared in table args instead.
+            return db.Column(Geometry("MULTIPOLYGON", srid = config.COORDINATE_REF_SYS, management = config.POSTGIS_MANAGEMENT, spatial_index = False))
         else:
             return db.Column(db.LargeBinary(length=(2**24)-1), default = None, nullable = True)
 
+    @declared_attr
+    def __table_args__(cls):
+        """
+        If PostGIS is enabled, index the multipolygon geometry with SP-GiST rather than GiST. Queries against this column are point in polygon tests, where an SP-GiST
+        index is both quicker and smaller. This requires PostGIS 3 or later.
+        """
+        if config.POSTGIS_ENABLED:
+            return (
+                db.Index(
+                    f"idx_{cls.__tablename__}_multi_polygon_geom",
+                    "multi_polygon_geom",
+                    postgresql_using = "spgist"),
+            )
+        return ()
+
     @property
     def multi_polygon(self) -> geometry.MultiPolygon:
         if not self.multi_polygon_geom:
@@ -286,6 +302,13 @@ class Flight(db.Model):
         uselist = True,
         lazy = "dynamic")
 
+    __table_args__ = (
+        db.Index(
+            "idx_flight_aircraft_icao",
+            aircraft_icao,
+            postgresql_using = "btree"),
+    )
+
     def __repr__(self):
         if not self.first_point or not self.last_point:
             return f"Flight<{self.aircraft}, ***NEW FLIGHT***>"
@@ -634,6 +657,8 @@ class FlightPoint(PointGeometryMixin, db.Model):
     which is a blake2b hash of the aircraft's icao, timestamp, position and altitude.
     """
     __tablename__ = "flight_point"
+    # The tag identifying flight points within a flights timeline; see KIND_FLIGHT_POINT in flights.
+    KIND = 3
 
     flight_point_id         = db.Column(db.Integer, primary_key = True)
     aircraft_icao           = db.Column(db.String(12), db.ForeignKey("aircraft.icao"))
@@ -884,7 +909,7 @@ class Aircraft(db.Model):
     def flight_time_total(self):
         """Return the total number of minutes of flight time for this Aircraft."""
         # Filter all flights where total flight time is None.
-        valid_flights = list(filter(lambda flight: flight.flight_time_total != None, self.flights))
+        valid_flights = [ flight for flight in self.flights if flight.flight_time_total != None ]
         # Now return a sum of a comprehended list of all flight times from all flights.
         return sum([ flight.flight_time_total for flight in valid_flights ])
 
@@ -898,7 +923,7 @@ class Aircraft(db.Model):
     def flight_time_prohibited(self):
         """Return the number of minutes of flight time during prohibited hours for this Aircraft."""
         # Filter all flights where flight time prohibited is None.
-        valid_flights = list(filter(lambda flight: flight.flight_time_prohibited != None, self.flights))
+        valid_flights = [ flight for flight in self.flights if flight.flight_time_prohibited != None ]
         # Now return a sum of a comprehended list of all flight times from all flights.
         return sum([ flight.flight_time_prohibited for flight in valid_flights ])
 
@@ -912,7 +937,7 @@ class Aircraft(db.Model):
     def distance_travelled(self):
         """Return the total number of meters this Aircraft has travelled."""
         # Filter all flights where total distance travelled is None.
-        valid_flights = list(filter(lambda flight: flight.distance_travelled != None, self.flights))
+        valid_flights = [ flight for flight in self.flights if flight.distance_travelled != None ]
         # Now return a sum of a comprehended list of all distances from all flights.
         return sum([ flight.distance_travelled for flight in valid_flights ])
 
@@ -926,7 +951,7 @@ class Aircraft(db.Model):
     def distance_travelled_kilometers(self):
         """Return the total number of kilometers this Aircraft has travelled."""
         # Filter all flights where total distance travelled (kilometers) is None.
-        valid_flights = list(filter(lambda flight: flight.distance_travelled_kilometers != None, self.flights))
+        valid_flights = [ flight for flight in self.flights if flight.distance_travelled_kilometers != None ]
         # Now return a sum of a comprehended list of all distances from all flights.
         return sum([ flight.distance_travelled_kilometers for flight in valid_flights ])
 
@@ -939,7 +964,7 @@ class Aircraft(db.Model):
     @hybrid_property
     def total_carbon_emissions(self):
         """Return the total number of kilograms of co2 emitted by this aircraft."""
-        valid_flights = list(filter(lambda flight: flight.total_co2_emissions != None, self.flights))
+        valid_flights = [ flight for flight in self.flights if flight.total_co2_emissions != None ]
         return round(sum([flight.total_co2_emissions for flight in valid_flights]))
 
     @total_carbon_emissions.expression
@@ -951,7 +976,7 @@ class Aircraft(db.Model):
     def total_fuel_used(self):
         """Return the total estimated amount of fuel, in gallons, used by this aircraft."""
         # Filter all flights where total fuel used is None.
-        valid_flights = list(filter(lambda flight: flight.fuel_used != None, self.flights))
+        valid_flights = [ flight for flight in self.flights if flight.fuel_used != None ]
         # Now return a sum of a comprehended list of all fuel used from all flights.
         return sum([ flight.fuel_used for flight in valid_flights ])
 
@@ -1212,6 +1237,28 @@ class Suburb(SuburbGeometryMixin, db.Model):
             .first()
 
 
+class SuburbSubdivision(db.Model):
+    """
+    A single part of a Suburb's geometry, as produced by ST_Subdivide, such that no part has more than SUBURB_SUBDIVISION_MAX_VERTICES vertices. This is only populated
+    when PostGIS is enabled; intersection queries between suburbs are far quicker against these smaller parts, since each has a much tighter bounding box.
+    """
+    __tablename__ = "suburb_subdivision"
+
+    subdivision_id          = db.Column(db.Integer, primary_key = True)
+    suburb_hash             = db.Column(db.String(32), db.ForeignKey("suburb.suburb_hash", ondelete = "CASCADE"), nullable = False, index = True)
+
+    @declared_attr
+    def geom_part(self):
+        """Represents a column for this part's geometry. This is a generic geometry, since a subdivided part of a polygon may itself be a multipolygon."""
+        if config.POSTGIS_ENABLED:
+            return db.Column(Geometry("GEOMETRY", srid = config.COORDINATE_REF_SYS, management = config.POSTGIS_MANAGEMENT))
+        else:
+            return db.Column(db.LargeBinary(length=(2**24)-1), default = None, nullable = True)
+
+    def __repr__(self):
+        return f"SuburbSubdivision<{self.suburb_hash},{self.subdivision_id}>"
+
+
 class State(PointGeometryMixin, MultiPolygonGeometryMixin, db.Model):
     """
     Represents a single State.
@@ -341,6 +341,16 @@ def import_suburb_data(from_tar):
             delete_directory(temporary_suburbs_absolute_dir)
 
 
+@application.cli.command("subdivide-suburbs", help = "Subdivides the geometry of every suburb not yet subdivided, for PostGIS neighbour queries. Suburb importation already does this.")
+def subdivide_suburbs():
+    if not config.POSTGIS_ENABLED:
+        LOG.warning(f"Not subdividing suburbs, PostGIS is not enabled.")
+        return
+    LOG.debug(f"Subdividing all suburbs that have not yet been subdivided...")
+    geospatial.subdivide_suburbs()
+    db.session.commit()
+
+
 @application.cli.command("revise-flights", help = "Searches for all aircraft/days where flights data has not yet been verified and processes them.")
 def revise_flights_data():
     # Searches for and revises flight data for all aircraft/day instances where history verified is True but flights verified is False.
@@ -6,7 +6,7 @@ from datetime import date, datetime, timedelta
 from flask import url_for
 from tests.conftest import BaseWorkerAPICase, BaseUserAPICase
 
-from app import db, config, models, airvehicles, radarworker, traces, flights, user
+from app import db, cache, config, models, airvehicles, radarworker, traces, flights, user
 
 
 class TestUserAPI(BaseUserAPICase):
@@ -330,6 +330,72 @@ class TestAircraftAPI(BaseWorkerAPICase):
             self.assertIn("airportCode", target_vehicles[0])
 
 
+class TestCachedAircraftAPI(BaseWorkerAPICase):
+    """
+    Forces the test app instance to use an in-process cache, rather than no cache at all. This ensures cached pages and their invalidation can be tested.
+    """
+    def create_app(self):
+        self._cache_type = config.CACHE_TYPE
+        config.CACHE_TYPE = "SimpleCache"
+        return super().create_app()
+
+    def tearDown(self):
+        super().tearDown()
+        config.CACHE_TYPE = self._cache_type
+
+    def test_submit_new_flight_invalidates_cache(self):
+        """
+        Read JSON from aircrafts_7c68b7_t1.json. Sub the aircraft's flight points twice; the first being the entire first flight, the second being most of the second flight.
+        Submit the first sub, ensure there is 1 flight, then get the page of all flights and the page of flights for this aircraft; ensure that flight is displayed on both.
+        Submit the second sub, ensure there are 2 flights, then get both pages again; ensure both flights are now displayed on both, and not served from the cache.
+        """
+        radar_workers = radarworker.read_radar_workers_from("worker.conf")
+        radar_worker = radar_workers[0]
+        with open(os.path.join(os.getcwd(), config.IMPORTS_DIR, "native_testdata", "aircraft_7c68b7_t1.json"), "r") as f:
+            aircraft_json = json.loads(f.read())
+        self.set_date_today(date(2022, 7, 29))
+        # The first flight is 0 -> 470, the second is 470 -> 1054.
+        flight_points_sub1 = aircraft_json["FlightPoints"][:470]
+        flight_points_sub2 = aircraft_json["FlightPoints"][470:1000]
+
+        with self.app.test_client(user = radar_worker) as client:
+            # Submit the first flight.
+            aircraft_json["FlightPoints"] = flight_points_sub1
+            aircraft_request = client.post(url_for("api.aircraft"),
+                data = json.dumps(aircraft_json),
+                content_type = "application/json"
+            )
+            self.assertEqual(aircraft_request.status_code, 200)
+            # Ensure there is 1 flight.
+            all_flights = models.Flight.query.all()
+            self.assertEqual(len(all_flights), 1)
+            # Get all flights, and the flights for this aircraft. Ensure the flight is displayed on both, and these pages are now cached.
+            for flights_url in [url_for("frontend.flights_overview"), url_for("frontend.aircraft_flights", aircraft_icao = aircraft_json["icao"])]:
+                flights_request = client.get(flights_url)
+                self.assertEqual(flights_request.status_code, 200)
+                self.assertIn(url_for("frontend.flight_overview", flight_hash = all_flights[0].flight_hash), flights_request.get_data(as_text = True))
+            self.assertIsNotNone(cache.get(flights.flights_page_cache_key(1)))
+            self.assertIsNotNone(cache.get(flights.flights_page_cache_key(1, aircraft_json["icao"])))
+
+            # Submit the second flight.
+            aircraft_json["FlightPoints"] = flight_points_sub2
+            aircraft_request = client.post(url_for("api.aircraft"),
+                data = json.dumps(aircraft_json),
+                content_type = "application/json"
+            )
+            self.assertEqual(aircraft_request.status_code, 200)
+            # Ensure there are now 2 flights.
+            all_flights = models.Flight.query.all()
+            self.assertEqual(len(all_flights), 2)
+            # Get all flights, and the flights for this aircraft again. Ensure both flights are displayed on both.
+            for flights_url in [url_for("frontend.flights_overview"), url_for("frontend.aircraft_flights", aircraft_icao = aircraft_json["icao"])]:
+                flights_request = client.get(flights_url)
+                self.assertEqual(flights_request.status_code, 200)
+                flights_html = flights_request.get_data(as_text = True)
+                for flight in all_flights:
+                    self.assertIn(url_for("frontend.flight_overview", flight_hash = flight.flight_hash), flights_html)
+
+
 class TestComprehensiveSubmissions(BaseWorkerAPICase):
     def test_7c4ef5_t1(self):
         # Read all radar workers, get the second one.
@@ -203,6 +203,65 @@ class TestFlightPartial(BaseCase):
         forwards = list(iter(flights.AircraftDayIterator(aircraft, dates[1], flights.AircraftDayIterator.FORWARD)))
         self.assertEqual(len(forwards), 0)
 
+        # Start on 25/06/2022 and iterate forwards once more. Ensure the flight points prefetched for 26/06/2022 match those on the aircraft present day.
+        aircraft_day_iterator = flights.AircraftDayIterator(aircraft, dates[0], flights.AircraftDayIterator.FORWARD)
+        aircraft_day = next(iter(aircraft_day_iterator))
+        self.assertEqual(aircraft_day_iterator.get_flight_points(aircraft_day), aircraft_day.all_flight_points)
+
+    def test_make_partial_flights_boundaries(self):
+        """
+        On this date, 7c68b7 flew 3 separate flights. Ensure each partial flight made for this day begins and ends at exactly the flight points on either side of each
+        new flight, and that between them, all flight points on the day are included exactly once.
+        """
+        aircraft, dates = self._load_native_test_data("aircraft_7c68b7_t1.json")
+        db.session.flush()
+        daily_flights_view = flights.DailyFlightsView.from_args(aircraft, date(2022, 7, 29), aircraft.flight_points_from_day(date(2022, 7, 29)))
+        # Expect 3 partials.
+        self.assertEqual(daily_flights_view.num_partial_flights, 3)
+        # Each partial's first timestamp, last timestamp and number of flight points.
+        expected_partials = [
+            (1659053010.21, 1659056058.57, 470),
+            (1659061773.63, 1659065478.63, 584),
+            (1659074049.06, 1659078314.5, 654)
+        ]
+        for partial_flight, (starts_at, ends_at, num_flight_points) in zip(daily_flights_view.partial_flights, expected_partials):
+            self.assertAlmostEqual(float(partial_flight.first_point.timestamp), starts_at, places = 2)
+            self.assertAlmostEqual(float(partial_flight.last_point.timestamp), ends_at, places = 2)
+            self.assertEqual(partial_flight.num_flight_points, num_flight_points)
+
+    def test_make_partial_flights_inaccuracy_solvency(self):
+        """
+        Construct a day from two stretches of 20 airborne flight points each, separated by over 5 hours. Neither side of this gap is on the ground, so the change between
+        them requires inaccuracy solvency. With solvency enabled, this gap is long enough to be considered a new flight, and so we expect 2 partials. With solvency
+        disabled, no new flight is ever determined for such a change, and so we expect just 1.
+        """
+        with open(os.path.join(os.getcwd(), config.IMPORTS_DIR, "native_testdata", "aircraft_7c68b7_t1.json"), "r") as f:
+            aircraft_json = json.loads(f.read())
+        # Points 200 -> 219 are from the first flight, and 1300 -> 1319 from the third; all are airborne.
+        flight_points_d = aircraft_json["FlightPoints"][200:220] + aircraft_json["FlightPoints"][1300:1320]
+        aircraft, flight_points, synchronised_flight_points = self._submit_flight_point_dicts(aircraft_json, flight_points_d)
+        day_flight_points = aircraft.flight_points_from_day(date(2022, 7, 29))
+        self.assertEqual(len(day_flight_points), 40)
+
+        # With solvency enabled, expect 2 partials, divided at the gap.
+        config.INACCURACY_SOLVENCY_ENABLED = True
+        daily_flights_view = flights.DailyFlightsView.from_args(aircraft, date(2022, 7, 29), day_flight_points)
+        self.assertEqual(daily_flights_view.num_partial_flights, 2)
+        first_partial, second_partial = daily_flights_view.partial_flights
+        self.assertEqual(first_partial.num_flight_points, 20)
+        self.assertAlmostEqual(float(first_partial.first_point.timestamp), 1659054312.8, places = 2)
+        self.assertAlmostEqual(float(first_partial.last_point.timestamp), 1659054365.71, places = 2)
+        self.assertEqual(second_partial.num_flight_points, 20)
+        self.assertAlmostEqual(float(second_partial.first_point.timestamp), 1659074919.41, places = 2)
+        self.assertAlmostEqual(float(second_partial.last_point.timestamp), 1659075141.4, places = 2)
+
+        # With solvency disabled, expect a single partial containing every point.
+        config.INACCURACY_SOLVENCY_ENABLED = False
+        daily_flights_view = flights.DailyFlightsView.from_args(aircraft, date(2022, 7, 29), day_flight_points)
+        self.assertEqual(daily_flights_view.num_partial_flights, 1)
+        self.assertEqual(daily_flights_view.partial_flights[0].num_flight_points, 40)
+        config.INACCURACY_SOLVENCY_ENABLED = True
+
     def test_attempt_find_suitable_partial_for(self):
         """
         Point index 469 is the last point for the first flight on this day.
@@ -262,6 +321,17 @@ class TestFlightPartial(BaseCase):
         self.assertIsInstance(located_partial, flights.PartialFlight)
         self.assertEqual(located_partial, daily_flights_view.partial_flights[1])
 
+        # Now, test the boundaries of locating a partial. A sequence beginning exactly on the start of a partial should locate that partial.
+        first_partial, second_partial = daily_flights_view.partial_flights
+        self.assertEqual(daily_flights_view.locate_partial_with(first_partial.flight_points[:10]), first_partial)
+        self.assertEqual(daily_flights_view.locate_partial_with(second_partial.flight_points), second_partial)
+        # A sequence that ends before the first partial even starts should not locate any partial.
+        flight_points_before = [ models.FlightPoint(flight_point_hash = uuid.uuid4().hex, timestamp = decimal.Decimal(str(first_partial.starts_at))-(100+idx)) for idx in range(3, 0, -1) ]
+        self.assertIsNone(daily_flights_view.locate_partial_with(flight_points_before))
+        # A sequence that begins after the last partial starts, sub4 in this case, should locate the last partial; since there is no next partial to end before.
+        flight_points_after = [ models.FlightPoint(flight_point_hash = uuid.uuid4().hex, timestamp = decimal.Decimal(str(flight_point_d["timestamp"]))) for flight_point_d in flight_points_sub4 ]
+        self.assertEqual(daily_flights_view.locate_partial_with(flight_points_after), second_partial)
+
     def test_attempt_find_suitable_partial_for_v1(self):
         """
         """
@@ -827,6 +897,87 @@ class TestFlightRevisionPartialFlights(FlightRevisionBase):
         self.assertEqual(partial_flights[3].is_complete_flight, False)
 
 
+class TestNewFlightCriteria(BaseCase):
+    """
+    DailyFlightsView evaluates new flight criteria for all of a day's change descriptors at once, whereas FlightPointChangeDescriptor evaluates a single change. For
+    each day in various native flight data inputs, ensure both always agree.
+    """
+    def _assert_new_flight_criteria_agree_for(self, filename):
+        aircraft, dates = self._load_native_test_data(filename)
+        db.session.flush()
+        for date_ in dates:
+            daily_flights_view = flights.DailyFlightsView.from_args(aircraft, date_, aircraft.flight_points_from_day(date_))
+            new_flight_candidates = set(daily_flights_view._new_flight_candidates)
+            for idx, change_descriptor in enumerate(daily_flights_view._change_descriptors):
+                # Evaluate the same change on a fresh descriptor, such that the result from the daily flights view is not used.
+                single_change_descriptor = flights.FlightPointChangeDescriptor(change_descriptor.flight_point1, change_descriptor.flight_point2)
+                try:
+                    constitutes_new_flight = single_change_descriptor.constitutes_new_flight
+                    requires_solvency = False
+                except error.FlightChangeInaccuracySolvencyRequired as fcisr:
+                    constitutes_new_flight = False
+                    requires_solvency = True
+                # The change must be a new flight candidate in the view if, and only if, it is either a new flight or requires solvency.
+                self.assertEqual(idx in new_flight_candidates, constitutes_new_flight or requires_solvency)
+                # If solvency is not required, the view must have set the same result on its own descriptor.
+                if not requires_solvency:
+                    self.assertEqual(change_descriptor._constitutes_new_flight, constitutes_new_flight)
+
+    def test_new_flight_criteria_thresholds(self):
+        """
+        Construct changes with time differences exactly at, and just beyond, each threshold. Ensure that, for each, a single change descriptor and the bulk criteria
+        agree on both whether the change constitutes a new flight and whether it requires solvency.
+        """
+        base_timestamp = decimal.Decimal("1659053010.210")
+        # Each change; point #1 grounded, point #2 grounded, time difference, and the expected new flight and solvency results.
+        changes = [
+            (True, True, config.TIME_DIFFERENCE_NEW_FLIGHT_GROUNDED, False, False),
+            (True, True, config.TIME_DIFFERENCE_NEW_FLIGHT_GROUNDED+0.001, True, False),
+            (True, False, config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_START, False, False),
+            (True, False, config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_START+0.001, True, False),
+            (False, True, config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_END, False, False),
+            (False, True, config.TIME_DIFFERENCE_NEW_FLIGHT_MID_AIR_END+0.001, True, False),
+            (False, False, config.TIME_DIFFERENCE_INACCURACY_CHECK_REQUIRED-0.001, False, False),
+            (False, False, config.TIME_DIFFERENCE_INACCURACY_CHECK_REQUIRED, False, True)
+        ]
+        for point1_grounded, point2_grounded, time_difference, expected_new_flight, expected_solvency in changes:
+            flight_point1 = models.FlightPoint(flight_point_hash = uuid.uuid4().hex, timestamp = base_timestamp, is_on_ground = point1_grounded, altitude = 0)
+            flight_point2 = models.FlightPoint(flight_point_hash = uuid.uuid4().hex, timestamp = base_timestamp+decimal.Decimal(str(time_difference)),
+                is_on_ground = point2_grounded, altitude = 0)
+            change_descriptor = flights.FlightPointChangeDescriptor(flight_point1, flight_point2)
+            try:
+                constitutes_new_flight = change_descriptor.constitutes_new_flight
+                requires_solvency = False
+            except error.FlightChangeInaccuracySolvencyRequired as fcisr:
+                constitutes_new_flight = False
+                requires_solvency = True
+            self.assertEqual(constitutes_new_flight, expected_new_flight)
+            self.assertEqual(requires_solvency, expected_solvency)
+            # Now, evaluate the same change in bulk, from float timestamps; as DailyFlightsView does.
+            bulk_new_flight, bulk_solvency = flights.evaluate_new_flight_criteria([point1_grounded], [point2_grounded],
+                [float(flight_point2.timestamp)-float(flight_point1.timestamp)], [0], [0])
+            self.assertEqual(bool(bulk_new_flight[0]), expected_new_flight)
+            self.assertEqual(bool(bulk_solvency[0]), expected_solvency)
+
+    def test_new_flight_criteria_agree_7c68b7_t1(self):
+        self._assert_new_flight_criteria_agree_for("aircraft_7c68b7_t1.json")
+
+    def test_new_flight_criteria_agree_7c4ee8_t1(self):
+        self._assert_new_flight_criteria_agree_for("aircraft_7c4ee8_t1.json")
+
+    def test_new_flight_criteria_agree_7c4ee8_t2(self):
+        self._assert_new_flight_criteria_agree_for("aircraft_7c4ee8_t2.json")
+
+    def test_new_flight_criteria_agree_7c4ee8_t3(self):
+        self._assert_new_flight_criteria_agree_for("aircraft_7c4ee8_t3.json")
+
+    def test_new_flight_criteria_agree_7c4ef2_t1(self):
+        self._assert_new_flight_criteria_agree_for("aircraft_7c4ef2_t1.json")
+
+    def test_new_flight_criteria_agree_7c6bcf_t1(self):
+        self._assert_new_flight_criteria_agree_for("aircraft_7c6bcf_t1.json")
+
+
 class TestFlightRevisionComprehensive(BaseCase):
     """
     Testing for comprehensive revisions of flight data; that is, using the flights module indirectly via the revise_flight_data_for function.
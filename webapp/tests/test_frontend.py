@@ -25,3 +25,50 @@ class TestBrowser(BaseBrowserCase):
         get_flights_for = self.client.get(url_for("frontend.aircraft_flights", aircraft_icao = "7c4ee8"), follow_redirects = True)
         # Ensure this was successful.
         self.assertEqual(get_flights_for.status_code, 200)
+
+    def test_flights_pagination(self):
+        """
+        Import all flights for two aircraft; 7c68b7 with 3 flights and 7c6bcf with 4 flights.
+        With a page size of 3, get each page of all flights, ensure the pagination carries the total number of flights and 3 pages, and the last page has 1 flight.
+        Get the flights for 7c6bcf, ensure the pagination carries a total of 4 flights and 2 pages.
+        """
+        aircraft_7c68b7, aircraft_7c68b7_flights = self._import_all_flights("aircraft_7c68b7_t1.json", 3)
+        aircraft_7c6bcf, aircraft_7c6bcf_flights = self._import_all_flights("aircraft_7c6bcf_t1.json", 4)
+        db.session.flush()
+        page_size_flights = config.PAGE_SIZE_FLIGHTS
+        config.PAGE_SIZE_FLIGHTS = 3
+        try:
+            # Get the last page of all flights.
+            get_flights = self.client.get(url_for("frontend.flights_overview", p = 3), follow_redirects = True)
+            self.assertEqual(get_flights.status_code, 200)
+            # Ensure the total is 7 flights, over 3 pages, and that this last page has just 1 flight.
+            pagination = self.get_context_variable("pagination")
+            self.assertEqual(pagination.total, 7)
+            self.assertEqual(pagination.pages, 3)
+            self.assertEqual(len(pagination.items), 1)
+            self.assertEqual(self.get_context_variable("num_flights"), 7)
+
+            # Get the first page of flights for 7c6bcf.
+            get_flights_for = self.client.get(url_for("frontend.aircraft_flights", aircraft_icao = "7c6bcf"), follow_redirects = True)
+            self.assertEqual(get_flights_for.status_code, 200)
+            # Ensure the total is 4 flights, over 2 pages, and that this first page is full.
+            pagination = self.get_context_variable("pagination")
+            self.assertEqual(pagination.total, 4)
+            self.assertEqual(pagination.pages, 2)
+            self.assertEqual(len(pagination.items), 3)
+        finally:
+            config.PAGE_SIZE_FLIGHTS = page_size_flights
+
+    def test_index_conditional_response(self):
+        """
+        Get the index page, ensure it was successful and that an ETag was returned.
+        Get the index page again, this time with an If-None-Match header matching that ETag; ensure a 304 is returned, with no body.
+        """
+        get_index = self.client.get(url_for("frontend.index"))
+        self.assertEqual(get_index.status_code, 200)
+        etag = get_index.headers.get("ETag", None)
+        self.assertIsNotNone(etag)
+        # Now, request the index again, but provide the ETag we were given.
+        get_index_conditional = self.client.get(url_for("frontend.index"), headers = { "If-None-Match": etag })
+        self.assertEqual(get_index_conditional.status_code, 304)
+        self.assertEqual(get_index_conditional.data, b"")
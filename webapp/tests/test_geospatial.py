@@ -103,6 +103,54 @@ class TestGeospatial(UsePhysicalGeospatialDatabase):
         # Also, expect doncaster east to have 6 neighbours in database.
         self.assertEqual(doncaster_east.num_neighbours, 6)
 
+    @unittest.skipUnless(config.POSTGIS_ENABLED, "Subdivided suburbs require PostGIS.")
+    def test_determine_suburb_neighbourships_postgis_not_subdivided(self):
+        """
+        Import all test suburbs from VIC.
+        Locate doncaster east, assert that it exists.
+        Create a new suburb outside of suburb importation, with the exact same geometry as doncaster east. Ensure it has not been subdivided.
+        Determine suburb neighbour relationships for this new suburb.
+        Ensure its neighbours are doncaster east, alongside each of doncaster east's neighbours.
+        Ensure the new suburb has now been subdivided.
+        """
+        # Import all test suburbs.
+        geospatial.read_suburbs_from(config.SUBURBS_DIR)
+        # Ensure we can find Doncaster East.
+        doncaster_east = models.Suburb.get_by_name("Doncaster East")
+        self.assertIsNotNone(doncaster_east)
+        # Create a new suburb that occupies the same space as doncaster east.
+        new_suburb = models.Suburb(
+            suburb_hash = uuid.uuid4().hex,
+            state_code = doncaster_east.state_code,
+            name = "Doncaster East Copy",
+            postcode = doncaster_east.postcode,
+            minx = doncaster_east.minx, miny = doncaster_east.miny, maxx = doncaster_east.maxx, maxy = doncaster_east.maxy,
+            crs = doncaster_east.crs
+        )
+        new_suburb.multi_polygon = doncaster_east.multi_polygon
+        db.session.add(new_suburb)
+        db.session.flush()
+        # Ensure the new suburb has no subdivisions.
+        num_subdivisions_q = db.session.query(func.count(models.SuburbSubdivision.subdivision_id))\
+            .filter(models.SuburbSubdivision.suburb_hash == new_suburb.suburb_hash)
+        self.assertEqual(num_subdivisions_q.scalar(), 0)
+        # Determine neighbours for this new suburb.
+        new_suburb_neighbours = geospatial.determine_neighbours_for(new_suburb)
+        db.session.flush()
+        # Expect each neighbour to be present in the following list of neighbours:
+        neighbours = [
+            "Doncaster East",
+            "Templestowe",
+            "Warrandyte",
+            "Donvale",
+            "Blackburn North",
+            "Box Hill North",
+            "Doncaster"
+        ]
+        self.assertEqual(sorted([ suburb.name for suburb in new_suburb_neighbours ]), sorted(neighbours))
+        # Ensure the new suburb now has subdivisions.
+        self.assertNotEqual(num_subdivisions_q.scalar(), 0)
+
     def test_determine_suburb_neighbourships_precise(self):
         """
         Import all test suburbs from VIC.
@@ -172,6 +220,40 @@ class TestGeospatial(UsePhysicalGeospatialDatabase):
         # Also, expect doncaster east to have 6 neighbours in database.
         self.assertEqual(doncaster_east.num_neighbours, 6)
 
+    def test_locate_all_neighbours_without_postgis(self):
+        """
+        Import all test suburbs from VIC.
+        For both inprecise and precise boundaries, create a container for all suburbs, without PostGIS.
+        Ensure the neighbour pairs located for all suburbs at once are exactly those located for each suburb in turn.
+        Upsert all neighbours twice, ensure the number of neighbour relationships is equal to the number of neighbour pairs each time.
+        """
+        # Import all test suburbs.
+        geospatial.read_suburbs_from(config.SUBURBS_DIR)
+        all_suburbs = db.session.query(models.Suburb)\
+            .filter(models.Suburb.state_code == "VIC")\
+            .all()
+        self.assertNotEqual(len(all_suburbs), 0)
+        for precise_suburb_boundaries in [False, True]:
+            suburb_container = geospatial.GeospatialSuburbContainer(all_suburbs,
+                precise_suburb_boundaries = precise_suburb_boundaries, force_without_postgis = True)
+            # Locate all neighbour pairs at once.
+            all_neighbour_pairs = suburb_container.locate_all_neighbours()
+            # Ensure no pair was located more than once.
+            self.assertEqual(len(all_neighbour_pairs), len(set(all_neighbour_pairs)))
+            # Now, locate the neighbours for each suburb in turn; expect the union of these to be identical.
+            neighbour_pairs = set()
+            for suburb in all_suburbs:
+                neighbour_pairs.update([ (suburb.suburb_hash, neighbour_suburb.suburb_hash) for neighbour_suburb in suburb_container.locate_neighbours_for(suburb) ])
+            self.assertEqual(set(all_neighbour_pairs), neighbour_pairs)
+        # Using the last container (precise), upsert all neighbours twice. Expect the number of relationships to be equal to the number of pairs after each.
+        for i in range(2):
+            suburb_container.upsert_all_neighbours()
+            db.session.flush()
+            num_suburb_neighbours = db.session.query(func.count())\
+                .select_from(models.suburb_neighbour)\
+                .scalar()
+            self.assertEqual(num_suburb_neighbours, len(neighbour_pairs))
+
     def test_flight_point_geospatial_locator_without_postgis(self):
         """
         Test our object redefinition of the flight point geospatial locator.
@@ -3,11 +3,13 @@ import base64
 import json
 import time
 import decimal
+import uuid
 
 from subprocess import Popen, PIPE
 from datetime import date, datetime, timedelta
 
 from sqlalchemy import asc, desc, func
+from shapely import geometry
 
 from tests.conftest import BaseCase
 
@@ -16,4 +18,42 @@ from app import db, config, models, error, interpolation
 
 class TestInterpolation(BaseCase):
     def test_prepare_flight_points(self):
-        pass
+        """
+        Create a list of flight points, beginning with a flight point without a position. Then follow this with positional flight points; some being consecutive
+        duplicates, and some being duplicates separated by flight points without a position.
+        Construct an interpolator with these flight points.
+        Ensure only those flight points whose position is identical to the closest previous position have been cleared.
+        """
+        position_a = geometry.Point(1000, 2000)
+        position_b = geometry.Point(1500, 2500)
+        position_c = geometry.Point(2000, 3000)
+        positions = [
+            None,           # 0; leading flight point without a position, nothing to compare to.
+            position_a,     # 1
+            position_a,     # 2; consecutive duplicate of 1, cleared.
+            position_b,     # 3
+            None,           # 4
+            None,           # 5
+            position_b,     # 6; duplicate of 3, separated by flight points without a position, cleared.
+            position_c,     # 7
+            position_c,     # 8; duplicate of 7, cleared.
+            position_c,     # 9; duplicate of 8, cleared.
+            position_a      # 10; identical to 1, but not to the previous position, so not cleared.
+        ]
+        flight_points = []
+        base_timestamp = time.time()
+        for idx, position in enumerate(positions):
+            new_flight_point = models.FlightPoint(
+                flight_point_hash = uuid.uuid4().hex,
+                timestamp = base_timestamp+(idx*5)
+            )
+            if position:
+                new_flight_point.set_crs(config.COORDINATE_REF_SYS)
+                new_flight_point.set_position(position)
+            flight_points.append(new_flight_point)
+        interpolation.FlightPointInterpolator(None, flight_points)
+        # Expect flight points 2, 6, 8 and 9 to have been cleared. Those without a position to begin with should still have no position.
+        self.assertEqual([ idx for idx, flight_point in enumerate(flight_points) if not flight_point.is_position_valid ], [0, 2, 4, 5, 6, 8, 9])
+        # All other flight points should retain their original positions.
+        for idx in [1, 3, 7, 10]:
+            self.assertTrue(flight_points[idx].position.equals(positions[idx]))